@@ -1,8 +1,24 @@
+from ._metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsCollector,
+    get_collector,
+    set_collector,
+)
+from ._tracing import (
+    NoopTracer,
+    Span,
+    Tracer,
+    get_filter_attributes,
+    get_tracer,
+    set_tracer,
+)
 from .filter import (
     BaseFilter,
+    CompactSequence,
     FilterConfigDict,
     FilterField,
     FilterType,
+    Range,
     SearchField,
     SearchType,
     get_suffixes_map,
@@ -0,0 +1,345 @@
+from bisect import bisect_left
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from .filter import BaseFilter
+from .sort import BaseSort
+
+SEQUENCE_LENGTH_BUCKETS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+"""Upper bounds of the buckets of the sequence lengths, e.g. of the `IN` lists"""
+
+SEARCH_TERM_LENGTH_BUCKETS: Tuple[float, ...] = (1, 2, 3, 4, 6, 8, 12, 16, 32, 64)
+"""Upper bounds of the buckets of the search term lengths in characters"""
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format"""
+
+
+class _Field(NamedTuple):
+    key: str
+    """Name of the field in its filter class"""
+
+    path: str
+    """Names from the root filter joined by `__`, e.g. `department__name__ilike`"""
+
+    kind: str
+    """`filter` or `search`"""
+
+    target: str
+    """Target of the field, the targets of the search field are joined by `,`"""
+
+    operator: str
+    """Value of the filter type or of the search type"""
+
+    is_sequence: bool
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}__{key}" if path else key
+
+
+def _value(obj: Any) -> str:  # noqa: ANN401
+    return str(getattr(obj, "value", obj))
+
+
+@lru_cache(maxsize=1024)
+def _get_fields(filter_: Type[BaseFilter], path: str) -> Tuple[_Field, ...]:
+    """Fields of the filter class nested at the path, the nested filters are not included"""
+
+    fields = [
+        _Field(key, _join(path, key), "filter", info.target, _value(info.type), bool(info.is_sequence))
+        for key, info in filter_.filter_fields.items()
+    ]
+    fields.extend(
+        _Field(key, _join(path, key), "search", ",".join(info.target), _value(info.type), bool(info.is_sequence))
+        for key, info in filter_.search_fields.items()
+    )
+    return tuple(fields)
+
+
+@lru_cache(maxsize=1024)
+def _get_declared(filter_: Type[BaseFilter], path: str = "") -> Tuple[Tuple[_Field, ...], Tuple[str, ...]]:
+    """Fields and nested paths of the filter class, the nested filters included"""
+
+    fields = list(_get_fields(filter_, path))
+    nested: List[str] = []
+    for key, nested_filter in filter_.nested_filters.items():
+        nested_path = _join(path, key)
+        nested_fields, nested_nested = _get_declared(nested_filter, nested_path)
+        fields.extend(nested_fields)
+        nested.append(nested_path)
+        nested.extend(nested_nested)
+    return tuple(fields), tuple(nested)
+
+
+class _Usage:
+    """Used fields, nested paths and observed lengths of a single filter"""
+
+    __slots__ = ("fields", "nested", "sequence_lengths", "search_term_lengths")
+
+    def __init__(self) -> None:
+        self.fields: List[_Field] = []
+        self.nested: List[str] = []
+        self.sequence_lengths: List[Tuple[str, int]] = []
+        self.search_term_lengths: List[Tuple[str, int]] = []
+
+    def collect(self, filter_: BaseFilter, path: str = "") -> "_Usage":
+        fields_set = filter_.model_fields_set
+        for field in _get_fields(type(filter_), path):
+            if field.key not in fields_set:
+                continue
+            value = getattr(filter_, field.key)
+            if value is None:
+                continue
+            self.fields.append(field)
+            if field.is_sequence:
+                self.sequence_lengths.append((field.path, len(value)))
+            if field.kind == "search":
+                for term in value if field.is_sequence else (value,):
+                    self.search_term_lengths.append((field.path, len(str(term))))
+
+        for key in filter_.nested_filters:
+            nested_filter = getattr(filter_, key)
+            if nested_filter is None:
+                continue
+            nested_path = _join(path, key)
+            self.nested.append(nested_path)
+            self.collect(nested_filter, nested_path)
+
+        return self
+
+
+class _Histogram:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * (size + 1)
+        """Observations per bucket, not cumulative, the last one is `+Inf`"""
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, bounds: Sequence[float], value: int) -> None:
+        self.buckets[bisect_left(bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+_Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class MetricsCollector:
+    """
+    In-process usage counters of the filters and sorts, exported in the Prometheus text format.
+    Shows which fields, operators and nested filters are used, to decide which indexes to build,
+    and which ones are maintained for nothing.
+
+    All the fields of the recorded filter classes are exported, the unused ones with zero.
+
+    **Example**
+
+    >>> collector = MetricsCollector()
+    >>> set_collector(collector)
+    >>> @app.get("/metrics")
+    ... def metrics() -> Response:
+    ...     return Response(collector.to_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+    Args:
+        namespace: Prefix of the metric names.
+        sequence_length_buckets: Upper bounds of the buckets of the sequence lengths.
+        search_term_length_buckets: Upper bounds of the buckets of the search term lengths.
+    """
+
+    def __init__(
+            self,
+            *,
+            namespace: str = "pydantic_filters",
+            sequence_length_buckets: Sequence[float] = SEQUENCE_LENGTH_BUCKETS,
+            search_term_length_buckets: Sequence[float] = SEARCH_TERM_LENGTH_BUCKETS,
+    ) -> None:
+        self.namespace = namespace
+        self.sequence_length_buckets = tuple(sorted(sequence_length_buckets))
+        self.search_term_length_buckets = tuple(sorted(search_term_length_buckets))
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all the counters"""
+
+        with self._lock:
+            self._filters: Dict[_Labels, int] = {}
+            self._fields: Dict[_Labels, int] = {}
+            self._nested: Dict[_Labels, int] = {}
+            self._sequence_lengths: Dict[_Labels, _Histogram] = {}
+            self._search_term_lengths: Dict[_Labels, _Histogram] = {}
+            self._sorts: Dict[_Labels, int] = {}
+
+    def _declare(self, filter_: Type[BaseFilter]) -> None:
+        """Zero counters of all the fields and nested paths of the filter class"""
+
+        name = filter_.__name__
+        self._filters[(name,)] = 0
+        fields, nested = _get_declared(filter_)
+        for field in fields:
+            self._fields.setdefault((name, field.path, field.kind, field.target, field.operator), 0)
+        for path in nested:
+            self._nested.setdefault((name, path), 0)
+
+    def record_filter(self, filter_: BaseFilter) -> None:
+        """Count the set fields and nested filters, and observe the sequence and search term lengths"""
+
+        usage = _Usage().collect(filter_)
+        name = filter_.__class__.__name__
+
+        with self._lock:
+            if (name,) not in self._filters:
+                self._declare(filter_.__class__)
+            self._filters[(name,)] += 1
+
+            for field in usage.fields:
+                labels = (name, field.path, field.kind, field.target, field.operator)
+                self._fields[labels] = self._fields.get(labels, 0) + 1
+            for path in usage.nested:
+                self._nested[(name, path)] = self._nested.get((name, path), 0) + 1
+
+            for path, length in usage.sequence_lengths:
+                histogram = self._sequence_lengths.get((name, path))
+                if histogram is None:
+                    histogram = self._sequence_lengths[(name, path)] = _Histogram(len(self.sequence_length_buckets))
+                histogram.observe(self.sequence_length_buckets, length)
+            for path, length in usage.search_term_lengths:
+                histogram = self._search_term_lengths.get((name, path))
+                if histogram is None:
+                    histogram = self._search_term_lengths[(name, path)] = _Histogram(
+                        len(self.search_term_length_buckets),
+                    )
+                histogram.observe(self.search_term_length_buckets, length)
+
+    def record_sort(self, sort: BaseSort) -> None:
+        """Count the sort key with the order, the sort without the key is skipped"""
+
+        if sort.sort_by is None:
+            return
+        labels = (sort.__class__.__name__, _value(sort.sort_by), _value(sort.sort_by_order))
+        with self._lock:
+            self._sorts[labels] = self._sorts.get(labels, 0) + 1
+
+    def record(self, filter_: Optional[BaseFilter] = None, sort: Optional[BaseSort] = None) -> None:
+        """
+        Record the filter and the sort applied to a query.
+        Called by the dependencies of the FastAPI plugin, call it directly for the other sources.
+        """
+
+        if filter_ is not None:
+            self.record_filter(filter_)
+        if sort is not None:
+            self.record_sort(sort)
+
+    def _write_counter(
+            self,
+            lines: List[str],
+            name: str,
+            help_: str,
+            label_names: Sequence[str],
+            values: Dict[_Labels, int],
+    ) -> None:
+        name = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} counter")
+        for labels in sorted(values):
+            lines.append(f"{name}{{{_format_labels(label_names, labels)}}} {values[labels]}")
+
+    def _write_histogram(
+            self,
+            lines: List[str],
+            name: str,
+            help_: str,
+            bounds: Sequence[float],
+            values: Dict[_Labels, _Histogram],
+    ) -> None:
+        name = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels in sorted(values):
+            histogram = values[labels]
+            label_string = _format_labels(("filter", "path"), labels)
+            cumulative = 0
+            for bound, count in zip((*map(_format_bound, bounds), "+Inf"), histogram.buckets):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label_string},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{label_string}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{label_string}}} {histogram.count}")
+
+    def to_prometheus(self) -> str:
+        """Counters in the Prometheus text exposition format"""
+
+        lines: List[str] = []
+        with self._lock:
+            self._write_counter(
+                lines, "filters_total", "Recorded filters by the filter class.",
+                ("filter",), self._filters,
+            )
+            self._write_counter(
+                lines, "fields_total", "Set filter and search fields by the path from the root filter.",
+                ("filter", "path", "kind", "target", "operator"), self._fields,
+            )
+            self._write_counter(
+                lines, "nested_total", "Set nested filters by the path from the root filter.",
+                ("filter", "path"), self._nested,
+            )
+            self._write_histogram(
+                lines, "sequence_length", "Number of the values of the sequence fields.",
+                self.sequence_length_buckets, self._sequence_lengths,
+            )
+            self._write_histogram(
+                lines, "search_term_length", "Number of the characters of the search terms.",
+                self.search_term_length_buckets, self._search_term_lengths,
+            )
+            self._write_counter(
+                lines, "sorts_total", "Sort keys by the sort class and the order.",
+                ("sort", "by", "order"), self._sorts,
+            )
+        return "\n".join(lines) + "\n"
+
+
+_collector: Optional[MetricsCollector] = None
+"""Current collector, `None` if the metrics are disabled"""
+
+
+def set_collector(collector: Optional[MetricsCollector]) -> None:
+    """
+    Set the collector of the usage metrics, `None` disables them.
+
+    **Example**
+
+    >>> set_collector(MetricsCollector())
+    """
+
+    global _collector  # noqa: PLW0603
+    _collector = collector
+
+
+def get_collector() -> Optional[MetricsCollector]:
+    """Current collector, `None` if the metrics are disabled"""
+
+    return _collector
+
+
+def record_usage(filter_: Optional[BaseFilter] = None, sort: Optional[BaseSort] = None) -> None:
+    """Record the filter and the sort by the current collector, nothing is done if the metrics are disabled"""
+
+    collector = _collector
+    if collector is not None:
+        collector.record(filter_, sort)
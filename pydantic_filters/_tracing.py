@@ -0,0 +1,173 @@
+from typing import Any, Callable, ContextManager, Dict, Mapping, Optional, Tuple, Union
+
+from typing_extensions import Protocol
+
+from .filter import BaseFilter
+from .pagination import BasePagination
+from .sort import BaseSort
+
+AttributeValue = Union[str, bool, int, float]
+"""Value of the span attribute"""
+
+Attributes = Mapping[str, AttributeValue]
+
+
+class Span(Protocol):
+    """Span of the tracer, compatible with `opentelemetry.trace.Span`"""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        ...
+
+
+class Tracer(Protocol):
+    """
+    Tracer creating the spans, compatible with `opentelemetry.trace.Tracer`,
+    so the tracer of OpenTelemetry can be set as is.
+    """
+
+    def start_as_current_span(
+            self,
+            name: str,
+            *,
+            attributes: Optional[Attributes] = None,
+    ) -> ContextManager[Span]:
+        ...
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:  # noqa: ANN401
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class NoopTracer:
+    """Tracer doing nothing, the default one"""
+
+    def start_as_current_span(
+            self,
+            name: str,  # noqa: ARG002
+            *,
+            attributes: Optional[Attributes] = None,  # noqa: ARG002
+    ) -> ContextManager[Span]:
+        return _NOOP_SPAN
+
+
+_NOOP_TRACER = NoopTracer()
+
+_tracer: Optional[Tracer] = None
+"""Current tracer, `None` if the tracing is disabled"""
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """
+    Set the tracer of the stages of the filtering, `None` or `NoopTracer()` disables the tracing.
+
+    **Example**
+
+    >>> from opentelemetry import trace
+    >>> set_tracer(trace.get_tracer("pydantic_filters"))
+    """
+
+    global _tracer  # noqa: PLW0603
+    _tracer = None if tracer is None or isinstance(tracer, NoopTracer) else tracer
+
+
+def get_tracer() -> Tracer:
+    """Current tracer, `NoopTracer` if the tracing is disabled"""
+
+    return _NOOP_TRACER if _tracer is None else _tracer
+
+
+def start_span(
+        name: str,
+        attributes: Optional[Callable[[], Attributes]] = None,
+) -> ContextManager[Span]:
+    """Span of the current tracer, the attributes are computed only if the tracing is enabled"""
+
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.start_as_current_span(name, attributes=None if attributes is None else attributes())
+
+
+def _walk(filter_: BaseFilter) -> Tuple[int, int, int]:
+    """Number of the set fields, the largest set sequence and the number of the set nested filters"""
+
+    active, largest, joins = 0, 0, 0
+    fields_set = filter_.model_fields_set
+
+    for fields in (filter_.filter_fields, filter_.search_fields):
+        for key, field_info in fields.items():
+            if key not in fields_set:
+                continue
+            active += 1
+            value = getattr(filter_, key)
+            if field_info.is_sequence and value is not None:
+                largest = max(largest, len(value))
+
+    for key in filter_.nested_filters:
+        nested_filter = getattr(filter_, key)
+        if not nested_filter:
+            continue
+        nested_active, nested_largest, nested_joins = _walk(nested_filter)
+        active += nested_active
+        largest = max(largest, nested_largest)
+        joins += nested_joins + 1
+
+    return active, largest, joins
+
+
+def get_filter_attributes(filter_: BaseFilter) -> Dict[str, AttributeValue]:
+    """
+    Span attributes of the filter, the nested filters included:
+
+    - `pydantic_filters.filter` - name of the filter class
+    - `pydantic_filters.filter.active_fields` - number of the set fields
+    - `pydantic_filters.filter.max_sequence_length` - size of the largest sequence, e.g. the `IN` list
+    - `pydantic_filters.filter.joins` - number of the set nested filters, the joins of the SQL drivers
+    """
+
+    active, largest, joins = _walk(filter_)
+    return {
+        "pydantic_filters.filter": filter_.__class__.__name__,
+        "pydantic_filters.filter.active_fields": active,
+        "pydantic_filters.filter.max_sequence_length": largest,
+        "pydantic_filters.filter.joins": joins,
+    }
+
+
+def set_filter_attributes(span: Span, filter_: Optional[BaseFilter]) -> None:
+    """Set the attributes of the filter, nothing is computed if the tracing is disabled"""
+
+    if span is _NOOP_SPAN or filter_ is None:
+        return
+    for key, value in get_filter_attributes(filter_).items():
+        span.set_attribute(key, value)
+
+
+def get_sort_attributes(sort: BaseSort) -> Dict[str, AttributeValue]:
+    attributes: Dict[str, AttributeValue] = {
+        "pydantic_filters.sort": sort.__class__.__name__,
+        "pydantic_filters.sort.order": str(getattr(sort.sort_by_order, "value", sort.sort_by_order)),
+    }
+    if sort.sort_by is not None:
+        attributes["pydantic_filters.sort.by"] = str(getattr(sort.sort_by, "value", sort.sort_by))
+    return attributes
+
+
+def get_pagination_attributes(pagination: BasePagination) -> Dict[str, AttributeValue]:
+    return {
+        "pydantic_filters.pagination": pagination.__class__.__name__,
+        "pydantic_filters.pagination.limit": pagination.get_limit(),
+        "pydantic_filters.pagination.offset": pagination.get_offset(),
+    }
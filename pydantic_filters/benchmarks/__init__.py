@@ -0,0 +1,4 @@
+"""
+Performance benchmarks: run the suite with `python -m pydantic_filters.benchmarks`,
+or a module with `python -m pydantic_filters.benchmarks.<name>`.
+"""
@@ -0,0 +1,5 @@
+import sys
+
+from pydantic_filters.benchmarks.suite import main
+
+sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Latency of the FastAPI routes with the filter, sort and pagination dependencies under concurrency.
+The in-process app is driven by the httpx ASGI transport, the statements are executed on a seeded SQLite database.
+
+    python -m pydantic_filters.benchmarks.asgi --size 100000 --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from fastapi import FastAPI
+from typing_extensions import Literal
+
+from pydantic_filters import BaseFilter, BaseSort, OffsetPagination, SearchField
+from pydantic_filters.drivers.sqlalchemy import append_to_statement, get_count_statement
+from pydantic_filters.plugins.fastapi import FilterDepends, PaginationDepends, SortDepends
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class Company(Base):
+    __tablename__ = "companies"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+
+
+class Department(Base):
+    __tablename__ = "departments"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+    company_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(Company.id), index=True)
+
+    company: so.Mapped[Company] = so.relationship()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    login: so.Mapped[str] = so.mapped_column(index=True)
+    email: so.Mapped[str]
+    full_name: so.Mapped[str]
+    age: so.Mapped[int] = so.mapped_column(index=True)
+    score: so.Mapped[Optional[float]]
+    department_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(Department.id), index=True)
+
+    department: so.Mapped[Department] = so.relationship()
+
+
+class CompanyFilter(BaseFilter):
+    id: List[int]
+    name__ilike: str
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+    name__ilike: str
+    company: CompanyFilter
+
+
+class UserFilter(BaseFilter):
+    id: List[int]
+    id__n: List[int]
+    login: List[str]
+    login__ilike: str
+    email__like: str
+    full_name__ilike: str
+    age: List[int]
+    age__gt: int
+    age__ge: int
+    age__lt: int
+    age__le: int
+    score__null: bool
+    score__ge: float
+    q: str = SearchField(target=["login", "email", "full_name"])
+    department: DepartmentFilter
+
+
+class UserSort(BaseSort):
+    sort_by: Optional[Literal["id", "login", "age"]] = None
+
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "baseline": {"limit": 20},
+    "wide": {
+        "id__n": [1, 2, 3],
+        "login__ilike": "user%",
+        "email__like": "%@example.com",
+        "full_name__ilike": "%user%",
+        "age": list(range(20, 60, 2)),
+        "age__gt": 18,
+        "age__ge": 20,
+        "age__lt": 70,
+        "age__le": 65,
+        "score__null": False,
+        "score__ge": 0.1,
+        "sort_by": "age",
+        "sort_by_order": "desc",
+        "limit": 20,
+    },
+    "deep_nesting": {
+        "department__id": list(range(1, 100, 3)),
+        "department__name__ilike": "%1%",
+        "department__company__id": list(range(1, 10, 2)),
+        "department__company__name__ilike": "company-%",
+        "sort_by": "login",
+        "limit": 20,
+    },
+    "large_in": {"id": list(range(1, 2001, 2)), "limit": 20},
+    "search": {"q": "user-12", "sort_by": "id", "limit": 20},
+}
+"""Query parameters of the list route by the scenario name"""
+
+
+def seed(engine: sa.Engine, size: int, *, departments: int = 100, companies: int = 10) -> None:
+    """Create the tables and insert `size` users, the data is the same for the same arguments"""
+
+    rnd = random.Random(0)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            sa.insert(Company.__table__),
+            [{"id": i, "name": f"company-{i}"} for i in range(1, companies + 1)],
+        )
+        connection.execute(
+            sa.insert(Department.__table__),
+            [
+                {"id": i, "name": f"department-{i}", "company_id": (i - 1) % companies + 1}
+                for i in range(1, departments + 1)
+            ],
+        )
+        connection.execute(
+            sa.insert(User.__table__),
+            [
+                {
+                    "id": i,
+                    "login": f"user-{i}",
+                    "email": f"user-{i}@example.com",
+                    "full_name": f"User {i}",
+                    "age": rnd.randint(18, 80),
+                    "score": None if i % 10 == 0 else rnd.random(),
+                    "department_id": rnd.randint(1, departments),
+                }
+                for i in range(1, size + 1)
+            ],
+        )
+
+
+def create_app(session_factory: so.sessionmaker) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users")
+    def list_users(
+            filter_: UserFilter = FilterDepends(UserFilter),
+            sort: UserSort = SortDepends(UserSort),
+            pagination: OffsetPagination = PaginationDepends(OffsetPagination),
+    ) -> Dict[str, Any]:
+        statement = append_to_statement(
+            sa.select(User.id, User.login, User.email, User.age),
+            User,
+            filter_=filter_,
+            sort=sort,
+            pagination=pagination,
+        )
+        with session_factory() as session:
+            items = [row._asdict() for row in session.execute(statement)]
+            total = session.scalar(get_count_statement(User, filter_))
+        return {"items": items, "total": total}
+
+    return app
+
+
+async def run_scenario(
+        client: httpx.AsyncClient,
+        params: Dict[str, Any],
+        *,
+        requests: int,
+        concurrency: int,
+) -> Dict[str, float]:
+    """
+    Send the requests, at most `concurrency` at once.
+
+    Returns:
+        Number of the requests, the throughput per second, and the latency percentiles in seconds.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get("/users", params=params)
+            latency = time.perf_counter() - start
+        response.raise_for_status()
+        return latency
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": requests,
+        "throughput": requests / elapsed,
+        "p50": percentiles[49],
+        "p95": percentiles[94],
+        "p99": percentiles[98],
+    }
+
+
+async def _run_scenarios(
+        app: FastAPI,
+        scenarios: Dict[str, Dict[str, Any]],
+        *,
+        requests: int,
+        concurrency: int,
+) -> Dict[str, Dict[str, float]]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        results = {}
+        for name, params in scenarios.items():
+            # The dependencies and the compiled statements are cached by the first requests
+            await run_scenario(client, params, requests=concurrency * 2, concurrency=concurrency)
+            results[name] = await run_scenario(client, params, requests=requests, concurrency=concurrency)
+        return results
+
+
+def run(
+        pattern: str = "*",
+        *,
+        size: int = 10_000,
+        requests: int = 500,
+        concurrency: int = 10,
+) -> Dict[str, Dict[str, float]]:
+    """Seed a temporary database and run the scenarios matching the glob pattern"""
+
+    scenarios = {k: v for k, v in SCENARIOS.items() if fnmatch.fnmatchcase(k, pattern)}
+    with tempfile.TemporaryDirectory() as directory:
+        engine = sa.create_engine(f"sqlite:///{Path(directory) / 'benchmark.db'}")
+        try:
+            seed(engine, size)
+            app = create_app(so.sessionmaker(engine))
+            return asyncio.run(_run_scenarios(app, scenarios, requests=requests, concurrency=concurrency))
+        finally:
+            engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--pattern", default="*", help="glob pattern of the scenario names")
+    parser.add_argument("--size", type=int, default=10_000, help="number of the users")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario, at least 2")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--output", type=Path, help="write the results to the JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, size=args.size, requests=args.requests, concurrency=args.concurrency)
+
+    print(f"{'scenario':12} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9}")  # noqa: T201
+    for name, result in results.items():
+        print(  # noqa: T201
+            f"{name:12} {result['throughput']:8.1f} "
+            + " ".join(f"{result[p] * 1e3:7.2f}ms" for p in ("p50", "p95", "p99")),
+        )
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Timing and query plans of the statements by the SQLAlchemy driver on a SQLite database of millions of rows.
+
+    python -m pydantic_filters.benchmarks.dataset --database dataset.db --output baseline.json
+    python -m pydantic_filters.benchmarks.dataset --database dataset.db --baseline baseline.json
+
+The database is seeded once and reused. The command fails if any query plan differs from the baseline,
+or any statement is slower than the baseline by more than the tolerance.
+"""
+
+import argparse
+import fnmatch
+import json
+import random
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from pydantic_filters import BaseFilter, BasePagination, BaseSort, OffsetPagination, SearchField, SortByOrder
+from pydantic_filters.benchmarks.suite import Regression, compare, environment
+from pydantic_filters.drivers.sqlalchemy import append_to_statement, get_count_statement
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class Department(Base):
+    __tablename__ = "departments"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+
+
+class Post(Base):
+    __tablename__ = "posts"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    user_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("users.id"), index=True)
+    title: so.Mapped[str]
+    views: so.Mapped[int] = so.mapped_column(index=True)
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    login: so.Mapped[str] = so.mapped_column(index=True)
+    email: so.Mapped[str]
+    full_name: so.Mapped[str]
+    age: so.Mapped[int] = so.mapped_column(index=True)
+    department_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(Department.id), index=True)
+
+    department: so.Mapped[Department] = so.relationship()
+    posts: so.Mapped[List[Post]] = so.relationship()
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+    name__ilike: str
+
+
+class PostFilter(BaseFilter):
+    title__ilike: str
+    views__ge: int
+
+
+class UserFilter(BaseFilter):
+    id: List[int]
+    login: List[str]
+    age__ge: int
+    age__lt: int
+    q: str = SearchField(target=["login", "email", "full_name"])
+    department: DepartmentFilter
+    posts: PostFilter
+
+
+class Case(NamedTuple):
+    filter_: UserFilter
+    sort: Optional[BaseSort] = None
+    pagination: Optional[BasePagination] = None
+
+
+def get_cases(size: int) -> Dict[str, Case]:
+    """Representative queries, the values are scaled by the number of the users"""
+
+    page = OffsetPagination(limit=20)
+    return {
+        "primary_key_in": Case(UserFilter(id=list(range(1, size + 1, max(size // 1000, 1)))), pagination=page),
+        "index_range": Case(
+            UserFilter(age__ge=30, age__lt=35),
+            BaseSort(sort_by="age"),
+            page,
+        ),
+        "login_in": Case(UserFilter(login=[f"user-{i}" for i in range(1, size + 1, max(size // 500, 1))])),
+        "search": Case(UserFilter(q="user-1234"), BaseSort(sort_by="id"), page),
+        "many_to_one": Case(
+            UserFilter(department=DepartmentFilter(id=[1, 2, 3])),
+            BaseSort(sort_by="id"),
+            page,
+        ),
+        "one_to_many": Case(
+            UserFilter(posts=PostFilter(views__ge=9990)),
+            BaseSort(sort_by="id"),
+            page,
+        ),
+        "deep_offset": Case(
+            UserFilter(age__ge=18),
+            BaseSort(sort_by="id", sort_by_order=SortByOrder.desc),
+            OffsetPagination(limit=20, offset=size // 2),
+        ),
+    }
+
+
+def seed(engine: sa.Engine, size: int, *, batch_size: int = 100_000) -> None:
+    """
+    Create the tables and insert `size` users and posts, the data is the same for the same arguments.
+    The database is not analyzed, so the query plans do not depend on the size.
+    """
+
+    rnd = random.Random(0)
+    departments = max(size // 1000, 3)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            sa.insert(Department.__table__),
+            [{"id": i, "name": f"department-{i}"} for i in range(1, departments + 1)],
+        )
+        for start in range(1, size + 1, batch_size):
+            stop = min(start + batch_size, size + 1)
+            connection.execute(
+                sa.insert(User.__table__),
+                [
+                    {
+                        "id": i,
+                        "login": f"user-{i}",
+                        "email": f"user-{i}@example.com",
+                        "full_name": f"User {i}",
+                        "age": rnd.randint(18, 80),
+                        "department_id": rnd.randint(1, departments),
+                    }
+                    for i in range(start, stop)
+                ],
+            )
+            connection.execute(
+                sa.insert(Post.__table__),
+                [
+                    {"id": i, "user_id": rnd.randint(1, size), "title": f"Post {i}", "views": rnd.randint(0, 10_000)}
+                    for i in range(start, stop)
+                ],
+            )
+
+
+def get_statements(case: Case) -> Dict[str, sa.Select]:
+    return {
+        "select": append_to_statement(
+            sa.select(User.id, User.login, User.age),
+            User,
+            filter_=case.filter_,
+            sort=case.sort,
+            pagination=case.pagination,
+        ),
+        "count": get_count_statement(User, case.filter_),
+    }
+
+
+def explain(connection: sa.Connection, statement: sa.Select) -> List[str]:
+    """Query plan of the statement, one line per step, nested steps are indented"""
+
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+
+    depths: Dict[int, int] = {}
+    plan = []
+    for id_, parent, _, detail in rows:
+        depths[id_] = depths.get(parent, -1) + 1
+        # SQLite<3.36 names the tables with the `TABLE` keyword
+        detail = re.sub(r"^(SCAN|SEARCH) TABLE ", r"\1 ", detail)
+        plan.append("  " * depths[id_] + detail)
+    return plan
+
+
+def measure(connection: sa.Connection, statement: sa.Select, *, repeat: int = 3) -> float:
+    """Best time to execute the statement and fetch the rows"""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        connection.execute(statement).all()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+        engine: sa.Engine,
+        size: int,
+        pattern: str = "*",
+        *,
+        repeat: int = 3,
+) -> Dict[str, Any]:
+    """
+    Run the cases matching the glob pattern on the seeded database.
+
+    Returns:
+        JSON serializable results: the environment, the seconds and the query plans
+        by the case name and the kind of the statement, e.g. `search.count`.
+    """
+
+    results: Dict[str, float] = {}
+    plans: Dict[str, List[str]] = {}
+    with engine.connect() as connection:
+        for name, case in get_cases(size).items():
+            if not fnmatch.fnmatchcase(name, pattern):
+                continue
+            for kind, statement in get_statements(case).items():
+                plans[f"{name}.{kind}"] = explain(connection, statement)
+                results[f"{name}.{kind}"] = measure(connection, statement, repeat=repeat)
+
+    return {
+        "environment": {**environment(), "sqlite": sqlite3.sqlite_version},
+        "size": size,
+        "results": results,
+        "plans": plans,
+    }
+
+
+def compare_plans(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Names of the statements with the query plan other than in the baseline"""
+
+    current, base = results["plans"], baseline["plans"]
+    return [name for name in current if name in base and current[name] != base[name]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--pattern", default="*", help="glob pattern of the case names")
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of the users and of the posts")
+    parser.add_argument("--database", type=Path, default=Path("dataset.db"), help="seeded if it does not exist")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="write the results to the JSON file")
+    parser.add_argument("--baseline", type=Path, help="compare against the results in the JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 is 25%%")
+    args = parser.parse_args(argv)
+
+    engine = sa.create_engine(f"sqlite:///{args.database}")
+    try:
+        if not args.database.exists() or args.database.stat().st_size == 0:
+            seed(engine, args.size)
+        results = run(engine, args.size, args.pattern, repeat=args.repeat)
+    finally:
+        engine.dispose()
+
+    for name, seconds in results["results"].items():
+        print(f"{name:30} {seconds * 1e3:10.2f}ms")  # noqa: T201
+        for line in results["plans"][name]:
+            print(f"    {line}")  # noqa: T201
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions: List[Regression] = []
+    if baseline.get("size") == results["size"]:
+        regressions = compare(results, baseline, tolerance=args.tolerance)
+    else:
+        print(f"Timing is not compared, the baseline size is {baseline.get('size')}")  # noqa: T201
+    changed_plans = compare_plans(results, baseline)
+
+    for regression in regressions:
+        print(f"Regression: {regression.name} is {regression.ratio:.2f}x slower")  # noqa: T201
+    for name in changed_plans:
+        print(f"Regression: {name} query plan changed")  # noqa: T201
+    return 1 if regressions or changed_plans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
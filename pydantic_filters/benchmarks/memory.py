@@ -0,0 +1,191 @@
+"""
+Compiled predicates of the in-memory driver against a naive interpreted evaluator.
+
+    python -m pydantic_filters.benchmarks.memory --size 1000000
+"""
+
+import argparse
+import operator
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic_filters import BaseFilter, FilterType, SearchField, SearchType
+from pydantic_filters.drivers.memory import filter_items
+from pydantic_filters.filter._range import get_range_bounds
+
+_comparisons: Dict[FilterType, Callable[[Any, Any], bool]] = {
+    FilterType.gt: operator.gt,
+    FilterType.ge: operator.ge,
+    FilterType.lt: operator.lt,
+    FilterType.le: operator.le,
+}
+
+
+def _like(value: Any, pattern: str, flags: int) -> bool:
+    regex = "".join(".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern)
+    return re.fullmatch(regex, str(value), flags | re.DOTALL) is not None
+
+
+def _naive_compare(type_: FilterType, value: Any, obj: Any) -> bool:  # noqa: C901
+    if type_ == FilterType.eq:
+        return value == obj
+    if type_ == FilterType.null:
+        return (value is None) is bool(obj)
+    if value is None:
+        return False
+    if type_ == FilterType.ne:
+        return value != obj
+    if type_ in _comparisons:
+        return _comparisons[type_](value, obj)
+    if type_ == FilterType.like:
+        return _like(value, obj, 0)
+    if type_ == FilterType.ilike:
+        return _like(value, obj, re.IGNORECASE)
+    if type_ == FilterType.overlap:
+        return bool(set(obj) & set(value))
+    if type_ == FilterType.contains:
+        return set(obj) <= set(value)
+    if type_ == FilterType.range:
+        start, end = get_range_bounds(obj)
+        return (start is None or start <= value) and (end is None or value <= end)
+    raise ValueError(f"Unknown filter type {type_!r}, expected one of: {', '.join(t.value for t in FilterType)}")
+
+
+def naive_match(filter_: BaseFilter, item: Any) -> bool:  # noqa: C901
+    """Walk the filter for every item, the way one would write it by hand"""
+
+    for key, info in filter_.filter_fields.items():
+        if key not in filter_.model_fields_set:
+            continue
+        obj = getattr(filter_, key)
+        value = getattr(item, info.target)
+        if info.type in (FilterType.overlap, FilterType.contains, FilterType.null):
+            if not _naive_compare(info.type, value, obj):
+                return False
+        elif info.type == FilterType.ne and info.is_sequence:
+            if value is None or value in obj:
+                return False
+        elif info.is_sequence:
+            if not any(_naive_compare(info.type, value, o) for o in obj):
+                return False
+        elif not _naive_compare(info.type, value, obj):
+            return False
+
+    for key, info in filter_.search_fields.items():
+        if key not in filter_.model_fields_set:
+            continue
+        terms = getattr(filter_, key) if info.is_sequence else [getattr(filter_, key)]
+        flags = re.IGNORECASE if info.type == SearchType.case_insensitive else 0
+        if not any(
+            getattr(item, t) is not None and _like(getattr(item, t), f"%{term}%", flags)
+            for t in info.target
+            for term in terms
+        ):
+            return False
+
+    for key in filter_.nested_filters:
+        nested = getattr(filter_, key)
+        if nested is None:
+            continue
+        value = getattr(item, key)
+        if value is None:
+            return False
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        if not any(naive_match(nested, v) for v in values):
+            return False
+
+    return True
+
+
+@dataclass
+class Department:
+    id: int
+    name: str
+
+
+@dataclass
+class User:
+    id: int
+    login: str
+    email: str
+    age: int
+    score: Optional[float]
+    department: Department
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+
+
+class UserFilter(BaseFilter):
+    id__n: List[int]
+    age__ge: int
+    age__lt: int
+    score__null: bool
+    q: str = SearchField(target=["login", "email"])
+    department: DepartmentFilter
+
+
+def make_users(size: int) -> List[User]:
+    departments = [Department(id=i, name=f"department-{i}") for i in range(100)]
+    return [
+        User(
+            id=i,
+            login=f"user-{i}",
+            email=f"user-{i}@example.com",
+            age=18 + i % 60,
+            score=None if i % 7 == 0 else i % 100 / 10,
+            department=departments[i % 100],
+        )
+        for i in range(size)
+    ]
+
+
+def _timeit(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(size: int, repeat: int) -> Dict[str, float]:
+    users = make_users(size)
+    filter_ = UserFilter(
+        id__n=[1, 2, 3],
+        age__ge=25,
+        age__lt=60,
+        score__null=False,
+        q="USER-1",
+        department=DepartmentFilter(id=list(range(0, 100, 3))),
+    )
+
+    compiled = filter_items(users, filter_)
+    naive = [u for u in users if naive_match(filter_, u)]
+    if compiled != naive:
+        raise AssertionError("Compiled predicate and naive evaluator disagree")
+
+    return {
+        "naive": _timeit(lambda: [u for u in users if naive_match(filter_, u)], repeat),
+        "compiled": _timeit(lambda: filter_items(users, filter_), repeat),
+        "matched": len(compiled),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    result = run(args.size, args.repeat)
+    print(f"objects:  {args.size}, matched: {result['matched']}")  # noqa: T201
+    print(f"naive:    {result['naive']:.3f}s")  # noqa: T201
+    print(f"compiled: {result['compiled']:.3f}s ({result['naive'] / result['compiled']:.1f}x)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
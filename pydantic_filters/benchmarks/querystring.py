@@ -0,0 +1,131 @@
+"""
+Query string decoder against the FastAPI dependencies, both served as ASGI applications.
+
+    python -m pydantic_filters.benchmarks.querystring --number 5000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+
+from pydantic_filters import BaseFilter, BaseSort, OffsetPagination, SearchField
+from pydantic_filters.plugins.fastapi import FilterDepends, PaginationDepends, SortDepends
+from pydantic_filters.plugins.querystring import decode_query_string
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+    name__ilike: str
+
+
+class UserFilter(BaseFilter):
+    id: List[int]
+    id__n: List[int]
+    login: List[str]
+    age__ge: int
+    age__lt: int
+    q: str = SearchField(target=["login", "email"])
+    department: DepartmentFilter
+
+
+QUERY = (
+    b"id=1&id=2&id=3&id__n=4&login=alice&login=bob&age__ge=25&age__lt=60&q=ali"
+    b"&department__id=1&department__id=2&department__name__ilike=%25sales%25"
+    b"&sort_by=age&sort_by_order=desc&limit=20&offset=40"
+)
+
+fastapi_app = FastAPI()
+
+
+@fastapi_app.get("/users")
+async def _users(
+        filter_: UserFilter = FilterDepends(UserFilter),  # noqa: ARG001
+        sort: BaseSort = SortDepends(BaseSort),  # noqa: ARG001
+        pagination: OffsetPagination = PaginationDepends(OffsetPagination),  # noqa: ARG001
+) -> None:
+    return None
+
+
+async def decoder_app(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:  # noqa: ARG001
+    decode_query_string(scope["query_string"], UserFilter, BaseSort, OffsetPagination)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"4")]})
+    await send({"type": "http.response.body", "body": b"null"})
+
+
+async def _serve(app: Callable, number: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/users",
+        "raw_path": b"/users",
+        "root_path": "",
+        "query_string": QUERY,
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 1),
+    }
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"Unexpected status {message['status']}")
+
+    start = time.perf_counter()
+    for _ in range(number):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / number
+
+
+def _best(app: Callable, number: int, repeat: int) -> float:
+    return min(asyncio.run(_serve(app, number)) for _ in range(repeat))
+
+
+def _timeit(func: Callable[[], Any], number: int, repeat: int) -> float:
+    """Best time of a single call"""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run(number: int, repeat: int) -> Dict[str, float]:
+    return {
+        "fastapi": _best(fastapi_app, number, repeat),
+        "decoder_app": _best(decoder_app, number, repeat),
+        "decode": _timeit(
+            lambda: decode_query_string(QUERY, UserFilter, BaseSort, OffsetPagination),
+            number,
+            repeat,
+        ),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    result = run(args.number, args.repeat)
+    print(f"fastapi dependencies: {result['fastapi'] * 1e6:.1f}us per request")  # noqa: T201
+    print(  # noqa: T201
+        f"decoder application:  {result['decoder_app'] * 1e6:.1f}us per request "
+        f"({result['fastapi'] / result['decoder_app']:.1f}x)",
+    )
+    print(f"decode only:          {result['decode'] * 1e6:.1f}us per query string")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+SQL text and parameters by the SQL driver against building and compiling the SQLAlchemy statement.
+
+    python -m pydantic_filters.benchmarks.sql --number 10000
+"""
+
+import argparse
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy.dialects import postgresql
+
+from pydantic_filters.benchmarks.sqlalchemy_core import FILTER, PAGINATION, SORT, _timeit, build_orm
+from pydantic_filters.drivers.sql import SqlJoin, SqlTable, compile_select
+
+DEPARTMENTS = SqlTable("departments", columns={"id", "name"}, primary_key="id")
+USERS = SqlTable(
+    "users",
+    columns={"id", "login", "email", "age", "department_id"},
+    primary_key="id",
+    joins={"department": SqlJoin(DEPARTMENTS, on=("department_id", "id"))},
+)
+
+_dialect = postgresql.asyncpg.dialect(paramstyle="numeric_dollar")
+
+
+def compile_sqlalchemy() -> Tuple[str, Any]:
+    compiled = build_orm().compile(dialect=_dialect)
+    return compiled.string, compiled.params
+
+
+def compile_sql() -> Tuple[str, List[Any]]:
+    return compile_select(USERS, filter_=FILTER, sort=SORT, pagination=PAGINATION)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    sqlalchemy_time = _timeit(compile_sqlalchemy, args.number, args.repeat)
+    sql_time = _timeit(compile_sql, args.number, args.repeat)
+    print(f"sqlalchemy: {sqlalchemy_time * 1e6:.1f}us per statement")  # noqa: T201
+    print(f"sql:        {sql_time * 1e6:.1f}us per statement ({sqlalchemy_time / sql_time:.1f}x)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Construction of the statements by the ORM and the Core functions of the SQLAlchemy driver.
+
+    python -m pydantic_filters.benchmarks.sqlalchemy_core --number 10000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from pydantic_filters import BaseFilter, BaseSort, OffsetPagination, SearchField, SortByOrder
+from pydantic_filters.drivers.sqlalchemy import TableJoin, append_to_statement, append_to_table_statement
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class Department(Base):
+    __tablename__ = "departments"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    login: so.Mapped[str]
+    email: so.Mapped[str]
+    age: so.Mapped[int]
+    department_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(Department.id))
+
+    department: so.Mapped[Department] = so.relationship()
+
+
+users = User.__table__
+departments = Department.__table__
+
+USER_JOINS = {
+    "department": TableJoin(departments),
+}
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+    name__ilike: str
+
+
+class UserFilter(BaseFilter):
+    id__n: List[int]
+    age__ge: int
+    age__lt: int
+    q: str = SearchField(target=["login", "email"])
+    department: DepartmentFilter
+
+
+FILTER = UserFilter(
+    id__n=[1, 2, 3],
+    age__ge=25,
+    age__lt=60,
+    q="alice",
+    department=DepartmentFilter(id=[1, 2], name__ilike="%sales%"),
+)
+SORT = BaseSort(sort_by="age", sort_by_order=SortByOrder.desc)
+PAGINATION = OffsetPagination(limit=20, offset=40)
+
+
+def build_orm() -> sa.Select:
+    return append_to_statement(
+        sa.select(User),
+        User,
+        filter_=FILTER,
+        sort=SORT,
+        pagination=PAGINATION,
+    )
+
+
+def build_core() -> sa.Select:
+    return append_to_table_statement(
+        sa.select(users),
+        users,
+        filter_=FILTER,
+        sort=SORT,
+        pagination=PAGINATION,
+        joins=USER_JOINS,
+    )
+
+
+def _timeit(func: Callable[[], Any], number: int, repeat: int) -> float:
+    """Best time of a single call"""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run(number: int, repeat: int) -> Dict[str, float]:
+    return {
+        "orm": _timeit(build_orm, number, repeat),
+        "core": _timeit(build_core, number, repeat),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    result = run(args.number, args.repeat)
+    print(f"orm:  {result['orm'] * 1e6:.1f}us per statement")  # noqa: T201
+    print(f"core: {result['core'] * 1e6:.1f}us per statement ({result['orm'] / result['core']:.1f}x)")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Micro-benchmarks of the hot paths, compared against a stored baseline.
+
+    python -m pydantic_filters.benchmarks --output results.json
+    python -m pydantic_filters.benchmarks --baseline results.json --tolerance 0.25
+
+The command fails if any case is slower than the baseline by more than the tolerance.
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+
+import pydantic
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+from pydantic_filters import BaseFilter, SearchField
+from pydantic_filters.benchmarks.sqlalchemy_core import FILTER, PAGINATION, SORT, User
+from pydantic_filters.drivers.sqlalchemy import append_to_statement, get_count_statement
+from pydantic_filters.drivers.sqlalchemy._mapping import filter_to_column_clauses, filter_to_join_targets
+from pydantic_filters.plugins._utils import inflate_filter, squash_filter
+
+Case = Callable[[], Callable[[], Any]]
+"""Prepares the data and returns the function to measure"""
+
+CASES: Dict[str, Case] = {}
+"""Benchmark cases by name"""
+
+WIDTH = 100
+"""Number of fields of the wide filter"""
+
+DEPTH = 5
+"""Number of the nested levels of the deep filter and of the inherited classes"""
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    def _register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+
+    return _register
+
+
+def _wide_annotations(prefix: str = "f", width: int = WIDTH) -> Dict[str, Any]:
+    return {f"{prefix}{i}": List[int] if i % 2 else int for i in range(width)}
+
+
+def create_wide_filter() -> Type[BaseFilter]:
+    return type("WideFilter", (BaseFilter,), {"__annotations__": _wide_annotations()})
+
+
+def create_deep_filter() -> Type[BaseFilter]:
+    filter_ = type("Level0Filter", (BaseFilter,), {"__annotations__": {"id": List[int], "name__ilike": str}})
+    for level in range(1, DEPTH + 1):
+        filter_ = type(
+            f"Level{level}Filter",
+            (BaseFilter,),
+            {
+                "__annotations__": {"id": List[int], "name__ilike": str, "q": str, "child": filter_},
+                "q": SearchField(target=["name", "email"]),
+            },
+        )
+    return filter_
+
+
+def create_inherited_filter() -> Type[BaseFilter]:
+    """Chain of subclasses, the last one has as many fields as the wide filter"""
+
+    filter_ = BaseFilter
+    for level in range(DEPTH):
+        annotations = _wide_annotations(f"l{level}_", WIDTH // DEPTH)
+        filter_ = type(f"Inherited{level}Filter", (filter_,), {"__annotations__": annotations})
+    return filter_
+
+
+WideFilter = create_wide_filter()
+DeepFilter = create_deep_filter()
+
+WIDE_DATA = {f"f{i}": [i, i + 1] if i % 2 else i for i in range(WIDTH)}
+
+
+def _deep_data(level: int = DEPTH) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"id": [level, level + 1], "name__ilike": f"%{level}%"}
+    if level:
+        data["q"] = "alice"
+        data["child"] = _deep_data(level - 1)
+    return data
+
+
+DEEP_DATA = _deep_data()
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat = {}
+    for key, value in data.items():
+        if key == "child":
+            flat.update(_flatten(value, f"{prefix}child__"))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+DEEP_FLAT = _flatten(DEEP_DATA)
+"""Query parameters of the deep data"""
+
+_sqlite = sqlite.dialect()
+_postgresql = postgresql.psycopg.dialect()
+
+
+@case("metaclass.wide")
+def _metaclass_wide() -> Callable[[], Any]:
+    return create_wide_filter
+
+
+@case("metaclass.deep")
+def _metaclass_deep() -> Callable[[], Any]:
+    return create_deep_filter
+
+
+@case("metaclass.inherited")
+def _metaclass_inherited() -> Callable[[], Any]:
+    return create_inherited_filter
+
+
+@case("validation.wide")
+def _validation_wide() -> Callable[[], Any]:
+    return lambda: WideFilter(**WIDE_DATA)
+
+
+@case("validation.deep")
+def _validation_deep() -> Callable[[], Any]:
+    return lambda: DeepFilter.model_validate(DEEP_DATA)
+
+
+@case("squash_filter.wide")
+def _squash_filter() -> Callable[[], Any]:
+    # Not cached, the cached call is a dictionary lookup
+    return lambda: squash_filter.__wrapped__(WideFilter, "", "__")
+
+
+@case("inflate_filter.deep")
+def _inflate_filter() -> Callable[[], Any]:
+    return lambda: inflate_filter(DeepFilter, "", "__", DEEP_FLAT)
+
+
+@case("sqlalchemy.filter_to_column_clauses")
+def _filter_to_column_clauses() -> Callable[[], Any]:
+    return lambda: filter_to_column_clauses(FILTER, User)
+
+
+@case("sqlalchemy.filter_to_join_targets")
+def _filter_to_join_targets() -> Callable[[], Any]:
+    return lambda: filter_to_join_targets(FILTER, User)
+
+
+def _select() -> sa.Select:
+    return append_to_statement(sa.select(User), User, filter_=FILTER, sort=SORT, pagination=PAGINATION)
+
+
+@case("sqlalchemy.compile.sqlite")
+def _compile_sqlite() -> Callable[[], Any]:
+    return lambda: _select().compile(dialect=_sqlite)
+
+
+@case("sqlalchemy.compile.postgresql")
+def _compile_postgresql() -> Callable[[], Any]:
+    return lambda: _select().compile(dialect=_postgresql)
+
+
+@case("sqlalchemy.get_count_statement")
+def _get_count_statement() -> Callable[[], Any]:
+    return lambda: get_count_statement(User, FILTER).compile(dialect=_sqlite)
+
+
+def measure(func: Callable[[], Any], *, min_time: float = 0.2, repeat: int = 5) -> float:
+    """Best time of a single call: the number of calls is chosen to run for `min_time`, repeated `repeat` times"""
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def environment() -> Dict[str, str]:
+    """Versions the results depend on, saved along with them"""
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "pydantic": pydantic.VERSION,
+        "sqlalchemy": sa.__version__,
+    }
+
+
+def run(
+        pattern: str = "*",
+        *,
+        min_time: float = 0.2,
+        repeat: int = 5,
+) -> Dict[str, Any]:
+    """
+    Run the cases matching the glob pattern.
+
+    Returns:
+        JSON serializable results: the environment and the seconds per call by the case name.
+    """
+
+    results = {}
+    for name, setup in CASES.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            results[name] = measure(setup(), min_time=min_time, repeat=repeat)
+
+    return {"environment": environment(), "results": results}
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def compare(
+        results: Dict[str, Any],
+        baseline: Dict[str, Any],
+        *,
+        tolerance: float = 0.25,
+) -> List[Regression]:
+    """
+    Cases slower than the baseline by more than the tolerance, 0.25 is 25%.
+    Cases missing from either side are skipped.
+    """
+
+    current, base = results["results"], baseline["results"]
+    return [
+        Regression(name, base[name], current[name])
+        for name in current
+        if name in base and current[name] > base[name] * (1 + tolerance)
+    ]
+
+
+def _format(seconds: float) -> str:
+    return f"{seconds * 1e6:10.1f}us"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--pattern", default="*", help="glob pattern of the case names")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to run every case")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write the results to the JSON file")
+    parser.add_argument("--baseline", type=Path, help="compare against the results in the JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 is 25%%")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, min_time=args.min_time, repeat=args.repeat)
+    baseline = None if args.baseline is None else json.loads(args.baseline.read_text())
+
+    for name, seconds in results["results"].items():
+        line = f"{name:40} {_format(seconds)}"
+        if baseline is not None and name in baseline["results"]:
+            line += f" {_format(baseline['results'][name])} {seconds / baseline['results'][name]:6.2f}x"
+        print(line)  # noqa: T201
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression.name} is {regression.ratio:.2f}x slower")  # noqa: T201
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1 @@
-from . import sqlalchemy
+from . import memory, mongo, sql, sqlalchemy
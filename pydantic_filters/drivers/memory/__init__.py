@@ -0,0 +1,15 @@
+from ._compiler import (
+    compile_predicate,
+    get_predicate_source,
+)
+from ._exceptions import (
+    AttributeNotFoundMemoryDriverError,
+    BaseMemoryDriverError,
+)
+from ._main import (
+    apply_to_items,
+    count_items,
+    filter_items,
+    paginate_items,
+    sort_items,
+)
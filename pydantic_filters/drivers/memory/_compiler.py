@@ -0,0 +1,193 @@
+import keyword
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Tuple, TypeVar
+
+from pydantic_filters import BaseFilter
+
+from ._operators import get_filter_operator, get_search_operator, in_ranges
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+
+Predicate = Callable[[Any], bool]
+
+JSON_PATH_SEPARATOR = "."
+"""Separator between the attribute name and the keys inside it in targets"""
+
+_Shape = Tuple[Tuple[Any, ...], ...]
+"""
+Hashable description of the filter instance: which fields are set and how they are compared.
+The values themselves are not a part of the shape, they are passed to the generated code as parameters.
+"""
+
+
+def _json_get(value: Any, keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _match_nested(value: Any, predicate: Predicate) -> bool:
+    """Relationship semantics: missing object does not match, collection matches by any item"""
+
+    if value is None:
+        return False
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(map(predicate, value))
+    return predicate(value)
+
+
+_namespace: Dict[str, Any] = {
+    "_in_ranges": in_ranges,
+    "_json_get": _json_get,
+    "_match_nested": _match_nested,
+}
+"""Functions available in the generated code"""
+
+
+def _plan(filter_: _Filter, params: List[Any]) -> _Shape:
+    """Get the shape of the filter, appending the parameters in the order of the shape"""
+
+    shape = []
+    fields_set = filter_.model_fields_set
+
+    for key, filter_field_info in filter_.filter_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_filter_operator(filter_field_info.type)
+        template, param = operator(filter_field_info.is_sequence, getattr(filter_, key))
+        params.append(param)
+        shape.append(("filter", tuple(filter_field_info.target.split(JSON_PATH_SEPARATOR)), template))
+
+    for key, search_field_info in filter_.search_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_search_operator(search_field_info.type)
+        template, param = operator(search_field_info.is_sequence, getattr(filter_, key))
+        params.append(param)
+        shape.append((
+            "search",
+            tuple(tuple(str(t).split(JSON_PATH_SEPARATOR)) for t in search_field_info.target),
+            template,
+        ))
+
+    for field_name in filter_.nested_filters:
+        nested_filter = getattr(filter_, field_name)
+        if not nested_filter:
+            continue
+
+        shape.append(("nested", field_name, _plan(nested_filter, params)))
+
+    return tuple(shape)
+
+
+class _CodeGenerator:
+
+    def __init__(self, *, mapping: bool) -> None:
+        self.mapping = mapping
+        self.functions: List[str] = []
+        self.params_count = 0
+
+    def param(self) -> str:
+        name = f"p{self.params_count}"
+        self.params_count += 1
+        return name
+
+    def access(self, path: Tuple[str, ...]) -> str:
+        name, keys = path[0], path[1:]
+
+        if self.mapping:
+            expression = f"item.get({name!r})"
+        elif name.isidentifier() and not keyword.iskeyword(name):
+            expression = f"item.{name}"
+        else:
+            expression = f"getattr(item, {name!r})"
+
+        if keys:
+            expression = f"_json_get({expression}, {keys!r})"
+        return expression
+
+    def function(self, shape: _Shape) -> str:
+        """Generate the predicate function and return its name"""
+
+        index = len(self.functions)
+        name = f"_predicate_{index}"
+        self.functions.append("")
+        body = []
+
+        for instruction in shape:
+            kind = instruction[0]
+
+            if kind == "filter":
+                _, path, template = instruction
+                param = self.param()
+                body.append(f"v = {self.access(path)}")
+                body.append(f"if not ({template.format(v='v', p=param)}):")
+                body.append("    return False")
+
+            elif kind == "search":
+                _, paths, template = instruction
+                param = self.param()
+                conditions = []
+                for i, path in enumerate(paths):
+                    body.append(f"v{i} = {self.access(path)}")
+                    conditions.append(f"({template.format(v=f'v{i}', p=param)})")
+                body.append(f"if not ({' or '.join(conditions)}):")
+                body.append("    return False")
+
+            elif kind == "nested":
+                _, field_name, nested_shape = instruction
+                nested_name = self.function(nested_shape)
+                body.append(f"if not _match_nested({self.access((field_name,))}, {nested_name}):")
+                body.append("    return False")
+
+        body.append("return True")
+
+        self.functions[index] = "\n".join(
+            [f"def {name}(item):", *(f"    {line}" for line in body)],
+        )
+        return name
+
+    def source(self, shape: _Shape) -> str:
+        entry = self.function(shape)
+        lines = ["def _factory(params):"]
+        if self.params_count:
+            lines.append(f"    {', '.join(f'p{i}' for i in range(self.params_count))}, = params")
+        for function in self.functions:
+            lines.extend(f"    {line}" for line in function.splitlines())
+        lines.append(f"    return {entry}")
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=1024)
+def _build_factory(shape: _Shape, mapping: bool) -> Callable[[List[Any]], Predicate]:
+    source = _CodeGenerator(mapping=mapping).source(shape)
+    namespace = dict(_namespace)
+    exec(compile(source, "<pydantic_filters.drivers.memory>", "exec"), namespace)  # noqa: S102
+    return namespace["_factory"]
+
+
+def get_predicate_source(filter_: _Filter, *, mapping: bool = False) -> str:
+    """Get the code generated for the filter, for debugging purposes."""
+
+    return _CodeGenerator(mapping=mapping).source(_plan(filter_, []))
+
+
+def compile_predicate(filter_: _Filter, *, mapping: bool = False) -> Predicate:
+    """
+    Compile the filter into a function checking a single item.
+
+    The code is generated once per filter shape (the set fields and their kinds of values),
+    filter values are bound to the cached code as parameters.
+
+    Args:
+        filter_: Filter object.
+        mapping: Items are mappings (dicts), not objects with attributes.
+    """
+
+    params: List[Any] = []
+    shape = _plan(filter_, params)
+    return _build_factory(shape, mapping)(params)
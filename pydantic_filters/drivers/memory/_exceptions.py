@@ -0,0 +1,7 @@
+
+class BaseMemoryDriverError(Exception):
+    """Base in-memory driver error"""
+
+
+class AttributeNotFoundMemoryDriverError(BaseMemoryDriverError):
+    pass
@@ -0,0 +1,195 @@
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    SortByOrder,
+)
+
+from ._compiler import compile_predicate
+from ._exceptions import AttributeNotFoundMemoryDriverError
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+_T = TypeVar("_T")
+
+
+def _is_mapping(items: Iterable[_T], mapping: Optional[bool]) -> Tuple[bool, Iterable[_T]]:
+    """Detect the kind of items by the first one, if not specified directly"""
+
+    if mapping is not None:
+        return mapping, items
+
+    if isinstance(items, Sequence):
+        return bool(items) and isinstance(items[0], Mapping), items
+
+    iterator = iter(items)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return False, ()
+    return isinstance(first, Mapping), chain((first,), iterator)
+
+
+def _itemgetter(key: str) -> Callable[[Mapping[str, Any]], Any]:
+    def _getter(item: Mapping[str, Any]) -> Any:
+        return item.get(key)
+    return _getter
+
+
+def filter_items(
+        items: Iterable[_T],
+        filter_: _Filter,
+        *,
+        mapping: Optional[bool] = None,
+) -> List[_T]:
+    """
+    Apply filtering to the items.
+
+    Args:
+        items: Objects or mappings.
+        filter_: Filter object.
+        mapping: Items are mappings (dicts). Detected by the first item if not specified.
+
+    Raises:
+        AttributeNotFoundMemoryDriverError: Attribute not found
+    """
+
+    mapping, items = _is_mapping(items, mapping)
+    predicate = compile_predicate(filter_, mapping=mapping)
+
+    try:
+        return list(filter(predicate, items))
+    except AttributeError as e:
+        raise AttributeNotFoundMemoryDriverError(
+            f"{filter_.__class__.__name__}: {e}",
+        ) from e
+
+
+def paginate_items(
+        items: Iterable[_T],
+        pagination: _Pagination,
+) -> List[_T]:
+    """
+    Apply pagination to the items.
+
+    Args:
+        items: Objects or mappings.
+        pagination: Pagination object.
+    """
+
+    offset = pagination.get_offset()
+    limit = pagination.get_limit()
+
+    if isinstance(items, Sequence):
+        return list(items[offset:offset + limit])
+    return list(islice(items, offset, offset + limit))
+
+
+def sort_items(
+        items: Iterable[_T],
+        sort: _Sort,
+        *,
+        mapping: Optional[bool] = None,
+) -> List[_T]:
+    """
+    Apply sorting to the items.
+    `None` values go last in ascending order and first in descending, as in PostgreSQL.
+
+    Args:
+        items: Objects or mappings.
+        sort: Sort object.
+        mapping: Items are mappings (dicts). Detected by the first item if not specified.
+
+    Raises:
+        AttributeNotFoundMemoryDriverError: Attribute not found
+    """
+
+    if sort.sort_by is None:
+        return list(items)
+
+    mapping, items = _is_mapping(items, mapping)
+    sort_by = str(getattr(sort.sort_by, "value", sort.sort_by))
+    getter: Callable[[Any], Any] = _itemgetter(sort_by) if mapping else attrgetter(sort_by)
+
+    def _key(item: Any) -> Tuple[bool, Any]:
+        value = getter(item)
+        return value is None, value
+
+    try:
+        return sorted(
+            items,
+            key=_key,
+            reverse=sort.sort_by_order == SortByOrder.desc,
+        )
+    except AttributeError as e:
+        raise AttributeNotFoundMemoryDriverError(
+            f"{sort.__class__.__name__}.sort_by: {e}",
+        ) from e
+
+
+def apply_to_items(
+        items: Iterable[_T],
+        *,
+        filter_: Optional[_Filter] = None,
+        sort: Optional[_Sort] = None,
+        pagination: Optional[_Pagination] = None,
+        mapping: Optional[bool] = None,
+) -> List[_T]:
+    """
+    All in one function.
+
+    Args:
+        items: Objects or mappings.
+        filter_: Filter object.
+        sort: Sort object.
+        pagination: Pagination object.
+        mapping: Items are mappings (dicts). Detected by the first item if not specified.
+
+    Raises:
+        AttributeNotFoundMemoryDriverError: Attribute not found
+    """
+
+    mapping, items = _is_mapping(items, mapping)
+
+    if filter_ is not None:
+        items = filter_items(items, filter_, mapping=mapping)
+    if sort is not None:
+        items = sort_items(items, sort, mapping=mapping)
+    if pagination is not None:
+        items = paginate_items(items, pagination)
+
+    return list(items)
+
+
+def count_items(
+        items: Iterable[_T],
+        filter_: _Filter,
+        *,
+        mapping: Optional[bool] = None,
+) -> int:
+    """
+    Get the number of items satisfying the filter.
+
+    Args:
+        items: Objects or mappings.
+        filter_: Filter object.
+        mapping: Items are mappings (dicts). Detected by the first item if not specified.
+
+    Raises:
+        AttributeNotFoundMemoryDriverError: Attribute not found
+    """
+
+    mapping, items = _is_mapping(items, mapping)
+    predicate = compile_predicate(filter_, mapping=mapping)
+
+    try:
+        return sum(1 for _ in filter(predicate, items))
+    except AttributeError as e:
+        raise AttributeNotFoundMemoryDriverError(
+            f"{filter_.__class__.__name__}: {e}",
+        ) from e
@@ -0,0 +1,173 @@
+import re
+from typing import Any, Callable, Dict, Iterable, Pattern, Sequence, Tuple
+
+from typing_extensions import TypeAlias
+
+from pydantic_filters import FilterType, SearchType
+from pydantic_filters.filter._range import RangeBounds, merge_ranges
+
+ExpressionOperator: TypeAlias = Callable[[bool, Any], Tuple[str, Any]]
+"""
+Takes `is_sequence` and the filter value, returns the expression template and its parameter.
+In the template `{v}` is the value of the item and `{p}` is the parameter.
+The template is a part of the generated code, so it must depend only on the shape of the value.
+"""
+
+_FALSE = "False"
+
+
+def _like_to_regex(pattern: str, *, flags: int = 0) -> Pattern[str]:
+    """SQL LIKE pattern to the regular expression: `%` - any string, `_` - any character"""
+
+    regex = "".join(
+        ".*" if c == "%" else "." if c == "_" else re.escape(c)
+        for c in pattern
+    )
+    return re.compile(regex, flags | re.DOTALL)
+
+
+def _like_alternation(patterns: Iterable[str], *, flags: int = 0) -> Pattern[str]:
+    """Several LIKE patterns joined by OR to the single regular expression"""
+
+    return re.compile(
+        "|".join(f"(?:{_like_to_regex(p).pattern})" for p in patterns),
+        flags | re.DOTALL,
+    )
+
+
+def _hashable_collection(obj: Iterable[Any]) -> Any:
+    try:
+        return frozenset(obj)
+    except TypeError:
+        return tuple(obj)
+
+
+def _op_eq(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+    if is_sequence:
+        return "{v} in {p}", _hashable_collection(obj)
+    if obj is None:
+        return "{v} is None", None
+    return "{v} == {p}", obj
+
+
+def _op_ne(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+    if is_sequence:
+        return "{v} is not None and {v} not in {p}", _hashable_collection(obj)
+    if obj is None:
+        return "{v} is not None", None
+    return "{v} is not None and {v} != {p}", obj
+
+
+def _op_comparison(operator: str, reduce_sequence: Callable[[Iterable[Any]], Any]) -> ExpressionOperator:
+    """`value > a OR value > b` is the same as `value > min(a, b)`"""
+
+    template = f"{{v}} is not None and {{v}} {operator} {{p}}"
+
+    def _op(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+        if not is_sequence:
+            return (_FALSE, None) if obj is None else (template, obj)
+        if not obj:
+            return _FALSE, None
+        return template, reduce_sequence(obj)
+
+    return _op
+
+
+def _op_like(flags: int) -> ExpressionOperator:
+    def _op(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+        if obj is None:
+            return _FALSE, None
+        if not is_sequence:
+            return "{v} is not None and {p}(str({v})) is not None", _like_to_regex(obj, flags=flags).fullmatch
+        if not obj:
+            return _FALSE, None
+        return "{v} is not None and {p}(str({v})) is not None", _like_alternation(obj, flags=flags).fullmatch
+
+    return _op
+
+
+def _op_null(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+    expression = any(obj) if is_sequence else bool(obj)
+    return ("{v} is None", None) if expression else ("{v} is not None", None)
+
+
+def _op_overlap(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+    return "{v} is not None and not {p}.isdisjoint({v})", frozenset(obj if is_sequence else [obj])
+
+
+def _op_contains(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+    return "{v} is not None and {p}.issubset({v})", frozenset(obj if is_sequence else [obj])
+
+
+def _op_range(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+    ranges = merge_ranges(obj if is_sequence else [obj])
+    if not ranges:
+        return _FALSE, None
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        if start is not None and end is not None:
+            return "{v} is not None and {p}[0] <= {v} <= {p}[1]", ranges[0]
+        if start is not None:
+            return "{v} is not None and {v} >= {p}", start
+        if end is not None:
+            return "{v} is not None and {v} <= {p}", end
+        return "{v} is not None", None
+    return "{v} is not None and _in_ranges({v}, {p})", ranges
+
+
+def in_ranges(value: Any, ranges: Sequence[RangeBounds]) -> bool:
+    return any(
+        (start is None or start <= value) and (end is None or value <= end)
+        for start, end in ranges
+    )
+
+
+def _search(flags: int) -> ExpressionOperator:
+    """`%term%` patterns, without wildcards the search is a plain substring check"""
+
+    ignore_case = bool(flags & re.IGNORECASE)
+
+    def _op(is_sequence: bool, obj: Any) -> Tuple[str, Any]:
+        terms = [str(o) for o in obj] if is_sequence else [str(obj)]
+        if not terms:
+            return _FALSE, None
+
+        if len(terms) == 1 and not any(c in terms[0] for c in "%_"):
+            if ignore_case:
+                return "{v} is not None and {p} in str({v}).lower()", terms[0].lower()
+            return "{v} is not None and {p} in str({v})", terms[0]
+
+        return "{v} is not None and {p}(str({v})) is not None", _like_alternation(
+            [f"%{t}%" for t in terms], flags=flags,
+        ).fullmatch
+
+    return _op
+
+
+_filter_type_to_operator_map: Dict[FilterType, ExpressionOperator] = {
+    FilterType.eq: _op_eq,
+    FilterType.ne: _op_ne,
+    FilterType.gt: _op_comparison(">", min),
+    FilterType.ge: _op_comparison(">=", min),
+    FilterType.lt: _op_comparison("<", max),
+    FilterType.le: _op_comparison("<=", max),
+    FilterType.like: _op_like(0),
+    FilterType.ilike: _op_like(re.IGNORECASE),
+    FilterType.null: _op_null,
+    FilterType.overlap: _op_overlap,
+    FilterType.contains: _op_contains,
+    FilterType.range: _op_range,
+}
+
+_search_type_to_operator_map: Dict[SearchType, ExpressionOperator] = {
+    SearchType.case_sensitive: _search(0),
+    SearchType.case_insensitive: _search(re.IGNORECASE),
+}
+
+
+def get_filter_operator(type_: FilterType) -> ExpressionOperator:
+    return _filter_type_to_operator_map[type_]
+
+
+def get_search_operator(type_: SearchType) -> ExpressionOperator:
+    return _search_type_to_operator_map[type_]
@@ -0,0 +1,12 @@
+from ._compiler import (
+    Query,
+    filter_to_query,
+    get_query_source,
+)
+from ._main import (
+    SortSpec,
+    count_documents,
+    find,
+    pagination_to_skip_limit,
+    sort_to_spec,
+)
@@ -0,0 +1,151 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+from pydantic_filters import BaseFilter
+
+from ._operators import KEY, PARAM, get_filter_operator, get_search_operator
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+
+Query = Dict[str, Any]
+"""Query document, the `filter` argument of `find` and `count_documents`"""
+
+FIELD_PATH_SEPARATOR = "."
+"""Separator of the embedded documents in the field paths, used for the nested filters"""
+
+_Shape = Tuple[Tuple[Any, ...], ...]
+"""
+Hashable description of the filter instance: which fields are set and how they are compared.
+The values themselves are not a part of the shape, they are passed to the generated code as parameters.
+"""
+
+
+def _plan(filter_: _Filter, params: List[Any]) -> _Shape:
+    """Get the shape of the filter, appending the parameters in the order of the shape"""
+
+    shape = []
+    fields_set = filter_.model_fields_set
+
+    for key, filter_field_info in filter_.filter_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_filter_operator(filter_field_info.type)
+        template, field_params = operator(filter_field_info.is_sequence, getattr(filter_, key))
+        params.extend(field_params)
+        shape.append(("filter", filter_field_info.target, template))
+
+    for key, search_field_info in filter_.search_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_search_operator(search_field_info.type)
+        template, field_params = operator(search_field_info.is_sequence, getattr(filter_, key))
+        # The parameters are shared by all the targets
+        params.extend(field_params)
+        shape.append(("search", tuple(str(t) for t in search_field_info.target), template))
+
+    for field_name in filter_.nested_filters:
+        nested_filter = getattr(filter_, field_name)
+        if not nested_filter:
+            continue
+
+        shape.append(("nested", field_name, _plan(nested_filter, params)))
+
+    return tuple(shape)
+
+
+class _CodeGenerator:
+
+    def __init__(self) -> None:
+        self.params_count = 0
+
+    def render(self, template: str, keys: Tuple[str, ...]) -> List[str]:
+        """Render the template for every key, the parameters are the same for all of them"""
+
+        chunks = template.split(PARAM)
+        params = [f"p{self.params_count + i}" for i in range(len(chunks) - 1)]
+        self.params_count += len(params)
+
+        text = chunks[0] + "".join(p + c for p, c in zip(params, chunks[1:]))
+        return [text.replace(KEY, repr(k)) for k in keys]
+
+    def conditions(self, shape: _Shape, prefix: str) -> List[str]:
+        conditions = []
+
+        for instruction in shape:
+            kind = instruction[0]
+
+            if kind == "filter":
+                _, target, template = instruction
+                conditions.extend(self.render(template, (prefix + target,)))
+
+            elif kind == "search":
+                _, targets, template = instruction
+                rendered = self.render(template, tuple(prefix + t for t in targets))
+                conditions.append(rendered[0] if len(rendered) == 1 else f"{{'$or': [{', '.join(rendered)}]}}")
+
+            elif kind == "nested":
+                _, field_name, nested_shape = instruction
+                path = prefix + field_name
+                # Embedded document must exist, as the inner join does
+                conditions.append(f"{{{path!r}: {{'$ne': None}}}}")
+                conditions.extend(self.conditions(nested_shape, path + FIELD_PATH_SEPARATOR))
+
+        return conditions
+
+    def source(self, shape: _Shape) -> str:
+        conditions = self.conditions(shape, "")
+        if not conditions:
+            document = "{}"
+        elif len(conditions) == 1:
+            document = conditions[0]
+        else:
+            document = f"{{'$and': [{', '.join(conditions)}]}}"
+
+        lines = ["def _factory(params):"]
+        if self.params_count:
+            lines.append(f"    {', '.join(f'p{i}' for i in range(self.params_count))}, = params")
+        lines.append(f"    return {document}")
+        return "\n".join(lines)
+
+
+@lru_cache(maxsize=1024)
+def _build_factory(shape: _Shape) -> Callable[[List[Any]], Query]:
+    source = _CodeGenerator().source(shape)
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<pydantic_filters.drivers.mongo>", "exec"), namespace)  # noqa: S102
+    return namespace["_factory"]
+
+
+def get_query_source(filter_: _Filter) -> str:
+    """Get the code generated for the filter, for debugging purposes."""
+
+    return _CodeGenerator().source(_plan(filter_, []))
+
+
+def filter_to_query(filter_: _Filter) -> Query:
+    """
+    Data from the filter to the query document.
+    Nested filters refer to the embedded documents by the dotted paths.
+
+    The code building the document is generated once per filter shape
+    (the set fields and their kinds of values), so the repeated calls only extract the values.
+    Every call returns a new document.
+
+    **Example**
+
+    >>> class MyFilter(BaseFilter):
+    ...     name: List[str]
+    ...     age__gt: int
+    ...
+    >>> filter_to_query(MyFilter(name=["Alice", "Bob"], age__gt=18))
+    {'$and': [{'name': {'$in': ['Alice', 'Bob']}}, {'age': {'$gt': 18}}]}
+
+    Args:
+        filter_: Filter object.
+    """
+
+    params: List[Any] = []
+    shape = _plan(filter_, params)
+    return _build_factory(shape)(params)
@@ -0,0 +1,108 @@
+from typing import Any, List, Mapping, Optional, Tuple, TypeVar
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    SortByOrder,
+)
+
+from ._compiler import filter_to_query
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+
+SortSpec = List[Tuple[str, int]]
+"""Sort specification, the `sort` argument of `find`"""
+
+ASCENDING = 1
+DESCENDING = -1
+
+
+def sort_to_spec(sort: _Sort) -> Optional[SortSpec]:
+    """
+    Sort object to the sort specification.
+
+    Null and missing values are the lowest in MongoDB,
+    so they go first in ascending order and last in descending, unlike PostgreSQL.
+
+    Args:
+        sort: Sort object.
+
+    Returns:
+        Sort specification or `None` if there is nothing to sort by.
+    """
+
+    if sort.sort_by is None:
+        return None
+
+    direction = DESCENDING if sort.sort_by_order == SortByOrder.desc else ASCENDING
+    return [(str(getattr(sort.sort_by, "value", sort.sort_by)), direction)]
+
+
+def pagination_to_skip_limit(pagination: _Pagination) -> Tuple[int, int]:
+    """
+    Pagination object to the `skip` and `limit` arguments.
+
+    Args:
+        pagination: Pagination object.
+    """
+
+    return pagination.get_offset(), pagination.get_limit()
+
+
+def find(
+        collection: Any,
+        *,
+        filter_: Optional[_Filter] = None,
+        sort: Optional[_Sort] = None,
+        pagination: Optional[_Pagination] = None,
+        projection: Optional[Mapping[str, Any]] = None,
+) -> Any:
+    """
+    All in one function.
+    Works with any collection having the `pymongo` interface: `pymongo`, `motor`, `mongomock`.
+
+    Args:
+        collection: Collection.
+        filter_: Filter object.
+        sort: Sort object.
+        pagination: Pagination object.
+        projection: Fields to return, all by default.
+
+    Returns:
+        Cursor of the collection.
+    """
+
+    kwargs: dict = {"filter": {} if filter_ is None else filter_to_query(filter_)}
+    if projection is not None:
+        kwargs["projection"] = projection
+
+    if sort is not None:
+        sort_spec = sort_to_spec(sort)
+        if sort_spec is not None:
+            kwargs["sort"] = sort_spec
+
+    if pagination is not None:
+        kwargs["skip"], kwargs["limit"] = pagination_to_skip_limit(pagination)
+
+    return collection.find(**kwargs)
+
+
+def count_documents(
+        collection: Any,
+        filter_: _Filter,
+) -> Any:
+    """
+    Get the number of documents satisfying the filter.
+
+    Args:
+        collection: Collection.
+        filter_: Filter object.
+
+    Returns:
+        Number of documents, awaitable for `motor`.
+    """
+
+    return collection.count_documents(filter_to_query(filter_))
@@ -0,0 +1,164 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from typing_extensions import TypeAlias
+
+from pydantic_filters import FilterType, SearchType
+from pydantic_filters.filter._range import merge_ranges
+
+KEY = "\x01"
+"""Field path marker in the templates"""
+
+PARAM = "\x00"
+"""Parameter marker in the templates"""
+
+DocumentOperator: TypeAlias = Callable[[bool, Any], Tuple[str, List[Any]]]
+"""
+Takes `is_sequence` and the filter value, returns the condition template and its parameters.
+The template is the Python source of the condition document, it is cached,
+so it must depend only on the shape of the value.
+"""
+
+_FALSE = f"{{{KEY}: {{'$in': []}}}}"
+_TRUE = "{}"
+
+
+def like_to_regex(pattern: str) -> str:
+    """SQL LIKE pattern to the anchored regular expression: `%` - any string, `_` - any character"""
+
+    return "^" + "".join(
+        ".*" if c == "%" else "." if c == "_" else re.escape(c)
+        for c in pattern
+    ) + "$"
+
+
+def _like_alternation(patterns: Iterable[str]) -> str:
+    regexes = [like_to_regex(p) for p in patterns]
+    return regexes[0] if len(regexes) == 1 else "|".join(f"(?:{r})" for r in regexes)
+
+
+def _op_eq(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+    if is_sequence:
+        return f"{{{KEY}: {{'$in': {PARAM}}}}}", [list(obj)]
+    return f"{{{KEY}: {PARAM}}}", [obj]
+
+
+def _op_ne(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+    """`$ne` and `$nin` match missing and null values, unlike SQL"""
+
+    if is_sequence:
+        return f"{{{KEY}: {{'$nin': {PARAM}}}}}", [[*obj, None]]
+    if obj is None:
+        return f"{{{KEY}: {{'$ne': None}}}}", []
+    return f"{{{KEY}: {{'$nin': [{PARAM}, None]}}}}", [obj]
+
+
+def _op_comparison(operator: str, reduce_sequence: Callable[[Iterable[Any]], Any]) -> DocumentOperator:
+    """`value > a OR value > b` is the same as `value > min(a, b)`"""
+
+    template = f"{{{KEY}: {{'{operator}': {PARAM}}}}}"
+
+    def _op(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+        if is_sequence:
+            if not obj:
+                return _FALSE, []
+            obj = reduce_sequence(obj)
+        if obj is None:
+            return _FALSE, []
+        return template, [obj]
+
+    return _op
+
+
+def _regex_template(options: str) -> str:
+    return f"{{{KEY}: {{'$regex': {PARAM}, '$options': {options!r}}}}}"
+
+
+def _op_like(options: str) -> DocumentOperator:
+    def _op(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+        if not is_sequence:
+            if obj is None:
+                return _FALSE, []
+            return _regex_template(options), [like_to_regex(obj)]
+        if not obj:
+            return _FALSE, []
+        return _regex_template(options), [_like_alternation(obj)]
+
+    return _op
+
+
+def _op_null(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+    expression = any(obj) if is_sequence else bool(obj)
+    return (f"{{{KEY}: None}}", []) if expression else (f"{{{KEY}: {{'$ne': None}}}}", [])
+
+
+def _op_overlap(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+    return f"{{{KEY}: {{'$in': {PARAM}}}}}", [list(obj) if is_sequence else [obj]]
+
+
+def _op_contains(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+    return f"{{{KEY}: {{'$all': {PARAM}}}}}", [list(obj) if is_sequence else [obj]]
+
+
+def _op_range(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+    templates = []
+    params = []
+    for start, end in merge_ranges(obj if is_sequence else [obj]):
+        if start is not None and end is not None:
+            templates.append(f"{{{KEY}: {{'$gte': {PARAM}, '$lte': {PARAM}}}}}")
+            params.extend((start, end))
+        elif start is not None:
+            templates.append(f"{{{KEY}: {{'$gte': {PARAM}}}}}")
+            params.append(start)
+        elif end is not None:
+            templates.append(f"{{{KEY}: {{'$lte': {PARAM}}}}}")
+            params.append(end)
+        else:
+            templates.append(f"{{{KEY}: {{'$ne': None}}}}")
+
+    if not templates:
+        return _FALSE, []
+    if len(templates) == 1:
+        return templates[0], params
+    return f"{{'$or': [{', '.join(templates)}]}}", params
+
+
+def _search(options: str) -> DocumentOperator:
+    """`%term%` patterns"""
+
+    def _op(is_sequence: bool, obj: Any) -> Tuple[str, List[Any]]:
+        terms = [str(o) for o in obj] if is_sequence else [str(obj)]
+        if not terms:
+            return _FALSE, []
+        return _regex_template(options), [_like_alternation(f"%{t}%" for t in terms)]
+
+    return _op
+
+
+_filter_type_to_operator_map: Dict[FilterType, DocumentOperator] = {
+    FilterType.eq: _op_eq,
+    FilterType.ne: _op_ne,
+    FilterType.gt: _op_comparison("$gt", min),
+    FilterType.ge: _op_comparison("$gte", min),
+    FilterType.lt: _op_comparison("$lt", max),
+    FilterType.le: _op_comparison("$lte", max),
+    FilterType.like: _op_like("s"),
+    FilterType.ilike: _op_like("is"),
+    FilterType.null: _op_null,
+    FilterType.overlap: _op_overlap,
+    FilterType.contains: _op_contains,
+    FilterType.range: _op_range,
+}
+
+_search_type_to_operator_map: Dict[SearchType, DocumentOperator] = {
+    SearchType.case_sensitive: _search("s"),
+    SearchType.case_insensitive: _search("is"),
+}
+
+
+def get_filter_operator(type_: FilterType) -> DocumentOperator:
+    return _filter_type_to_operator_map[type_]
+
+
+def get_search_operator(type_: SearchType) -> DocumentOperator:
+    return _search_type_to_operator_map[type_]
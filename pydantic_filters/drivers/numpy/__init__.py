@@ -0,0 +1,13 @@
+from ._exceptions import (
+    AttributeNotFoundNumpyDriverError,
+    BaseNumpyDriverError,
+)
+from ._main import (
+    Columns,
+    apply_to_columns,
+    count_columns,
+    filter_columns,
+    filter_to_mask,
+    paginate_columns,
+    sort_columns,
+)
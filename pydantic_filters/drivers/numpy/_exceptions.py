@@ -0,0 +1,6 @@
+class BaseNumpyDriverError(Exception):
+    """Base NumPy driver error"""
+
+
+class AttributeNotFoundNumpyDriverError(BaseNumpyDriverError):
+    pass
@@ -0,0 +1,244 @@
+from typing import Mapping, Optional, TypeVar, Union
+
+import numpy as np
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    SortByOrder,
+)
+
+from ._exceptions import AttributeNotFoundNumpyDriverError
+from ._operators import get_filter_operator, get_search_operator, null_mask
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+
+Columns = Union[np.ndarray, Mapping[str, np.ndarray]]
+"""Structured array or mapping of the column names to the arrays of the same length"""
+_Columns = TypeVar("_Columns", np.ndarray, Mapping[str, np.ndarray])
+
+NESTED_SEPARATOR = "."
+"""Columns of the nested filters are looked up as `<field name>.<target>`"""
+
+
+def _get_column(columns: Columns, name: str, owner: str) -> np.ndarray:
+    try:
+        return np.asarray(columns[name])
+    except (KeyError, ValueError, IndexError) as e:
+        raise AttributeNotFoundNumpyDriverError(
+            f"{owner}: Column {name!r} not found",
+        ) from e
+
+
+def _length(columns: Columns) -> int:
+    if isinstance(columns, np.ndarray):
+        return len(columns)
+    return len(next(iter(columns.values()), ()))
+
+
+def _take(columns: _Columns, index: Union[np.ndarray, slice]) -> _Columns:
+    if isinstance(columns, np.ndarray):
+        return columns[index]
+    return {name: np.asarray(column)[index] for name, column in columns.items()}
+
+
+def filter_to_mask(
+        columns: Columns,
+        filter_: _Filter,
+        *,
+        prefix: str = "",
+) -> np.ndarray:
+    """
+    Evaluate the filter over the whole columns at once.
+
+    Args:
+        columns: Structured array or mapping of the column arrays.
+        filter_: Filter object.
+        prefix: Prefix of the column names, used for the nested filters.
+
+    Returns:
+        Boolean array, `True` for the matching rows.
+
+    Raises:
+        AttributeNotFoundNumpyDriverError: Column not found
+    """
+
+    owner = filter_.__class__.__name__
+    mask = np.ones(_length(columns), dtype=bool)
+    fields_set = filter_.model_fields_set
+
+    for key, filter_field_info in filter_.filter_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_filter_operator(filter_field_info.type)
+        column = _get_column(columns, prefix + filter_field_info.target, f"{owner}.{key}")
+        mask &= operator(column, filter_field_info.is_sequence, getattr(filter_, key))
+
+    for key, search_field_info in filter_.search_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_search_operator(search_field_info.type)
+        value = getattr(filter_, key)
+        mask &= np.logical_or.reduce([
+            operator(_get_column(columns, prefix + str(t), f"{owner}.{key}"), search_field_info.is_sequence, value)
+            for t in search_field_info.target
+        ])
+
+    for field_name in filter_.nested_filters:
+        nested_filter = getattr(filter_, field_name)
+        if not nested_filter:
+            continue
+
+        mask &= filter_to_mask(
+            columns,
+            nested_filter,
+            prefix=f"{prefix}{field_name}{NESTED_SEPARATOR}",
+        )
+
+    return mask
+
+
+def filter_columns(
+        columns: _Columns,
+        filter_: _Filter,
+) -> _Columns:
+    """
+    Apply filtering to the columns.
+
+    Args:
+        columns: Structured array or mapping of the column arrays.
+        filter_: Filter object.
+
+    Returns:
+        Columns of the same kind with the matching rows only.
+
+    Raises:
+        AttributeNotFoundNumpyDriverError: Column not found
+    """
+
+    return _take(columns, filter_to_mask(columns, filter_))
+
+
+def paginate_columns(
+        columns: _Columns,
+        pagination: _Pagination,
+) -> _Columns:
+    """
+    Apply pagination to the columns. Slicing does not copy the data.
+
+    Args:
+        columns: Structured array or mapping of the column arrays.
+        pagination: Pagination object.
+    """
+
+    offset = pagination.get_offset()
+    return _take(columns, slice(offset, offset + pagination.get_limit()))
+
+
+def _argsort(column: np.ndarray, *, descending: bool) -> np.ndarray:
+    """
+    Stable sorting indices.
+    Null values go last in ascending order and first in descending, as in PostgreSQL.
+    """
+
+    if descending:
+        # Reverse the order of the groups of equal values, keeping the order inside them
+        return len(column) - 1 - _argsort(column[::-1], descending=False)[::-1]
+
+    nulls = null_mask(column)
+    if not nulls.any():
+        return np.argsort(column, kind="stable")
+
+    (values_index,) = np.nonzero(~nulls)
+    (nulls_index,) = np.nonzero(nulls)
+    return np.concatenate((
+        values_index[np.argsort(column[values_index], kind="stable")],
+        nulls_index,
+    ))
+
+
+def _sort_index(columns: Columns, sort: _Sort, index: np.ndarray) -> np.ndarray:
+    """Reorder the row indices by the sort column"""
+
+    sort_by = str(getattr(sort.sort_by, "value", sort.sort_by))
+    column = _get_column(columns, sort_by, f"{sort.__class__.__name__}.sort_by")[index]
+    return index[_argsort(column, descending=sort.sort_by_order == SortByOrder.desc)]
+
+
+def sort_columns(
+        columns: _Columns,
+        sort: _Sort,
+) -> _Columns:
+    """
+    Apply sorting to the columns.
+    Null values (`None`, `NaN`, `NaT`) go last in ascending order and first in descending, as in PostgreSQL.
+
+    Args:
+        columns: Structured array or mapping of the column arrays.
+        sort: Sort object.
+
+    Raises:
+        AttributeNotFoundNumpyDriverError: Column not found
+    """
+
+    if sort.sort_by is None:
+        return columns
+
+    return _take(columns, _sort_index(columns, sort, np.arange(_length(columns))))
+
+
+def apply_to_columns(
+        columns: _Columns,
+        *,
+        filter_: Optional[_Filter] = None,
+        sort: Optional[_Sort] = None,
+        pagination: Optional[_Pagination] = None,
+) -> _Columns:
+    """
+    All in one function.
+    Rows are selected only once: the mask, the sorting indices and the page are combined first.
+
+    Args:
+        columns: Structured array or mapping of the column arrays.
+        filter_: Filter object.
+        sort: Sort object.
+        pagination: Pagination object.
+
+    Raises:
+        AttributeNotFoundNumpyDriverError: Column not found
+    """
+
+    index = np.arange(_length(columns))
+
+    if filter_ is not None:
+        index = index[filter_to_mask(columns, filter_)]
+    if sort is not None and sort.sort_by is not None:
+        index = _sort_index(columns, sort, index)
+    if pagination is not None:
+        offset = pagination.get_offset()
+        index = index[offset:offset + pagination.get_limit()]
+
+    return _take(columns, index)
+
+
+def count_columns(
+        columns: Columns,
+        filter_: _Filter,
+) -> int:
+    """
+    Get the number of rows satisfying the filter.
+
+    Args:
+        columns: Structured array or mapping of the column arrays.
+        filter_: Filter object.
+
+    Raises:
+        AttributeNotFoundNumpyDriverError: Column not found
+    """
+
+    return int(np.count_nonzero(filter_to_mask(columns, filter_)))
@@ -0,0 +1,201 @@
+import re
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from typing_extensions import TypeAlias
+
+from pydantic_filters import FilterType, SearchType
+from pydantic_filters.filter._range import merge_ranges
+
+MaskOperator: TypeAlias = Callable[
+    [np.ndarray, bool, Any],
+    np.ndarray,
+]
+"""Takes the column, `is_sequence` and the filter value, returns the boolean mask"""
+
+_LIKE_WILDCARDS = "%_"
+
+
+def null_mask(column: np.ndarray) -> np.ndarray:
+    """`None` in object columns, `NaN` in float columns and `NaT` in datetime columns"""
+
+    kind = column.dtype.kind
+    if kind == "f" or kind == "c":
+        return np.isnan(column)
+    if kind == "m" or kind == "M":
+        return np.isnat(column)
+    if kind == "O":
+        return np.equal(column, None)
+    return np.zeros(len(column), dtype=bool)
+
+
+def _compare(column: np.ndarray, ufunc: np.ufunc, obj: Any) -> np.ndarray:
+    """Comparison with NULL semantics: null values never match"""
+
+    if column.dtype.kind != "O":
+        return ufunc(column, obj)
+
+    not_null = ~null_mask(column)
+    mask = np.zeros(len(column), dtype=bool)
+    mask[not_null] = ufunc(column[not_null], obj)
+    return mask
+
+
+def _as_str(column: np.ndarray, *, lower: bool = False) -> np.ndarray:
+    if column.dtype.kind != "U":
+        column = np.where(null_mask(column), "", column).astype(str)
+    return np.char.lower(column) if lower else column
+
+
+def _like_mask(column: np.ndarray, pattern: str, *, ignore_case: bool) -> np.ndarray:
+    """
+    Simple patterns are evaluated with vectorized string functions:
+    `abc`, `abc%`, `%abc`, `%abc%`. Other patterns fall back to the regular expression per value.
+    """
+
+    strings = _as_str(column, lower=ignore_case)
+    if ignore_case:
+        pattern = pattern.lower()
+
+    inner = pattern.strip("%")
+    if not any(c in inner for c in _LIKE_WILDCARDS):
+        starts_any = pattern.startswith("%")
+        ends_any = pattern.endswith("%")
+        if starts_any and ends_any:
+            mask = np.char.find(strings, inner) >= 0
+        elif starts_any:
+            mask = np.char.endswith(strings, inner)
+        elif ends_any:
+            mask = np.char.startswith(strings, inner)
+        else:
+            mask = strings == inner
+    else:
+        regex = re.compile(
+            "".join(".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern),
+            re.DOTALL,
+        )
+        mask = np.fromiter((regex.fullmatch(s) is not None for s in strings), dtype=bool, count=len(strings))
+
+    return mask & ~null_mask(column)
+
+
+def _any(masks: List[np.ndarray], size: int) -> np.ndarray:
+    return np.logical_or.reduce(masks) if masks else np.zeros(size, dtype=bool)
+
+
+def _op_eq(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+    if is_sequence:
+        return np.isin(column, list(obj))
+    if obj is None:
+        return null_mask(column)
+    return _compare(column, np.equal, obj)
+
+
+def _op_ne(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+    if is_sequence:
+        return ~np.isin(column, list(obj)) & ~null_mask(column)
+    if obj is None:
+        return ~null_mask(column)
+    return _compare(column, np.not_equal, obj) & ~null_mask(column)
+
+
+def _op_comparison(ufunc: np.ufunc, reduce_sequence: Callable[[List[Any]], Any]) -> MaskOperator:
+    """`value > a OR value > b` is the same as `value > min(a, b)`"""
+
+    def _op(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+        if is_sequence:
+            if not obj:
+                return np.zeros(len(column), dtype=bool)
+            obj = reduce_sequence(list(obj))
+        if obj is None:
+            return np.zeros(len(column), dtype=bool)
+        return _compare(column, ufunc, obj)
+
+    return _op
+
+
+def _op_like(*, ignore_case: bool) -> MaskOperator:
+    def _op(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+        patterns = list(obj) if is_sequence else [obj]
+        return _any(
+            [_like_mask(column, p, ignore_case=ignore_case) for p in patterns],
+            len(column),
+        )
+
+    return _op
+
+
+def _op_null(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+    expression = any(obj) if is_sequence else bool(obj)
+    return null_mask(column) if expression else ~null_mask(column)
+
+
+def _op_overlap(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+    values = frozenset(obj if is_sequence else [obj])
+    return np.fromiter(
+        (v is not None and not values.isdisjoint(v) for v in column),
+        dtype=bool,
+        count=len(column),
+    )
+
+
+def _op_contains(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+    values = frozenset(obj if is_sequence else [obj])
+    return np.fromiter(
+        (v is not None and values.issubset(v) for v in column),
+        dtype=bool,
+        count=len(column),
+    )
+
+
+def _op_range(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+    masks = []
+    for start, end in merge_ranges(obj if is_sequence else [obj]):
+        mask = ~null_mask(column)
+        if start is not None:
+            mask &= _compare(column, np.greater_equal, start)
+        if end is not None:
+            mask &= _compare(column, np.less_equal, end)
+        masks.append(mask)
+
+    return _any(masks, len(column))
+
+
+def _search(*, ignore_case: bool) -> MaskOperator:
+    def _op(column: np.ndarray, is_sequence: bool, obj: Any) -> np.ndarray:
+        terms = list(obj) if is_sequence else [obj]
+        return _any(
+            [_like_mask(column, f"%{t}%", ignore_case=ignore_case) for t in terms],
+            len(column),
+        )
+
+    return _op
+
+
+_filter_type_to_operator_map: Dict[FilterType, MaskOperator] = {
+    FilterType.eq: _op_eq,
+    FilterType.ne: _op_ne,
+    FilterType.gt: _op_comparison(np.greater, min),
+    FilterType.ge: _op_comparison(np.greater_equal, min),
+    FilterType.lt: _op_comparison(np.less, max),
+    FilterType.le: _op_comparison(np.less_equal, max),
+    FilterType.like: _op_like(ignore_case=False),
+    FilterType.ilike: _op_like(ignore_case=True),
+    FilterType.null: _op_null,
+    FilterType.overlap: _op_overlap,
+    FilterType.contains: _op_contains,
+    FilterType.range: _op_range,
+}
+
+_search_type_to_operator_map: Dict[SearchType, MaskOperator] = {
+    SearchType.case_sensitive: _search(ignore_case=False),
+    SearchType.case_insensitive: _search(ignore_case=True),
+}
+
+
+def get_filter_operator(type_: FilterType) -> MaskOperator:
+    return _filter_type_to_operator_map[type_]
+
+
+def get_search_operator(type_: SearchType) -> MaskOperator:
+    return _search_type_to_operator_map[type_]
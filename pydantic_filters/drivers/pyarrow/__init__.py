@@ -0,0 +1,16 @@
+from ._exceptions import (
+    AttributeNotFoundArrowDriverError,
+    BaseArrowDriverError,
+    SupportArrowDriverError,
+)
+from ._main import (
+    Source,
+    apply_to_dataset,
+    count_dataset,
+    filter_dataset,
+    filter_to_expression,
+    iter_batches,
+    paginate_table,
+    scan,
+    sort_table,
+)
@@ -0,0 +1,10 @@
+class BaseArrowDriverError(Exception):
+    """Base PyArrow driver error"""
+
+
+class AttributeNotFoundArrowDriverError(BaseArrowDriverError):
+    pass
+
+
+class SupportArrowDriverError(BaseArrowDriverError):
+    pass
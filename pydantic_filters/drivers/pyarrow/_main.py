@@ -0,0 +1,365 @@
+from functools import reduce
+from operator import and_, or_
+from typing import Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    SortByOrder,
+)
+
+from ._exceptions import AttributeNotFoundArrowDriverError, SupportArrowDriverError
+from ._operators import get_filter_operator, get_search_operator
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+
+Source = Union[ds.Dataset, pa.Table]
+"""Dataset (Parquet files, partitions) or the table already in memory"""
+
+FIELD_PATH_SEPARATOR = "."
+"""Separator between the column name and the fields of the struct column in targets"""
+
+_NULL_PLACEMENT_PER_KEY = int(pa.__version__.split(".")[0]) >= 25
+"""Since 25.0 null placement is specified per sort key"""
+
+
+def _check_path(schema: pa.Schema, path: Tuple[str, ...], owner: str) -> None:
+    fields: Union[pa.Schema, pa.StructType] = schema
+    for name in path:
+        index = fields.get_field_index(name) if fields is not None else -1
+        if index < 0:
+            raise AttributeNotFoundArrowDriverError(
+                f"{owner}: Field {FIELD_PATH_SEPARATOR.join(path)!r} not found",
+            )
+        type_ = fields.field(index).type
+        fields = type_ if pa.types.is_struct(type_) else None
+
+
+def _field(
+        path: Tuple[str, ...],
+        schema: Optional[pa.Schema],
+        owner: str,
+) -> pc.Expression:
+    if schema is not None:
+        _check_path(schema, path, owner)
+    return pc.field(*path)
+
+
+def _split(target: str) -> Tuple[str, ...]:
+    return tuple(target.split(FIELD_PATH_SEPARATOR))
+
+
+def filter_to_expression(
+        filter_: _Filter,
+        *,
+        schema: Optional[pa.Schema] = None,
+        prefix: Tuple[str, ...] = (),
+) -> Optional[pc.Expression]:
+    """
+    Data from the filter to the `pyarrow.compute` expression.
+    Dotted targets and nested filters refer to the fields of the struct columns.
+
+    **Example**
+
+    >>> class MyFilter(BaseFilter):
+    ...     name: List[str]
+    ...     age__gt: int
+    ...
+    >>> filter_to_expression(MyFilter(name=["Alice", "Bob"], age__gt=18))
+    (is_in(name, {value_set=string:["Alice", "Bob"], ...}) and (age > 18))
+
+    Args:
+        filter_: Filter object.
+        schema: Check that all the fields exist in the schema.
+        prefix: Path of the struct column, used for the nested filters.
+
+    Returns:
+        Expression or `None` if there is nothing to filter.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Field not found in the schema
+        SupportArrowDriverError: Filter type is not supported
+    """
+
+    owner = filter_.__class__.__name__
+    expressions: List[pc.Expression] = []
+    fields_set = filter_.model_fields_set
+
+    for key, filter_field_info in filter_.filter_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_filter_operator(filter_field_info.type)
+        if operator is None:
+            raise SupportArrowDriverError(
+                f"{owner}.{key}: Filter type {filter_field_info.type.value} is not supported",
+            )
+        field = _field(prefix + _split(filter_field_info.target), schema, f"{owner}.{key}")
+        expressions.append(
+            operator(field, filter_field_info.is_sequence, getattr(filter_, key)),
+        )
+
+    for key, search_field_info in filter_.search_fields.items():
+        if key not in fields_set:
+            continue
+
+        operator = get_search_operator(search_field_info.type)
+        value = getattr(filter_, key)
+        fields = [_field(prefix + _split(str(t)), schema, f"{owner}.{key}") for t in search_field_info.target]
+        expressions.append(reduce(
+            or_,
+            [operator(field, search_field_info.is_sequence, value) for field in fields],
+        ))
+
+    for field_name in filter_.nested_filters:
+        nested_filter = getattr(filter_, field_name)
+        if not nested_filter:
+            continue
+
+        expression = filter_to_expression(nested_filter, schema=schema, prefix=(*prefix, field_name))
+        if expression is not None:
+            expressions.append(expression)
+
+    return reduce(and_, expressions) if expressions else None
+
+
+def _as_dataset(source: Source) -> ds.Dataset:
+    return ds.dataset(source) if isinstance(source, pa.Table) else source
+
+
+def _sort_column(sort: Optional[_Sort]) -> Optional[str]:
+    if sort is None or sort.sort_by is None:
+        return None
+    return str(getattr(sort.sort_by, "value", sort.sort_by))
+
+
+def scan(
+        source: Source,
+        *,
+        filter_: Optional[_Filter] = None,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+) -> ds.Scanner:
+    """
+    Create the scanner with the filter pushed down to the dataset.
+    Parquet row groups are skipped by their statistics and partitions by their keys,
+    only the requested columns are read.
+
+    Args:
+        source: Dataset or table.
+        filter_: Filter object.
+        columns: Columns to read, all by default.
+        batch_size: Maximum number of rows in the record batches.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Field not found in the schema
+        SupportArrowDriverError: Filter type is not supported
+    """
+
+    dataset = _as_dataset(source)
+    expression = None if filter_ is None else filter_to_expression(filter_, schema=dataset.schema)
+
+    options = {} if batch_size is None else {"batch_size": batch_size}
+    return dataset.scanner(
+        columns=None if columns is None else list(columns),
+        filter=expression,
+        **options,
+    )
+
+
+def sort_table(
+        table: pa.Table,
+        sort: _Sort,
+) -> pa.Table:
+    """
+    Apply sorting to the table.
+    Null values go last in ascending order and first in descending, as in PostgreSQL.
+
+    Args:
+        table: Table.
+        sort: Sort object.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Column not found
+    """
+
+    sort_by = _sort_column(sort)
+    if sort_by is None:
+        return table
+
+    if table.schema.get_field_index(sort_by) < 0:
+        raise AttributeNotFoundArrowDriverError(
+            f"{sort.__class__.__name__}.sort_by: Column {sort_by!r} not found",
+        )
+
+    if sort.sort_by_order == SortByOrder.desc:
+        order, null_placement = "descending", "at_start"
+    else:
+        order, null_placement = "ascending", "at_end"
+
+    if _NULL_PLACEMENT_PER_KEY:
+        indices = pc.sort_indices(table, sort_keys=[(sort_by, order, null_placement)])
+    else:
+        indices = pc.sort_indices(table, sort_keys=[(sort_by, order)], null_placement=null_placement)
+    return table.take(indices)
+
+
+def paginate_table(
+        table: pa.Table,
+        pagination: _Pagination,
+) -> pa.Table:
+    """
+    Apply pagination to the table. Slicing does not copy the data.
+
+    Args:
+        table: Table.
+        pagination: Pagination object.
+    """
+
+    return table.slice(pagination.get_offset(), pagination.get_limit())
+
+
+def filter_dataset(
+        source: Source,
+        filter_: _Filter,
+        *,
+        columns: Optional[Sequence[str]] = None,
+) -> pa.Table:
+    """
+    Read the rows satisfying the filter.
+
+    Args:
+        source: Dataset or table.
+        filter_: Filter object.
+        columns: Columns to read, all by default.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Field not found in the schema
+        SupportArrowDriverError: Filter type is not supported
+    """
+
+    return scan(source, filter_=filter_, columns=columns).to_table()
+
+
+def apply_to_dataset(
+        source: Source,
+        *,
+        filter_: Optional[_Filter] = None,
+        sort: Optional[_Sort] = None,
+        pagination: Optional[_Pagination] = None,
+        columns: Optional[Sequence[str]] = None,
+) -> pa.Table:
+    """
+    All in one function.
+    Without sorting only the first `offset + limit` matching rows are read.
+
+    Args:
+        source: Dataset or table.
+        filter_: Filter object.
+        sort: Sort object.
+        pagination: Pagination object.
+        columns: Columns to read, all by default. The sort column is read in any case.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Field not found in the schema
+        SupportArrowDriverError: Filter type is not supported
+    """
+
+    sort_by = _sort_column(sort)
+    scan_columns = columns
+    if columns is not None and sort_by is not None and sort_by not in columns:
+        scan_columns = [*columns, sort_by]
+
+    scanner = scan(source, filter_=filter_, columns=scan_columns)
+
+    if sort_by is None:
+        if pagination is None:
+            return scanner.to_table()
+        return paginate_table(
+            scanner.head(pagination.get_offset() + pagination.get_limit()),
+            pagination,
+        )
+
+    table = sort_table(scanner.to_table(), sort)
+    if pagination is not None:
+        table = paginate_table(table, pagination)
+    if scan_columns is not columns:
+        table = table.select(list(columns))
+    return table
+
+
+def iter_batches(
+        source: Source,
+        *,
+        filter_: Optional[_Filter] = None,
+        pagination: Optional[_Pagination] = None,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream the rows satisfying the filter as record batches,
+    without collecting the whole result in memory.
+
+    Args:
+        source: Dataset or table.
+        filter_: Filter object.
+        pagination: Pagination object.
+        columns: Columns to read, all by default.
+        batch_size: Maximum number of rows in the record batches.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Field not found in the schema
+        SupportArrowDriverError: Filter type is not supported
+    """
+
+    scanner = scan(source, filter_=filter_, columns=columns, batch_size=batch_size)
+
+    if pagination is None:
+        yield from scanner.to_batches()
+        return
+
+    skip = pagination.get_offset()
+    left = pagination.get_limit()
+
+    for batch in scanner.to_batches():
+        if left <= 0:
+            break
+        if skip >= batch.num_rows:
+            skip -= batch.num_rows
+            continue
+
+        batch = batch.slice(skip, left)
+        skip = 0
+        left -= batch.num_rows
+        if batch.num_rows:
+            yield batch
+
+
+def count_dataset(
+        source: Source,
+        filter_: _Filter,
+) -> int:
+    """
+    Get the number of rows satisfying the filter.
+    Parquet metadata is used where possible instead of reading the data.
+
+    Args:
+        source: Dataset or table.
+        filter_: Filter object.
+
+    Raises:
+        AttributeNotFoundArrowDriverError: Field not found in the schema
+        SupportArrowDriverError: Filter type is not supported
+    """
+
+    dataset = _as_dataset(source)
+    return dataset.count_rows(
+        filter=filter_to_expression(filter_, schema=dataset.schema),
+    )
@@ -0,0 +1,136 @@
+from functools import reduce
+from operator import and_, or_
+from typing import Any, Callable, Dict, List, Optional
+
+import pyarrow.compute as pc
+from typing_extensions import TypeAlias
+
+from pydantic_filters import FilterType, SearchType
+from pydantic_filters.filter._range import merge_ranges
+
+ExpressionOperator: TypeAlias = Callable[
+    [pc.Expression, bool, Any],
+    pc.Expression,
+]
+"""Takes the field reference, `is_sequence` and the filter value, returns the expression"""
+
+_LIKE_WILDCARDS = "%_"
+
+
+def _false() -> pc.Expression:
+    return pc.scalar(False)
+
+
+def _any(expressions: List[pc.Expression]) -> pc.Expression:
+    return reduce(or_, expressions) if expressions else _false()
+
+
+def _op_eq(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+    if is_sequence:
+        if not obj:
+            return _false()
+        return field.isin(list(obj))
+    if obj is None:
+        return field.is_null()
+    return field == obj
+
+
+def _op_ne(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+    if is_sequence:
+        if not obj:
+            return field.is_valid()
+        return ~field.isin(list(obj)) & field.is_valid()
+    if obj is None:
+        return field.is_valid()
+    return field != obj
+
+
+def _op_comparison(
+        operator: Callable[[pc.Expression, Any], pc.Expression],
+        reduce_sequence: Callable[[List[Any]], Any],
+) -> ExpressionOperator:
+    """`value > a OR value > b` is the same as `value > min(a, b)`"""
+
+    def _op(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+        if is_sequence:
+            if not obj:
+                return _false()
+            obj = reduce_sequence(list(obj))
+        if obj is None:
+            return _false()
+        return operator(field, obj)
+
+    return _op
+
+
+def _like(field: pc.Expression, pattern: str, *, ignore_case: bool) -> pc.Expression:
+    return pc.match_like(field, pattern, ignore_case=ignore_case)
+
+
+def _op_like(*, ignore_case: bool) -> ExpressionOperator:
+    def _op(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+        patterns = list(obj) if is_sequence else [obj]
+        return _any([_like(field, p, ignore_case=ignore_case) for p in patterns if p is not None])
+
+    return _op
+
+
+def _op_null(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+    expression = any(obj) if is_sequence else bool(obj)
+    return field.is_null() if expression else field.is_valid()
+
+
+def _op_range(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+    expressions = []
+    for start, end in merge_ranges(obj if is_sequence else [obj]):
+        bounds: List[pc.Expression] = []
+        if start is not None:
+            bounds.append(field >= start)
+        if end is not None:
+            bounds.append(field <= end)
+        expressions.append(reduce(and_, bounds) if bounds else field.is_valid())
+
+    return _any(expressions)
+
+
+def _search(*, ignore_case: bool) -> ExpressionOperator:
+    """`%term%` patterns, without wildcards the search is a plain substring match"""
+
+    def _op(field: pc.Expression, is_sequence: bool, obj: Any) -> pc.Expression:
+        terms = [str(o) for o in obj] if is_sequence else [str(obj)]
+        return _any([
+            _like(field, f"%{t}%", ignore_case=ignore_case)
+            if any(c in t for c in _LIKE_WILDCARDS) else
+            pc.match_substring(field, t, ignore_case=ignore_case)
+            for t in terms
+        ])
+
+    return _op
+
+
+_filter_type_to_operator_map: Dict[FilterType, ExpressionOperator] = {
+    FilterType.eq: _op_eq,
+    FilterType.ne: _op_ne,
+    FilterType.gt: _op_comparison(lambda f, v: f > v, min),
+    FilterType.ge: _op_comparison(lambda f, v: f >= v, min),
+    FilterType.lt: _op_comparison(lambda f, v: f < v, max),
+    FilterType.le: _op_comparison(lambda f, v: f <= v, max),
+    FilterType.like: _op_like(ignore_case=False),
+    FilterType.ilike: _op_like(ignore_case=True),
+    FilterType.null: _op_null,
+    FilterType.range: _op_range,
+}
+
+_search_type_to_operator_map: Dict[SearchType, ExpressionOperator] = {
+    SearchType.case_sensitive: _search(ignore_case=False),
+    SearchType.case_insensitive: _search(ignore_case=True),
+}
+
+
+def get_filter_operator(type_: FilterType) -> Optional[ExpressionOperator]:
+    """`None` if the filter type is not supported"""
+    return _filter_type_to_operator_map.get(type_)
+
+
+def get_search_operator(type_: SearchType) -> ExpressionOperator:
+    return _search_type_to_operator_map[type_]
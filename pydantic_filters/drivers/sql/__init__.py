@@ -0,0 +1,15 @@
+from ._compiler import (
+    Paramstyle,
+    compile_count,
+    compile_select,
+)
+from ._exceptions import (
+    AttributeNotFoundSqlDriverError,
+    BaseSqlDriverError,
+    RelationshipNotFoundSqlDriverError,
+    SupportSqlDriverError,
+)
+from ._tables import (
+    SqlJoin,
+    SqlTable,
+)
@@ -0,0 +1,394 @@
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional, Sequence, Tuple, TypeVar
+
+from typing_extensions import Literal
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    FilterType,
+    SortByOrder,
+)
+from pydantic_filters._tracing import set_filter_attributes, start_span
+from pydantic_filters.filter._range import get_range_bounds
+
+from ._exceptions import (
+    AttributeNotFoundSqlDriverError,
+    RelationshipNotFoundSqlDriverError,
+    SupportSqlDriverError,
+)
+from ._operators import (
+    COLUMN,
+    PARAM,
+    SqlOperator,
+    get_array_element_operator,
+    get_filter_operator,
+    get_search_operator,
+    is_array_filter_type,
+)
+from ._tables import SqlTable, quote
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+
+Paramstyle = Literal["numeric_dollar", "format", "qmark"]
+"""
+- `numeric_dollar` - `$1`, asyncpg
+- `format` - `%s`, psycopg
+- `qmark` - `?`, sqlite3
+"""
+
+_postgresql_paramstyles: FrozenSet[str] = frozenset({"numeric_dollar", "format"})
+"""Paramstyles of the PostgreSQL drivers, the sequences are passed as arrays"""
+
+JSON_PATH_SEPARATOR = "."
+"""Separator between the column name and the keys of the JSON path in targets"""
+
+_Shape = Tuple[Tuple[Any, ...], ...]
+"""
+Hashable description of the filter instance: which fields are set and how they are compared.
+The values themselves are not a part of the shape, they are the parameters of the statement.
+"""
+
+_json_casts: Tuple[Tuple[type, str], ...] = (
+    (bool, "BOOLEAN"),
+    (int, "INTEGER"),
+    (float, "FLOAT"),
+)
+
+
+def _json_cast(type_: FilterType, is_sequence: bool, obj: Any) -> Optional[str]:
+    """Type to cast the JSON value to, by the type of the compared object"""
+
+    if type_ == FilterType.null:
+        return None
+
+    sample = next(iter(obj), None) if is_sequence else obj
+    if type_ == FilterType.range and sample is not None:
+        sample = next((b for b in get_range_bounds(sample) if b is not None), None)
+
+    for sample_type, cast in _json_casts:
+        if isinstance(sample, sample_type):
+            return cast
+    return None
+
+
+def _get_column(
+        filter_: _Filter,
+        key: str,
+        table: SqlTable,
+        target: str,
+) -> Tuple[str, Tuple[str, ...]]:
+    name, *path = target.split(JSON_PATH_SEPARATOR)
+    if name not in table.columns:
+        raise AttributeNotFoundSqlDriverError(
+            f"{filter_.__class__.__name__}.{key}: "
+            f"Column {table.name}.{name} not found",
+        )
+    return name, tuple(path)
+
+
+def _get_filter_operator(
+        filter_: _Filter,
+        key: str,
+        table: SqlTable,
+        name: str,
+        path: Tuple[str, ...],
+        postgresql: bool,
+) -> SqlOperator:
+    type_ = filter_.filter_fields[key].type
+
+    if is_array_filter_type(type_):
+        if path or not postgresql:
+            raise SupportSqlDriverError(
+                f"{filter_.__class__.__name__}.{key}: "
+                f"Filter type {type_.value} requires a PostgreSQL array column",
+            )
+        return get_filter_operator(type_)
+
+    if name in table.array_columns and not path:
+        operator = get_array_element_operator(type_)
+        if operator is None or not postgresql:
+            raise SupportSqlDriverError(
+                f"{filter_.__class__.__name__}.{key}: "
+                f"Filter type {type_.value} is not supported for the array column {table.name}.{name}",
+            )
+        return operator
+
+    return get_filter_operator(type_)
+
+
+def _plan(
+        filter_: _Filter,
+        table: SqlTable,
+        postgresql: bool,
+        params: List[Any],
+) -> _Shape:
+    """Get the shape of the filter, appending the parameters in the order of the conditions"""
+
+    shape = []
+    fields_set = filter_.model_fields_set
+
+    for key, filter_field_info in filter_.filter_fields.items():
+        if key not in fields_set:
+            continue
+
+        name, path = _get_column(filter_, key, table, filter_field_info.target)
+        operator = _get_filter_operator(filter_, key, table, name, path, postgresql)
+
+        value = getattr(filter_, key)
+        template, field_params = operator(filter_field_info.is_sequence, value, postgresql)
+        cast = _json_cast(filter_field_info.type, filter_field_info.is_sequence, value) if path else None
+
+        params.extend(field_params)
+        shape.append(("filter", name, path, cast, template))
+
+    for key, search_field_info in filter_.search_fields.items():
+        if key not in fields_set:
+            continue
+
+        targets = tuple(_get_column(filter_, key, table, str(t)) for t in search_field_info.target)
+        if any(name in table.array_columns and not path for name, path in targets):
+            raise SupportSqlDriverError(
+                f"{filter_.__class__.__name__}.{key}: "
+                f"Search is not supported for the array columns",
+            )
+        operator = get_search_operator(search_field_info.type)
+        template, field_params = operator(search_field_info.is_sequence, getattr(filter_, key), postgresql)
+
+        # The condition is repeated for every target
+        params.extend(field_params * len(targets))
+        shape.append(("search", targets, template))
+
+    for field_name in filter_.nested_filters:
+        nested_filter = getattr(filter_, field_name)
+        if not nested_filter:
+            continue
+
+        join = table.joins.get(field_name)
+        if join is None:
+            raise RelationshipNotFoundSqlDriverError(
+                f"{filter_.__class__.__name__}.{field_name}: "
+                f"Join path from {table.name} is not declared",
+            )
+
+        shape.append(("nested", field_name, _plan(nested_filter, join.table, postgresql, params)))
+
+    return tuple(shape)
+
+
+class _Renderer:
+    """Renders the shape into the joins and the conditions of the statement"""
+
+    def __init__(self, *, postgresql: bool) -> None:
+        self.postgresql = postgresql
+        self.joins: List[str] = []
+        self.conditions: List[str] = []
+
+    def column(self, alias: str, name: str, path: Tuple[str, ...], cast: Optional[str]) -> str:
+        expression = f"{quote(alias)}.{quote(name)}"
+        if not path:
+            return expression
+
+        if self.postgresql:
+            keys = ",".join('"{}"'.format(k.replace('"', '\\"')) for k in path)
+            expression = "({} #>> '{{{}}}')".format(expression, keys.replace("'", "''"))
+            return f"CAST({expression} AS {cast})" if cast else expression
+
+        json_path = "$" + "".join('."{}"'.format(k.replace('"', '\\"')) for k in path)
+        return "JSON_EXTRACT({}, '{}')".format(expression, json_path.replace("'", "''"))
+
+    def walk(self, shape: _Shape, table: SqlTable, alias: str) -> None:
+        for instruction in shape:
+            kind = instruction[0]
+
+            if kind == "filter":
+                _, name, path, cast, template = instruction
+                self.conditions.append(template.replace(COLUMN, self.column(alias, name, path, cast)))
+
+            elif kind == "search":
+                _, targets, template = instruction
+                conditions = [template.replace(COLUMN, self.column(alias, name, path, None)) for name, path in targets]
+                self.conditions.append(conditions[0] if len(conditions) == 1 else f"({' OR '.join(conditions)})")
+
+            elif kind == "nested":
+                _, field_name, nested_shape = instruction
+                join = table.joins[field_name]
+                nested_alias = f"{join.table.name}_{len(self.joins) + 1}"
+                local, remote = join.on
+                self.joins.append(
+                    f"JOIN {quote(join.table.name)} AS {quote(nested_alias)} "
+                    f"ON {quote(alias)}.{quote(local)} = {quote(nested_alias)}.{quote(remote)}",
+                )
+                self.walk(nested_shape, join.table, nested_alias)
+
+
+def _placeholders(text: str, paramstyle: Paramstyle) -> str:
+    """Replace the parameter markers with the placeholders of the paramstyle"""
+
+    chunks = text.split(PARAM)
+    if paramstyle == "format":
+        chunks = [c.replace("%", "%%") for c in chunks]
+
+    result = [chunks[0]]
+    for i, chunk in enumerate(chunks[1:], start=1):
+        result.append(f"${i}" if paramstyle == "numeric_dollar" else "%s" if paramstyle == "format" else "?")
+        result.append(chunk)
+    return "".join(result)
+
+
+@lru_cache(maxsize=1024)
+def _render_select(
+        shape: _Shape,
+        table: SqlTable,
+        paramstyle: Paramstyle,
+        columns: Optional[Tuple[str, ...]],
+        order_by: Optional[Tuple[str, bool]],
+        paginate: bool,
+) -> str:
+    renderer = _Renderer(postgresql=paramstyle in _postgresql_paramstyles)
+    renderer.walk(shape, table, table.name)
+
+    if columns is None:
+        select = f"{quote(table.name)}.*"
+    else:
+        select = ", ".join(f"{quote(table.name)}.{quote(c)}" for c in columns)
+
+    parts = [f"SELECT {select} FROM {quote(table.name)}", *renderer.joins]
+    if renderer.conditions:
+        parts.append(f"WHERE {' AND '.join(renderer.conditions)}")
+    if order_by is not None:
+        name, descending = order_by
+        parts.append(f"ORDER BY {quote(table.name)}.{quote(name)} {'DESC' if descending else 'ASC'}")
+    if paginate:
+        parts.append(f"LIMIT {PARAM} OFFSET {PARAM}")
+
+    return _placeholders(" ".join(parts), paramstyle)
+
+
+@lru_cache(maxsize=1024)
+def _render_count(
+        shape: _Shape,
+        table: SqlTable,
+        paramstyle: Paramstyle,
+) -> str:
+    renderer = _Renderer(postgresql=paramstyle in _postgresql_paramstyles)
+    renderer.walk(shape, table, table.name)
+
+    if renderer.joins:
+        count = f"count(DISTINCT {quote(table.name)}.{quote(table.primary_key)})"
+    else:
+        count = "count(*)"
+
+    parts = [f"SELECT {count} FROM {quote(table.name)}", *renderer.joins]
+    if renderer.conditions:
+        parts.append(f"WHERE {' AND '.join(renderer.conditions)}")
+
+    return _placeholders(" ".join(parts), paramstyle)
+
+
+def _check_columns(table: SqlTable, columns: Sequence[str], owner: str) -> None:
+    for name in columns:
+        if name not in table.columns:
+            raise AttributeNotFoundSqlDriverError(
+                f"{owner}: Column {table.name}.{name} not found",
+            )
+
+
+def compile_select(
+        table: SqlTable,
+        *,
+        filter_: Optional[_Filter] = None,
+        sort: Optional[_Sort] = None,
+        pagination: Optional[_Pagination] = None,
+        columns: Optional[Sequence[str]] = None,
+        paramstyle: Paramstyle = "numeric_dollar",
+) -> Tuple[str, List[Any]]:
+    """
+    Compile the select statement with filtering, sorting and pagination.
+
+    The SQL text is cached per filter shape (the set fields and the kind of their values),
+    so the repeated calls only extract the parameters.
+    For the PostgreSQL paramstyles the sequences are passed as array parameters (`= ANY($1)`),
+    so the text does not depend on their length.
+
+    **Example**
+
+    >>> compile_select(users, filter_=UserFilter(login=["alice", "bob"], age__lt=30))
+    ('SELECT "users".* FROM "users" WHERE "users"."login" = ANY($1) AND "users"."age" < $2', [['alice', 'bob'], 30])
+
+    Args:
+        table: Table declaration.
+        filter_: Filter object.
+        sort: Sort object.
+        pagination: Pagination object.
+        columns: Columns to select, all by default.
+        paramstyle: Placeholders style of the database driver.
+
+    Returns:
+        SQL text and the parameters.
+
+    Raises:
+        AttributeNotFoundSqlDriverError: Column not found
+        RelationshipNotFoundSqlDriverError: Join path is not declared
+        SupportSqlDriverError: Filter type is not supported
+    """
+
+    with start_span("pydantic_filters.compile", lambda: {"pydantic_filters.paramstyle": paramstyle}) as span:
+        params: List[Any] = []
+        shape = () if filter_ is None else _plan(filter_, table, paramstyle in _postgresql_paramstyles, params)
+
+        if columns is not None:
+            columns = tuple(columns)
+            _check_columns(table, columns, "columns")
+
+        order_by = None
+        if sort is not None and sort.sort_by is not None:
+            sort_by = str(getattr(sort.sort_by, "value", sort.sort_by))
+            _check_columns(table, [sort_by], f"{sort.__class__.__name__}.sort_by")
+            order_by = sort_by, sort.sort_by_order == SortByOrder.desc
+
+        if pagination is not None:
+            params.extend((pagination.get_limit(), pagination.get_offset()))
+
+        text = _render_select(shape, table, paramstyle, columns, order_by, pagination is not None)
+        set_filter_attributes(span, filter_)
+        return text, params
+
+
+def compile_count(
+        table: SqlTable,
+        filter_: _Filter,
+        *,
+        paramstyle: Paramstyle = "numeric_dollar",
+) -> Tuple[str, List[Any]]:
+    """
+    Compile the count statement.
+    Rows are counted by the distinct primary key only if the filter joins other tables.
+
+    Args:
+        table: Table declaration.
+        filter_: Filter object.
+        paramstyle: Placeholders style of the database driver.
+
+    Returns:
+        SQL text and the parameters.
+
+    Raises:
+        AttributeNotFoundSqlDriverError: Column not found
+        RelationshipNotFoundSqlDriverError: Join path is not declared
+        SupportSqlDriverError: Filter type is not supported, or no primary key to count with joins
+    """
+
+    with start_span("pydantic_filters.compile", lambda: {"pydantic_filters.paramstyle": paramstyle}) as span:
+        params: List[Any] = []
+        shape = _plan(filter_, table, paramstyle in _postgresql_paramstyles, params)
+
+        if table.primary_key is None and any(i[0] == "nested" for i in shape):
+            raise SupportSqlDriverError(f"Primary key of {table.name} is required to count with joins")
+
+        text = _render_count(shape, table, paramstyle)
+        set_filter_attributes(span, filter_)
+        return text, params
@@ -0,0 +1,14 @@
+class BaseSqlDriverError(Exception):
+    """Base SQL driver error"""
+
+
+class AttributeNotFoundSqlDriverError(BaseSqlDriverError):
+    pass
+
+
+class RelationshipNotFoundSqlDriverError(BaseSqlDriverError):
+    pass
+
+
+class SupportSqlDriverError(BaseSqlDriverError):
+    pass
@@ -0,0 +1,192 @@
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from typing_extensions import TypeAlias
+
+from pydantic_filters import FilterType, SearchType
+from pydantic_filters.filter._range import merge_ranges
+
+COLUMN = "\x01"
+"""Column expression marker in the templates"""
+
+PARAM = "\x00"
+"""Parameter placeholder marker in the templates"""
+
+SqlOperator: TypeAlias = Callable[[bool, Any, bool], Tuple[str, List[Any]]]
+"""
+Takes `is_sequence`, the filter value and whether the PostgreSQL syntax is available,
+returns the expression template and its parameters.
+The template is cached, so it must depend only on the shape of the value.
+"""
+
+_FALSE = "1 != 1"
+_TRUE = "1 = 1"
+
+
+def _any_of(template: str, values: List[Any]) -> Tuple[str, List[Any]]:
+    """Expanded `OR` for every value, the template takes a single parameter"""
+
+    if not values:
+        return _FALSE, []
+    if len(values) == 1:
+        return template, values
+    return f"({' OR '.join([template] * len(values))})", values
+
+
+def _op_eq(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:
+    if is_sequence:
+        values = list(obj)
+        if postgresql:
+            return f"{COLUMN} = ANY({PARAM})", [values]
+        if not values:
+            return _FALSE, []
+        return f"{COLUMN} IN ({', '.join([PARAM] * len(values))})", values
+    if obj is None:
+        return f"{COLUMN} IS NULL", []
+    return f"{COLUMN} = {PARAM}", [obj]
+
+
+def _op_ne(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:
+    if is_sequence:
+        values = list(obj)
+        if postgresql:
+            return f"{COLUMN} <> ALL({PARAM})", [values]
+        if not values:
+            return _TRUE, []
+        return f"{COLUMN} NOT IN ({', '.join([PARAM] * len(values))})", values
+    if obj is None:
+        return f"{COLUMN} IS NOT NULL", []
+    return f"{COLUMN} <> {PARAM}", [obj]
+
+
+def _op_comparison(operator: str) -> SqlOperator:
+    def _op(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:
+        if not is_sequence:
+            return f"{COLUMN} {operator} {PARAM}", [obj]
+        if postgresql:
+            return f"{COLUMN} {operator} ANY({PARAM})", [list(obj)]
+        return _any_of(f"{COLUMN} {operator} {PARAM}", list(obj))
+
+    return _op
+
+
+def _op_like(*, ignore_case: bool) -> SqlOperator:
+    """`ILIKE` on PostgreSQL, `lower() LIKE lower()` elsewhere, as SQLAlchemy does"""
+
+    def _op(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:
+        if postgresql:
+            operator = "ILIKE" if ignore_case else "LIKE"
+            if is_sequence:
+                return f"{COLUMN} {operator} ANY({PARAM})", [list(obj)]
+            return f"{COLUMN} {operator} {PARAM}", [obj]
+
+        template = f"lower({COLUMN}) LIKE lower({PARAM})" if ignore_case else f"{COLUMN} LIKE {PARAM}"
+        if is_sequence:
+            return _any_of(template, list(obj))
+        return template, [obj]
+
+    return _op
+
+
+def _op_null(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:  # noqa: ARG001
+    expression = any(obj) if is_sequence else bool(obj)
+    return (f"{COLUMN} IS NULL", []) if expression else (f"{COLUMN} IS NOT NULL", [])
+
+
+def _op_array(operator: str) -> SqlOperator:
+    def _op(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:  # noqa: ARG001
+        return f"{COLUMN} {operator} {PARAM}", [list(obj) if is_sequence else [obj]]
+
+    return _op
+
+
+def _op_element_eq(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:  # noqa: ARG001
+    """The array column has the value, or any of the values"""
+
+    if is_sequence:
+        return f"{COLUMN} && {PARAM}", [list(obj)]
+    return f"{PARAM} = ANY({COLUMN})", [obj]
+
+
+def _op_range(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:  # noqa: ARG001
+    templates = []
+    params = []
+    for start, end in merge_ranges(obj if is_sequence else [obj]):
+        if start is not None and end is not None:
+            templates.append(f"{COLUMN} BETWEEN {PARAM} AND {PARAM}")
+            params.extend((start, end))
+        elif start is not None:
+            templates.append(f"{COLUMN} >= {PARAM}")
+            params.append(start)
+        elif end is not None:
+            templates.append(f"{COLUMN} <= {PARAM}")
+            params.append(end)
+        else:
+            templates.append(_TRUE)
+
+    if not templates:
+        return _FALSE, []
+    if len(templates) == 1:
+        return templates[0], params
+    return f"({' OR '.join(templates)})", params
+
+
+def _search(*, ignore_case: bool) -> SqlOperator:
+    like = _op_like(ignore_case=ignore_case)
+
+    def _op(is_sequence: bool, obj: Any, postgresql: bool) -> Tuple[str, List[Any]]:
+        return like(
+            is_sequence,
+            [f"%{o}%" for o in obj] if is_sequence else f"%{obj}%",
+            postgresql,
+        )
+
+    return _op
+
+
+_filter_type_to_operator_map: Dict[FilterType, SqlOperator] = {
+    FilterType.eq: _op_eq,
+    FilterType.ne: _op_ne,
+    FilterType.gt: _op_comparison(">"),
+    FilterType.ge: _op_comparison(">="),
+    FilterType.lt: _op_comparison("<"),
+    FilterType.le: _op_comparison("<="),
+    FilterType.like: _op_like(ignore_case=False),
+    FilterType.ilike: _op_like(ignore_case=True),
+    FilterType.null: _op_null,
+    FilterType.overlap: _op_array("&&"),
+    FilterType.contains: _op_array("@>"),
+    FilterType.range: _op_range,
+}
+
+_array_filter_types: FrozenSet[FilterType] = frozenset({
+    FilterType.overlap,
+    FilterType.contains,
+})
+
+_array_element_operator_map: Dict[FilterType, SqlOperator] = {
+    FilterType.eq: _op_element_eq,
+}
+"""Operators comparing the elements of the array column"""
+
+_search_type_to_operator_map: Dict[SearchType, SqlOperator] = {
+    SearchType.case_sensitive: _search(ignore_case=False),
+    SearchType.case_insensitive: _search(ignore_case=True),
+}
+
+
+def get_filter_operator(type_: FilterType) -> SqlOperator:
+    return _filter_type_to_operator_map[type_]
+
+
+def get_array_element_operator(type_: FilterType) -> Optional[SqlOperator]:
+    """Operator comparing the elements of the array column, `None` if not supported"""
+    return _array_element_operator_map.get(type_)
+
+
+def get_search_operator(type_: SearchType) -> SqlOperator:
+    return _search_type_to_operator_map[type_]
+
+
+def is_array_filter_type(type_: FilterType) -> bool:
+    """Filter types that require PostgreSQL arrays."""
+    return type_ in _array_filter_types
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from typing import Collection, Mapping, Optional, Tuple
+
+
+def quote(name: str) -> str:
+    """Quote the identifier, so that any name (including reserved words) can be used"""
+
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+@dataclass(frozen=True, eq=False)
+class SqlTable:
+    """
+    Declaration of the table for the SQL driver.
+    Tables are compared by identity: declare them once, the compiled SQL is cached per table.
+
+    **Example**
+
+    >>> departments = SqlTable("departments", columns={"id", "chef_id"}, primary_key="id")
+    >>> users = SqlTable(
+    ...     "users",
+    ...     columns={"id", "login", "age", "department_id"},
+    ...     primary_key="id",
+    ...     joins={"department": SqlJoin(departments, on=("department_id", "id"))},
+    ... )
+    """
+
+    name: str
+    """Name of the table in the database"""
+
+    columns: Collection[str]
+    """Columns available for filtering and sorting"""
+
+    primary_key: Optional[str] = None
+    """Required to count the rows with joins"""
+
+    array_columns: Collection[str] = frozenset()
+    """PostgreSQL array columns, the equality filters on them test the membership of the value"""
+
+    joins: Mapping[str, "SqlJoin"] = field(default_factory=dict)
+    """Join paths of the nested filters"""
+
+
+@dataclass(frozen=True, eq=False)
+class SqlJoin:
+    """Join path of the nested filter"""
+
+    table: SqlTable
+    """Table to join"""
+
+    on: Tuple[str, str]
+    """Column of the parent table and the column of the joined table to compare"""
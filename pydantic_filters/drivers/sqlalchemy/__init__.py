@@ -1,3 +1,11 @@
+from ._core import (
+    TableJoin,
+    TableJoins,
+    append_filter_to_table_statement,
+    append_sort_to_table_statement,
+    append_to_table_statement,
+    get_table_count_statement,
+)
 from ._exceptions import (
     AttributeNotFoundSaDriverError,
     BaseSaDriverError,
@@ -11,3 +19,4 @@ from ._main import (
     append_to_statement,
     get_count_statement,
 )
+from ._tracing import instrument_engine
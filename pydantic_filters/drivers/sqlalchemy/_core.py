@@ -0,0 +1,247 @@
+from dataclasses import dataclass, field
+from typing import List, Mapping, Optional, Tuple, TypeVar
+
+import sqlalchemy as sa
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    SortByOrder,
+)
+from pydantic_filters._tracing import get_sort_attributes, set_filter_attributes, start_span
+
+from ._exceptions import AttributeNotFoundSaDriverError, RelationshipNotFoundSaDriverError, SupportSaDriverError
+from ._main import append_pagination_to_statement
+from ._mapping import filter_to_column_clauses
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class TableJoin:
+    """
+    Join path of the nested filter for Core tables, declared once next to the tables.
+
+    **Example**
+
+    >>> departments = sa.Table("departments", metadata, sa.Column("id", sa.Integer, primary_key=True))
+    >>> users = sa.Table(
+    ...     "users",
+    ...     metadata,
+    ...     sa.Column("id", sa.Integer, primary_key=True),
+    ...     sa.Column("department_id", sa.ForeignKey("departments.id")),
+    ... )
+    >>> user_joins = {"department": TableJoin(departments)}
+    """
+
+    table: sa.FromClause
+    """Table to join, use an alias to join the same table twice"""
+
+    onclause: Optional[sa.ColumnElement[bool]] = None
+    """Join condition, by the foreign keys between the tables if not specified"""
+
+    joins: Mapping[str, "TableJoin"] = field(default_factory=dict)
+    """Join paths of the filters nested into this one"""
+
+
+TableJoins = Mapping[str, TableJoin]
+
+
+def filter_to_table_joins(
+        filter_: _Filter,
+        table: sa.FromClause,
+        joins: TableJoins,
+) -> List[Tuple[sa.FromClause, sa.ColumnElement[bool]]]:
+    """Get tables to join with the join conditions, the nested filters included into them"""
+
+    targets = []
+
+    for field_name in filter_.nested_filters:
+        nested_filter = getattr(filter_, field_name)
+        if not nested_filter:
+            continue
+
+        try:
+            join = joins[field_name]
+        except KeyError as e:
+            raise RelationshipNotFoundSaDriverError(
+                f"{filter_.__class__.__name__}.{field_name}: "
+                f"Join path from {table.description} is not declared",
+            ) from e
+
+        onclause = join.onclause
+        if onclause is None:
+            try:
+                onclause = sa.sql.util.join_condition(table, join.table)
+            except sa.exc.ArgumentError as e:
+                raise RelationshipNotFoundSaDriverError(
+                    f"{filter_.__class__.__name__}.{field_name}: {e}",
+                ) from e
+
+        targets.append((
+            join.table,
+            sa.and_(onclause, *filter_to_column_clauses(nested_filter, join.table)),
+        ))
+        targets.extend(
+            filter_to_table_joins(nested_filter, join.table, join.joins),
+        )
+
+    return targets
+
+
+def append_filter_to_table_statement(
+        statement: sa.Select[_T],
+        table: sa.FromClause,
+        filter_: _Filter,
+        *,
+        joins: Optional[TableJoins] = None,
+) -> sa.Select[_T]:
+    """
+    Append filtering to statement, using Core tables instead of the models.
+
+    Args:
+        statement: Some select statement.
+        table: Table or any other `FromClause`.
+        filter_: Filter object.
+        joins: Join paths of the nested filters.
+
+    Raises:
+        AttributeNotFoundSaDriverError: Column not found
+        RelationshipNotFoundSaDriverError: Join path is not declared
+    """
+
+    with start_span("pydantic_filters.filter_to_join_targets") as span:
+        join_targets = filter_to_table_joins(filter_, table, joins or {})
+        set_filter_attributes(span, filter_)
+    for target, onclause in join_targets:
+        statement = statement.join(target, onclause)
+
+    with start_span("pydantic_filters.filter_to_column_clauses") as span:
+        clauses = filter_to_column_clauses(filter_, table)
+        set_filter_attributes(span, filter_)
+    if clauses:
+        statement = statement.where(*clauses)
+
+    return statement
+
+
+def append_sort_to_table_statement(
+        statement: sa.Select[_T],
+        table: sa.FromClause,
+        sort: _Sort,
+) -> sa.Select[_T]:
+    """
+    Append sorting to statement, using Core tables instead of the models.
+
+    Args:
+        statement: Some select statement.
+        table: Table or any other `FromClause`.
+        sort: Sort object.
+
+    Raises:
+        AttributeNotFoundSaDriverError: Column not found
+    """
+
+    if sort.sort_by is None:
+        return statement
+
+    with start_span("pydantic_filters.append_sort", lambda: get_sort_attributes(sort)):
+        try:
+            column: sa.ColumnElement = table.c[str(getattr(sort.sort_by, "value", sort.sort_by))]
+        except KeyError as e:
+            raise AttributeNotFoundSaDriverError(
+                f"{sort.__class__.__name__}.sort_by: "
+                f"Column {table.description}.{sort.sort_by} not found",
+            ) from e
+
+        return statement.order_by(
+            sa.desc(column) if sort.sort_by_order == SortByOrder.desc else sa.asc(column),
+        )
+
+
+def append_to_table_statement(
+        statement: sa.Select[_T],
+        table: sa.FromClause,
+        *,
+        filter_: Optional[_Filter] = None,
+        sort: Optional[_Sort] = None,
+        pagination: Optional[_Pagination] = None,
+        joins: Optional[TableJoins] = None,
+) -> sa.Select[_T]:
+    """
+    All in one function, using Core tables instead of the models.
+
+    Args:
+        statement: Some select statement.
+        table: Table or any other `FromClause`.
+        filter_: Filter object.
+        sort: Sort object.
+        pagination: Pagination object.
+        joins: Join paths of the nested filters.
+
+    Raises:
+        AttributeNotFoundSaDriverError: Column not found
+        RelationshipNotFoundSaDriverError: Join path is not declared
+    """
+
+    if filter_ is not None:
+        statement = append_filter_to_table_statement(statement, table, filter_, joins=joins)
+    if sort is not None:
+        statement = append_sort_to_table_statement(statement, table, sort)
+    if pagination is not None:
+        statement = append_pagination_to_statement(statement, pagination)
+
+    return statement
+
+
+def get_table_count_statement(
+        table: sa.FromClause,
+        filter_: _Filter,
+        *,
+        joins: Optional[TableJoins] = None,
+) -> sa.Select[Tuple[int]]:
+    """
+    Get count statement, using Core tables instead of the models.
+    Rows are counted by the distinct primary key only if the filter joins other tables.
+
+    Args:
+        table: Table or any other `FromClause`.
+        filter_: Filter object.
+        joins: Join paths of the nested filters.
+
+    Raises:
+        AttributeNotFoundSaDriverError: Column not found.
+        RelationshipNotFoundSaDriverError: Join path is not declared.
+        SupportSaDriverError: No primary key or a composite one, if the filter joins other tables.
+    """
+
+    with start_span("pydantic_filters.filter_to_join_targets") as span:
+        join_targets = filter_to_table_joins(filter_, table, joins or {})
+        set_filter_attributes(span, filter_)
+
+    if join_targets:
+        primary_key = list(table.primary_key)
+        if not primary_key:
+            raise SupportSaDriverError(f"Primary key of {table.description} is required to count with joins")
+        if len(primary_key) > 1:
+            raise SupportSaDriverError("Composite primary keys are not supported")
+        count = sa.func.count(sa.distinct(primary_key[0]))
+    else:
+        count = sa.func.count()
+
+    statement = sa.select(count).select_from(table)
+
+    for target, onclause in join_targets:
+        statement = statement.join(target, onclause)
+
+    with start_span("pydantic_filters.filter_to_column_clauses") as span:
+        clauses = filter_to_column_clauses(filter_, table)
+        set_filter_attributes(span, filter_)
+    if clauses:
+        statement = statement.where(*clauses)
+
+    return statement
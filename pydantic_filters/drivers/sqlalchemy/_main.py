@@ -9,6 +9,12 @@ from pydantic_filters import (
     BaseSort,
     SortByOrder,
 )
+from pydantic_filters._tracing import (
+    get_pagination_attributes,
+    get_sort_attributes,
+    set_filter_attributes,
+    start_span,
+)
 
 from ._exceptions import AttributeNotFoundSaDriverError, SupportSaDriverError
 from ._mapping import filter_to_column_clauses, filter_to_join_targets
@@ -38,14 +44,18 @@ def append_filter_to_statement(
         RelationshipNotFoundSaDriverError:  Relationship not found
     """
 
-    join_targets = filter_to_join_targets(filter_, model)
+    with start_span("pydantic_filters.filter_to_join_targets") as span:
+        join_targets = filter_to_join_targets(filter_, model)
+        set_filter_attributes(span, filter_)
     for target in join_targets:
         statement = statement.join(
             target=target.target,
             onclause=target.on_clause,
         )
 
-    clauses = filter_to_column_clauses(filter_, model)
+    with start_span("pydantic_filters.filter_to_column_clauses") as span:
+        clauses = filter_to_column_clauses(filter_, model)
+        set_filter_attributes(span, filter_)
     if clauses:
         statement = statement.where(*clauses)
 
@@ -67,11 +77,12 @@ def append_pagination_to_statement(
         AttributeNotFoundSaDriverError: Attribute not found
     """
 
-    return (
-        statement
-        .limit(pagination.get_limit())
-        .offset(pagination.get_offset())
-    )
+    with start_span("pydantic_filters.append_pagination", lambda: get_pagination_attributes(pagination)):
+        return (
+            statement
+            .limit(pagination.get_limit())
+            .offset(pagination.get_offset())
+        )
 
 
 def append_sort_to_statement(
@@ -94,17 +105,18 @@ def append_sort_to_statement(
     if sort.sort_by is None:
         return statement
 
-    try:
-        column: sa.ColumnElement = getattr(model, str(sort.sort_by))
-    except AttributeError as e:
-        raise AttributeNotFoundSaDriverError(
-            f"{sort.__class__.__name__}.sort_by: "
-            f"Column {model.__name__}.{sort.sort_by} not found",
-        ) from e
-
-    return statement.order_by(
-        sa.desc(column) if sort.sort_by_order == SortByOrder.desc else sa.asc(column),
-    )
+    with start_span("pydantic_filters.append_sort", lambda: get_sort_attributes(sort)):
+        try:
+            column: sa.ColumnElement = getattr(model, str(sort.sort_by))
+        except AttributeError as e:
+            raise AttributeNotFoundSaDriverError(
+                f"{sort.__class__.__name__}.sort_by: "
+                f"Column {model.__name__}.{sort.sort_by} not found",
+            ) from e
+
+        return statement.order_by(
+            sa.desc(column) if sort.sort_by_order == SortByOrder.desc else sa.asc(column),
+        )
 
 
 def append_to_statement(
@@ -1,17 +1,26 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Tuple, Type, TypeVar, Union, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from pydantic_filters import BaseFilter
 
-from ._exceptions import AttributeNotFoundSaDriverError, RelationshipNotFoundSaDriverError
-from ._operators import get_filter_operator, get_search_operator
+from ._exceptions import AttributeNotFoundSaDriverError, RelationshipNotFoundSaDriverError, SupportSaDriverError
+from ._operators import (
+    get_filter_operator,
+    get_json_filter_operator,
+    get_json_search_operator,
+    get_search_operator,
+    is_array_filter_type,
+)
 
 _Filter = TypeVar("_Filter", bound=BaseFilter)
 _Model = TypeVar("_Model", bound=so.DeclarativeBase)
 
+JSON_PATH_SEPARATOR = "."
+"""Separator between the column name and the keys of the JSON path in targets"""
+
 
 @dataclass
 class JoinParams:
@@ -21,7 +30,7 @@ class JoinParams:
 
 def filter_to_column_clauses(
         filter_: _Filter,
-        model: Union[Type[_Model], so.util.AliasedClass],
+        model: Union[Type[_Model], so.util.AliasedClass, sa.FromClause],
 ) -> List[sa.ColumnExpressionArgument]:
     """Data from the filter to the list of expressions for SQLAlchemy
 
@@ -52,42 +61,26 @@ def filter_to_column_clauses(
     clauses = []
     included_items: Dict[str, Any] = filter_.model_dump(exclude_unset=True)
 
-    for key, filter_field_info in filter_.filter_fields.items():
+    for key in filter_.filter_fields:
         if key not in included_items:
             continue
 
-        try:
-            column: sa.ColumnElement = getattr(model, filter_field_info.target)
-        except AttributeError as e:
-            raise AttributeNotFoundSaDriverError(
-                f"{filter_.__class__.__name__}.{key}: "
-                f"Column {model.__name__}.{filter_field_info.target} not found",
-            ) from e
-
-        if isinstance(column.type, sa.ARRAY):
-            column = column.any_()
-
-        operator = get_filter_operator(filter_field_info.type)
         clauses.append(
-            operator(column, filter_field_info.is_sequence, included_items[key]),
+            _filter_field_to_clause(filter_, key, model, included_items[key]),
         )
 
     for key, search_field_info in filter_.search_fields.items():
         if key not in included_items:
             continue
 
-        operator = get_search_operator(search_field_info.type)
         search_clauses = []
 
         for t in search_field_info.target:
-            try:
-                column = getattr(model, str(t))
-            except AttributeError as e:
-                raise AttributeNotFoundSaDriverError(
-                    f"{filter_.__class__.__name__}.{key}: "
-                    f"Column {model.__name__}.{t} not found",
-                ) from e
-
+            column, path = _get_column(filter_, key, model, str(t))
+            operator = (
+                get_json_search_operator(search_field_info.type, path)
+                if path else get_search_operator(search_field_info.type)
+            )
             search_clauses.append(
                 operator(column, search_field_info.is_sequence, included_items[key]),
             )
@@ -99,14 +92,95 @@ def filter_to_column_clauses(
     return clauses
 
 
+def _filter_field_to_clause(
+        filter_: _Filter,
+        key: str,
+        model: Union[Type[_Model], so.util.AliasedClass, sa.FromClause],
+        value: Any,
+) -> sa.ColumnExpressionArgument:
+    filter_field_info = filter_.filter_fields[key]
+    column, path = _get_column(filter_, key, model, filter_field_info.target)
+
+    if path:
+        if is_array_filter_type(filter_field_info.type):
+            raise SupportSaDriverError(
+                f"{filter_.__class__.__name__}.{key}: "
+                f"Filter type {filter_field_info.type.value} is not supported for JSON paths",
+            )
+        operator = get_json_filter_operator(filter_field_info.type, path)
+    elif is_array_filter_type(filter_field_info.type):
+        if not isinstance(column.type, sa.ARRAY):
+            raise SupportSaDriverError(
+                f"{filter_.__class__.__name__}.{key}: "
+                f"Filter type {filter_field_info.type.value} requires an ARRAY column",
+            )
+        operator = get_filter_operator(filter_field_info.type)
+    else:
+        if isinstance(column.type, sa.ARRAY):
+            column = column.any_()
+        operator = get_filter_operator(filter_field_info.type)
+
+    return operator(column, filter_field_info.is_sequence, value)
+
+
+def _get_column(
+        filter_: _Filter,
+        key: str,
+        model: Union[Type[_Model], so.util.AliasedClass, sa.FromClause],
+        target: str,
+) -> Tuple[sa.ColumnElement, Tuple[str, ...]]:
+    """Get the column and the JSON path inside it by the target.
+    Core tables are accepted as well as models.
+
+    `name` -> Model.name, ()
+    `attrs.color` -> Model.attrs, ("color",)
+    """
+
+    name, *path = target.split(JSON_PATH_SEPARATOR)
+
+    try:
+        if isinstance(model, sa.FromClause):
+            # Attributes of the column collection, e.g. `keys`, would shadow the columns
+            column: sa.ColumnElement = model.c[name]
+        else:
+            column = getattr(model, name)
+    except (AttributeError, KeyError) as e:
+        model_name = model.description if isinstance(model, sa.FromClause) else model.__name__
+        raise AttributeNotFoundSaDriverError(
+            f"{filter_.__class__.__name__}.{key}: "
+            f"Column {model_name}.{name} not found",
+        ) from e
+
+    if path and not isinstance(column.type, sa.JSON):
+        raise SupportSaDriverError(
+            f"{filter_.__class__.__name__}.{key}: "
+            f"Target {target} requires a JSON column",
+        )
+
+    return column, tuple(path)
+
+
+def _adapt_column(
+        column: sa.ColumnElement,
+        entity: Union[Type[so.DeclarativeBase], so.util.AliasedClass],
+) -> sa.ColumnElement:
+    """Mapped column of the entity to its attribute, e.g. of the alias, other columns are kept"""
+
+    try:
+        prop = sa.inspect(entity).mapper.get_property_by_column(column)
+    except so.exc.UnmappedColumnError:
+        return column
+    return getattr(entity, prop.key)
+
+
 def filter_to_join_targets(
         filter_: _Filter,
-        model: Type[so.DeclarativeBase],
+        model: Union[Type[so.DeclarativeBase], so.util.AliasedClass],
 ) -> List[JoinParams]:
-    """Get targets to join"""
+    """Get targets to join, the nested targets are joined to the aliases of their parents"""
 
     targets = []
-    mapper: so.Mapper = sa.inspect(model)
+    mapper: so.Mapper = sa.inspect(model).mapper
 
     for field_name in filter_.nested_filters:
         nested_filter = getattr(filter_, field_name)
@@ -118,22 +192,17 @@ def filter_to_join_targets(
         except AttributeError as e:
             raise RelationshipNotFoundSaDriverError(
                 f"{filter_.__class__.__name__}.{field_name}: "
-                f"Relationship {model.__name__}.{field_name} not found",
+                f"Relationship {mapper.class_.__name__}.{field_name} not found",
             ) from e
 
         nested_class: Type[_Model] = relationship.entity.class_
         nested_class_aliased: so.util.AliasedClass = so.aliased(nested_class)
 
-        def replace_by_aliased(__c: sa.Column) -> sa.Column:
-            if __c.table is nested_class.__table__:
-                return getattr(nested_class_aliased, __c.key)
-            return __c
-
         clauses = cast(
             List[sa.ColumnExpressionArgument],
             [
-                replace_by_aliased(pair[0]) == replace_by_aliased(pair[1])
-                for pair in relationship.local_remote_pairs],
+                _adapt_column(local, model) == _adapt_column(remote, nested_class_aliased)
+                for local, remote in relationship.local_remote_pairs],
         )
         clauses.extend(
             filter_to_column_clauses(filter_=nested_filter, model=nested_class_aliased),
@@ -145,7 +214,7 @@ def filter_to_join_targets(
             ),
         )
 
-        nested_targets = filter_to_join_targets(filter_=nested_filter, model=nested_class)
+        nested_targets = filter_to_join_targets(filter_=nested_filter, model=nested_class_aliased)
         targets.extend(nested_targets)
 
     return targets
@@ -1,9 +1,13 @@
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
 
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.visitors import InternalTraversal
 from typing_extensions import TypeAlias
 
 from pydantic_filters import FilterType, SearchType
+from pydantic_filters.filter._range import get_range_bounds, merge_ranges
 
 ClauseOperator: TypeAlias = Callable[
     [sa.ColumnElement, bool, Any],
@@ -64,6 +68,128 @@ def _op_case_insensitive_search(
     )
 
 
+class _PostgresqlOperation(sa.ColumnElement):
+    """Comparison with a native (index-friendly) form for PostgreSQL
+    and a portable fallback for other dialects.
+    """
+
+    inherit_cache = True
+    type = sa.Boolean()
+
+    _traverse_internals = [
+        ("native", InternalTraversal.dp_clauseelement),
+        ("fallback", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, native: sa.ColumnElement, fallback: sa.ColumnElement) -> None:
+        self.native = native
+        self.fallback = fallback
+
+    def self_group(self, against: Any = None) -> "_PostgresqlOperation":  # noqa: ARG002
+        # Both forms are already comparisons, they don't need to be wrapped into `IS TRUE`
+        return self
+
+
+@compiles(_PostgresqlOperation)
+def _compile_postgresql_operation(element: _PostgresqlOperation, compiler: Any, **kw: Any) -> str:
+    return compiler.process(element.fallback, **kw)
+
+
+@compiles(_PostgresqlOperation, "postgresql")
+def _compile_postgresql_operation_postgresql(element: _PostgresqlOperation, compiler: Any, **kw: Any) -> str:
+    return compiler.process(element.native, **kw)
+
+
+def _array_values(is_sequence: bool, obj: Any) -> List[Any]:
+    return list(obj) if is_sequence else [obj]
+
+
+def _op_overlap(
+        column: sa.ColumnElement, is_sequence: bool, obj: Any,
+) -> sa.ColumnElement[bool]:
+    values = _array_values(is_sequence, obj)
+    return _PostgresqlOperation(
+        native=column.op("&&", is_comparison=True)(sa.literal(values, type_=column.type)),
+        fallback=sa.or_(sa.false(), *[column.any_() == v for v in values]).self_group(),
+    )
+
+
+def _op_contains(
+        column: sa.ColumnElement, is_sequence: bool, obj: Any,
+) -> sa.ColumnElement[bool]:
+    values = _array_values(is_sequence, obj)
+    return _PostgresqlOperation(
+        native=column.op("@>", is_comparison=True)(sa.literal(values, type_=column.type)),
+        fallback=sa.and_(sa.true(), *[column.any_() == v for v in values]).self_group(),
+    )
+
+
+def _op_range(
+        column: sa.ColumnElement, is_sequence: bool, obj: Any,
+) -> sa.ColumnElement[bool]:
+    clauses = []
+    for start, end in merge_ranges(obj if is_sequence else [obj]):
+        if start is not None and end is not None:
+            clauses.append(column.between(start, end))
+        elif start is not None:
+            clauses.append(column >= start)
+        elif end is not None:
+            clauses.append(column <= end)
+        else:
+            clauses.append(sa.true())
+
+    return sa.or_(sa.false(), *clauses)
+
+
+_json_accessors: Tuple[Tuple[type, str], ...] = (
+    (bool, "as_boolean"),
+    (int, "as_integer"),
+    (float, "as_float"),
+)
+
+
+def _json_path_index(column: sa.ColumnElement, path: Tuple[str, ...]) -> sa.ColumnElement:
+    return column[path[0]] if len(path) == 1 else column[path]
+
+
+def _json_path_element(
+        column: sa.ColumnElement, path: Tuple[str, ...], type_: FilterType, is_sequence: bool, obj: Any,
+) -> sa.ColumnElement:
+    """Extract the value by the path, cast according to the type of the compared object"""
+
+    element = _json_path_index(column, path)
+
+    sample = next(iter(obj), None) if is_sequence else obj
+    if type_ == FilterType.range and sample is not None:
+        sample = next((b for b in get_range_bounds(sample) if b is not None), None)
+
+    for sample_type, accessor in _json_accessors:
+        if isinstance(sample, sample_type):
+            return getattr(element, accessor)()
+
+    return element.as_string()
+
+
+def _json_document(path: Tuple[str, ...], obj: Any) -> Dict[str, Any]:
+    """('a', 'b'), 1 -> {"a": {"b": 1}}"""
+
+    document = obj
+    for key in reversed(path):
+        document = {key: document}
+    return document
+
+
+def _op_json_containment(
+        column: sa.ColumnElement, path: Tuple[str, ...], is_sequence: bool, obj: Any,
+) -> sa.ColumnElement[bool]:
+    if is_sequence:
+        documents = [_json_document(path, o) for o in obj]
+        return column.op("@>", is_comparison=True)(
+            sa.any_(sa.literal(documents, type_=postgresql.ARRAY(column.type))),
+        )
+    return column.op("@>", is_comparison=True)(sa.literal(_json_document(path, obj), type_=column.type))
+
+
 _filter_type_to_operator_map: Dict[FilterType, ClauseOperator] = {
     FilterType.eq: _op_eq,
     FilterType.ne: _op_ne,
@@ -74,8 +200,16 @@ _filter_type_to_operator_map: Dict[FilterType, ClauseOperator] = {
     FilterType.like: _op_from_method("like"),
     FilterType.ilike: _op_from_method("ilike"),
     FilterType.null: _op_null,
+    FilterType.overlap: _op_overlap,
+    FilterType.contains: _op_contains,
+    FilterType.range: _op_range,
 }
 
+_array_filter_types: FrozenSet[FilterType] = frozenset({
+    FilterType.overlap,
+    FilterType.contains,
+})
+
 _search_type_to_operator_map: Dict[SearchType, ClauseOperator] = {
     SearchType.case_sensitive: _op_case_sensitive_search,
     SearchType.case_insensitive: _op_case_insensitive_search,
@@ -88,3 +222,51 @@ def get_filter_operator(type_: FilterType) -> ClauseOperator:
 
 def get_search_operator(type_: SearchType) -> ClauseOperator:
     return _search_type_to_operator_map[type_]
+
+
+def is_array_filter_type(type_: FilterType) -> bool:
+    """Filter types that compare the whole array column instead of its elements."""
+    return type_ in _array_filter_types
+
+
+def get_json_filter_operator(type_: FilterType, path: Tuple[str, ...]) -> ClauseOperator:
+    """Operator for the value inside a JSON column.
+
+    Equality on a `JSONB` column is compiled to a containment (`@>`) on PostgreSQL,
+    which can use a GIN index.
+    """
+
+    operator = get_filter_operator(type_)
+
+    def _op(
+            column: sa.ColumnElement,
+            is_sequence: bool,
+            obj: Any,
+    ) -> sa.ColumnElement[bool]:
+        if type_ == FilterType.null:
+            return operator(_json_path_index(column, path).as_string(), is_sequence, obj)
+
+        clause = operator(_json_path_element(column, path, type_, is_sequence, obj), is_sequence, obj)
+        if type_ == FilterType.eq and isinstance(column.type, postgresql.JSONB):
+            return _PostgresqlOperation(
+                native=_op_json_containment(column, path, is_sequence, obj),
+                fallback=clause,
+            )
+        return clause
+
+    return _op
+
+
+def get_json_search_operator(type_: SearchType, path: Tuple[str, ...]) -> ClauseOperator:
+    """Operator for the text inside a JSON column."""
+
+    operator = get_search_operator(type_)
+
+    def _op(
+            column: sa.ColumnElement,
+            is_sequence: bool,
+            obj: Any,
+    ) -> sa.ColumnElement[bool]:
+        return operator(_json_path_index(column, path).as_string(), is_sequence, obj)
+
+    return _op
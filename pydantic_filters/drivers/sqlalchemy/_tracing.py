@@ -0,0 +1,92 @@
+from typing import Any, ContextManager, List, Optional, Tuple, Union
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pydantic_filters._tracing import Span, start_span
+
+_SPANS_KEY = "pydantic_filters.spans"
+"""Key of the open spans in the info of the connection"""
+
+_Spans = List[Tuple[str, ContextManager[Span]]]
+
+
+def _open(connection: sa.Connection, kind: str, span: ContextManager[Span]) -> None:
+    span.__enter__()
+    connection.info.setdefault(_SPANS_KEY, []).append((kind, span))
+
+
+def _close(connection: sa.Connection, kind: Optional[str] = None, error: Optional[BaseException] = None) -> None:
+    """Close the open spans of the kind, or all of them, the latest first"""
+
+    spans: _Spans = connection.info.get(_SPANS_KEY, [])
+    while spans and (kind is None or spans[-1][0] == kind):
+        _, span = spans.pop()
+        if error is None:
+            span.__exit__(None, None, None)
+        else:
+            span.__exit__(type(error), error, error.__traceback__)
+
+
+def _before_execute(connection: sa.Connection, *args: Any) -> None:  # noqa: ANN401, ARG001
+    # Spans left open by the execution failed before the cursor call
+    _close(connection)
+    _open(connection, "compile", start_span(
+        "pydantic_filters.compile",
+        lambda: {"db.system": connection.dialect.name},
+    ))
+
+
+def _before_cursor_execute(connection: sa.Connection, cursor: Any, statement: str, *args: Any) -> None:  # noqa: ANN401, ARG001
+    _close(connection, "compile")
+    _open(connection, "execute", start_span(
+        "pydantic_filters.execute",
+        lambda: {"db.system": connection.dialect.name, "db.statement": statement},
+    ))
+
+
+def _after_cursor_execute(connection: sa.Connection, *args: Any) -> None:  # noqa: ANN401, ARG001
+    _close(connection, "execute")
+
+
+def _after_execute(connection: sa.Connection, *args: Any) -> None:  # noqa: ANN401, ARG001
+    _close(connection)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    if context.connection is not None:
+        _close(context.connection, error=context.original_exception)
+
+
+_listeners = (
+    ("before_execute", _before_execute),
+    ("before_cursor_execute", _before_cursor_execute),
+    ("after_cursor_execute", _after_cursor_execute),
+    ("after_execute", _after_execute),
+    ("handle_error", _handle_error),
+)
+
+
+def instrument_engine(engine: Union[sa.Engine, AsyncEngine]) -> None:
+    """
+    Trace the statements executed by the engine with the tracer set by `set_tracer`:
+    `pydantic_filters.compile` from the start of the execution to the cursor call,
+    which is the compilation of the statement or its lookup in the cache,
+    and `pydantic_filters.execute` for the cursor call, with the `db.statement` attribute.
+    Calling it again for the same engine does nothing.
+
+    **Example**
+
+    >>> engine = create_async_engine("postgresql+asyncpg://...")
+    >>> instrument_engine(engine)
+
+    Args:
+        engine: Engine or async engine.
+    """
+
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    for identifier, listener in _listeners:
+        if not event.contains(sync_engine, identifier, listener):
+            event.listen(sync_engine, identifier, listener)
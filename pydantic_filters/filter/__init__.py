@@ -1,9 +1,11 @@
 from ._base import BaseFilter
+from ._compact import CompactSequence
 from ._config import FilterConfigDict
 from ._fields import (
     FilterField,
     SearchField,
 )
+from ._range import Range
 from ._types import (
     FilterType,
     FilterTypeLiteral,
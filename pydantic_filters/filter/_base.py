@@ -45,6 +45,7 @@ class BaseFilter(BaseModel, metaclass=FilterMetaclass):
         default_search_type=SearchType.case_insensitive,
         suffixes_map=get_suffixes_map(),
         sequence_types=(list, set),
+        compact_sequences=False,
     )
     """
     Configuration for the model, should be a dictionary conforming to
@@ -0,0 +1,122 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema, core_schema
+
+
+def _has_int_items(schema: CoreSchema) -> bool:
+    """`List[int]`, `Optional[Set[int]]`, etc."""
+
+    if schema["type"] in {"nullable", "default"}:
+        return _has_int_items(schema["schema"])
+    items = schema.get("items_schema")
+    return items is not None and items["type"] == "int"
+
+
+@dataclass(frozen=True)
+class CompactSequence:
+    """
+    Compact encoding of the sequence values: the strings are split by the separator before
+    the validation of the elements, `id=1,2,3` is the same as `id=1&id=2&id=3`.
+    For the integer elements the ranges are expanded, `id=1-3` is the same as `id=1,2,3`.
+
+    Applied to the sequence fields by the
+    [`compact_sequences`][pydantic_filters.FilterConfigDict.compact_sequences] option
+    or by `FilterField(compact=True)`, or directly as the annotation metadata.
+
+    **Example**
+
+    >>> class UserFilter(BaseFilter):
+    ...     id: Annotated[List[int], CompactSequence()]
+    ...
+    >>> UserFilter(id=["1-3,7", "9"])
+    UserFilter(id=[1, 2, 3, 7, 9])
+    """
+
+    separator: str = ","
+    """Separator between the elements"""
+
+    ranges: bool = True
+    """Expand `start-end` ranges of the integer elements, both bounds are inclusive"""
+
+    max_items: int = 10_000
+    """Maximum number of the elements expanded from the ranges, the other elements are not limited"""
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:  # noqa: ANN401
+        schema = handler(source)
+        return core_schema.no_info_before_validator_function(
+            self._split_ranges if self.ranges and _has_int_items(schema) else self._split,
+            schema,
+        )
+
+    def __get_pydantic_json_schema__(self, schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        json_schema = handler(schema)
+        _add_items_alternative(handler.resolve_ref_schema(json_schema), self)
+        return json_schema
+
+    def _pattern(self, items: Dict[str, Any]) -> str:
+        separator = re.escape(self.separator)
+        if self.ranges and items.get("type") == "integer":
+            item = r"-?\d+(?:--?\d+)?"
+            return f"^{item}(?:{separator}{item})*$"
+        return f"^.*{separator}.*$"
+
+    def _split(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, str):
+            value = [value]
+        elif not isinstance(value, (list, tuple)):
+            return value
+
+        separator = self.separator
+        items: List[Any] = []
+        for item in value:
+            if isinstance(item, str) and separator in item:
+                items.extend(item.split(separator))
+            else:
+                items.append(item)
+
+        return items
+
+    def _split_ranges(self, value: Any) -> Any:  # noqa: ANN401
+        items = self._split(value)
+        if not isinstance(items, list):
+            return items
+
+        result: List[Any] = []
+        expanded = 0
+        for item in items:
+            # The first character is skipped, it is the sign of the start
+            i = item.find("-", 1) if isinstance(item, str) else -1
+            if i < 0:
+                result.append(item)
+                continue
+
+            try:
+                start, end = int(item[:i]), int(item[i + 1:])
+            except ValueError:
+                # Validation of the element fails with the usual error
+                result.append(item)
+                continue
+
+            if start > end:
+                raise ValueError(f"Range {item!r} is empty")
+            expanded += end - start + 1
+            if expanded > self.max_items:
+                raise ValueError(f"Ranges expand to too many items, no more than {self.max_items} are allowed")
+            result.extend(range(start, end + 1))
+
+        return result
+
+
+def _add_items_alternative(json_schema: Dict[str, Any], compact: CompactSequence) -> None:
+    """Let the elements of the array be encoded as the string, `Optional` arrays included"""
+
+    items = json_schema.get("items")
+    if items is not None:
+        json_schema["items"] = {"anyOf": [items, {"type": "string", "pattern": compact._pattern(items)}]}
+        return
+    for variant in json_schema.get("anyOf", []):
+        _add_items_alternative(variant, compact)
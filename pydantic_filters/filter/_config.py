@@ -32,3 +32,11 @@ class FilterConfigDict(ConfigDict, total=False):
 
     sequence_types: Tuple[Type, ...]
     """Types that are considered sequences"""
+
+    compact_sequences: bool
+    """
+    Accept the compact encoding of the sequence filter fields:
+    comma-separated values (`id=1,2,3`) and the ranges of integers (`id=1-500`),
+    see [`CompactSequence`][pydantic_filters.CompactSequence].
+    Can be overridden per field by `FilterField(compact=...)`.
+    """
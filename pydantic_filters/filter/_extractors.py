@@ -4,11 +4,13 @@ from pydantic.fields import Field, FieldInfo
 from pydantic_core import PydanticUndefined
 
 from .._types import Annotation, NoneType
+from ._compact import CompactSequence
 from ._fields import FilterFieldInfo, SearchFieldInfo
+from ._types import FilterType
 
 if TYPE_CHECKING:
     from ._base import BaseFilter
-    from ._types import FilterType, SearchType
+    from ._types import SearchType
 
 
 class NestedFilterExtractor:
@@ -89,11 +91,13 @@ class FilterFieldExtractor:
             default_filter_type: "FilterType",
             sequence_types: Tuple[Type, ...],
             type_definer: Callable[[str], Tuple[str, "FilterType"]],
+            compact_sequences: bool = False,
     ) -> None:
         self.optional = optional
         self.default_filter_type = default_filter_type
         self.sequence_types = sequence_types
         self.type_definer = type_definer
+        self.compact_sequences = compact_sequences
 
     def __call__(
             self,
@@ -106,17 +110,21 @@ class FilterFieldExtractor:
         if not isinstance(field_info.default, FilterFieldInfo):
             defaults_dict_to_override = _get_defaults_dict_to_override(field_info, optional=self.optional)
             computed_name, computed_type = self.type_definer(field_name)
+            filter_field = FilterFieldInfo(
+                target=computed_name,
+                type_=computed_type,
+                is_sequence=_is_sequence(field_info.annotation, self.sequence_types),
+            )
 
             return (
-                FieldInfo.merge_field_infos(
-                    field_info,
-                    **defaults_dict_to_override,
-                ),
-                FilterFieldInfo(
-                    target=computed_name,
-                    type_=computed_type,
-                    is_sequence=_is_sequence(field_info.annotation, self.sequence_types),
+                self._add_compact(
+                    FieldInfo.merge_field_infos(
+                        field_info,
+                        **defaults_dict_to_override,
+                    ),
+                    filter_field,
                 ),
+                filter_field,
             )
 
         # when `a: int = FilterField(...)`
@@ -137,14 +145,32 @@ class FilterFieldExtractor:
         defaults_dict_to_override = _get_defaults_dict_to_override(field_info_from_filter, optional=self.optional)
 
         return (
-            FieldInfo.merge_field_infos(
-                field_info,
-                field_info_from_filter,
-                **defaults_dict_to_override,
+            self._add_compact(
+                FieldInfo.merge_field_infos(
+                    field_info,
+                    field_info_from_filter,
+                    **defaults_dict_to_override,
+                ),
+                filter_field,
             ),
             filter_field,
         )
 
+    def _add_compact(self, field_info: FieldInfo, filter_field: FilterFieldInfo) -> FieldInfo:
+        """Split the compact encoding of the sequence before the validation of the elements"""
+
+        compact = self.compact_sequences if filter_field.compact is None else filter_field.compact
+        if not compact or filter_field.type == FilterType.range:
+            return field_info
+        if not filter_field.is_sequence:
+            if filter_field.compact:
+                raise ValueError(f"Compact encoding requires a sequence field, got {field_info.annotation}")
+            return field_info
+
+        if not any(isinstance(m, CompactSequence) for m in field_info.metadata):
+            field_info.metadata.append(CompactSequence())
+        return field_info
+
 
 def is_filter_subclass(type_: Annotation) -> bool:
     from pydantic_filters.filter._base import BaseFilter  # noqa: PLC0415
@@ -69,6 +69,9 @@ class FilterFieldInfo(BaseField):
         target: Target for filtering.
         type_: Filter type.
         is_sequence: Is the field annotated as sequence.
+        compact: Accept the compact encoding of the sequence,
+            see [`compact_sequences`][pydantic_filters.FilterConfigDict.compact_sequences].
+            `None` means the filter configuration is used.
         field_kwargs: Other arguments to pass to pydantic.Field.
     """
 
@@ -76,6 +79,7 @@ class FilterFieldInfo(BaseField):
         "target",
         "type",
         "is_sequence",
+        "compact",
     )
 
     def __init__(
@@ -84,11 +88,13 @@ class FilterFieldInfo(BaseField):
             target: Optional[str] = None,
             type_: Optional[FilterType] = None,
             is_sequence: Optional[bool] = None,
+            compact: Optional[bool] = None,
             field_kwargs: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.target = target
         self.type = type_
         self.is_sequence = is_sequence
+        self.compact = compact
         super().__init__(
             field_kwargs=field_kwargs,
         )
@@ -143,6 +149,7 @@ def FilterField(  # noqa: N802
         *,
         target: Optional[str] = None,
         type_: Union[FilterTypeLiteral, FilterType, None] = None,
+        compact: Optional[bool] = None,
         **field_kwargs: Any,  # noqa: ANN003
 ) -> FilterFieldInfo:
     """
@@ -154,6 +161,8 @@ def FilterField(  # noqa: N802
         default: Default value to be passed to pydantic.Field.
         target: Target for filtering.
         type_: Filter type.
+        compact: Accept the compact encoding of the sequence (`1,2,3`, `1-500`),
+            the filter configuration is used by default.
         **field_kwargs: Other arguments to pass to pydantic.Field.
     """
 
@@ -164,6 +173,7 @@ def FilterField(  # noqa: N802
     return FilterFieldInfo(
         type_=type_,
         target=target,
+        compact=compact,
         field_kwargs=field_kwargs,
     )
 
@@ -50,6 +50,7 @@ class FilterMetaclass(ModelMetaclass):
             optional=model_config["optional"],
             default_filter_type=model_config["default_filter_type"],
             sequence_types=model_config["sequence_types"],
+            compact_sequences=model_config["compact_sequences"],
             type_definer=FilterTypeDefiner(
                 delimiter=model_config["delimiter"],
                 default=model_config["default_filter_type"],
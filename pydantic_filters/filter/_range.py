@@ -0,0 +1,85 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Generic, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+
+_T = TypeVar("_T")
+
+RangeBounds = Tuple[Optional[Any], Optional[Any]]
+
+
+class Range(BaseModel, Generic[_T]):
+    """
+    Value of the [`FilterType.range`][pydantic_filters.FilterType.range] filter.
+    Both bounds are inclusive, `None` means the range is unbounded on this side.
+
+    A two-element tuple `(start, end)` can be used instead.
+    """
+
+    start: Optional[_T] = None
+    """Lower bound"""
+
+    end: Optional[_T] = None
+    """Upper bound"""
+
+
+def get_range_bounds(obj: Union[Range, Mapping[str, Any], RangeBounds]) -> RangeBounds:
+    """
+    Range(start=1, end=2) -> (1, 2)
+    {"start": 1, "end": 2} -> (1, 2)
+    (1, 2) -> (1, 2)
+    """
+    if isinstance(obj, Range):
+        return obj.start, obj.end
+    if isinstance(obj, Mapping):
+        return obj.get("start"), obj.get("end")
+
+    start, end = obj
+    return start, end
+
+
+def _successor(value: Any) -> Any:  # noqa: ANN401
+    """The next value for discrete types, so that [1, 2] and [3, 4] are adjacent"""
+
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return value + 1
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value + timedelta(days=1)
+    return value
+
+
+def merge_ranges(ranges: Iterable[Union[Range, Mapping[str, Any], RangeBounds]]) -> List[RangeBounds]:
+    """
+    Sort ranges and merge the overlapping and adjacent ones.
+    Empty ranges (`start > end`) are dropped.
+
+    **Example**
+
+    >>> merge_ranges([(5, 7), (1, 2), (3, 4), (10, None)])
+    [(1, 7), (10, None)]
+    """
+
+    bounds = sorted(
+        (get_range_bounds(r) for r in ranges),
+        # `None` is the lowest possible start
+        key=lambda b: (False, 0) if b[0] is None else (True, b[0]),
+    )
+
+    merged: List[RangeBounds] = []
+    for start, end in bounds:
+        if start is not None and end is not None and start > end:
+            continue
+
+        if merged:
+            last_start, last_end = merged[-1]
+            if last_end is None:
+                break
+            if start is None or start <= _successor(last_end):
+                merged[-1] = (last_start, None if end is None else max(last_end, end))
+                continue
+
+        merged.append((start, end))
+
+    return merged
@@ -26,6 +26,12 @@ class FilterType(str, Enum):
     """Case-sensitive matching"""
     ilike = "ilike"
     """Case-insensitive matching"""
+    overlap = "overlap"
+    """Array has at least one of the values"""
+    contains = "contains"
+    """Array has all the values"""
+    range = "range"
+    """Between the bounds, see [`Range`][pydantic_filters.Range]"""
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}.{self.value}"
@@ -55,6 +61,9 @@ FilterTypeLiteral: TypeAlias = Literal[
     "le",
     "like",
     "ilike",
+    "overlap",
+    "contains",
+    "range",
 ]
 """
 Literal alias for [`FilterType`][pydantic_filters.filter._types.FilterType]
@@ -85,6 +94,12 @@ _suffixes_map: Dict[str, FilterType] = {
     "like": FilterType.like,
     "il": FilterType.ilike,
     "ilike": FilterType.ilike,
+    "ov": FilterType.overlap,
+    "overlap": FilterType.overlap,
+    "ct": FilterType.contains,
+    "contains": FilterType.contains,
+    "range": FilterType.range,
+    "between": FilterType.range,
 }
 
 
@@ -1 +1,12 @@
-from . import fastapi
+from importlib import import_module
+from typing import Any
+
+from . import querystring
+
+
+def __getattr__(name: str) -> Any:
+    """`fastapi` is imported on the first access, so `querystring` does not require FastAPI"""
+
+    if name == "fastapi":
+        return import_module(f"{__name__}.fastapi")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
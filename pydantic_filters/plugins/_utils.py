@@ -1,13 +1,26 @@
+from copy import deepcopy
+from functools import cached_property, lru_cache
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple, Type, TypeVar
 
+from pydantic import BaseModel, ConfigDict, create_model
+
+from pydantic_filters._tracing import set_filter_attributes, start_span
 from pydantic_filters.filter._base import BaseFilter
+from pydantic_filters.filter._extractors import _is_sequence
+from pydantic_filters.pagination import BasePagination
+from pydantic_filters.sort import BaseSort
 
 if TYPE_CHECKING:
     from pydantic.fields import FieldInfo
 
 _T = TypeVar("_T")
 _Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+
+_sequence_types: Tuple[Type, ...] = (list, set, tuple, frozenset)
+"""Sequence types of the fields collected from the repeated keys, as FastAPI does by the annotations"""
 
 
 def add_prefix(item: str, prefix: str, delimiter: str) -> str:
@@ -27,12 +40,15 @@ def remove_prefix(item: str, prefix: str, delimiter: str) -> str:
     return item
 
 
+@lru_cache(maxsize=1024)
 def squash_filter(
         filter_: Type[_Filter],
         prefix: str,
         delimiter: str,
 ) -> Dict[str, "FieldInfo"]:
     """
+    The result is cached per filter class, prefix and delimiter, it must not be modified.
+
     **Example:**
 
     >>> class DeepNestedFilter(BaseFilter):
@@ -65,6 +81,80 @@ def squash_filter(
     return squashed
 
 
+def create_flat_model(
+        name: str,
+        fields: Dict[str, "FieldInfo"],
+) -> Type[BaseModel]:
+    """Model with the given fields, the field infos are copied"""
+
+    return create_model(
+        name,
+        __config__=ConfigDict(populate_by_name=True),
+        **{
+            key: (field_info.annotation, deepcopy(field_info))
+            for key, field_info in fields.items()
+        },
+    )
+
+
+@lru_cache(maxsize=1024)
+def flat_filter_model(
+        filter_: Type[_Filter],
+        prefix: str,
+        delimiter: str,
+) -> Type[BaseModel]:
+    """
+    Model with the fields of `squash_filter`, validating all of them in a single call.
+    The model is created once per filter class, prefix and delimiter.
+
+    **Example:**
+
+    >>> class NestedFilter(BaseFilter):
+    ...    c: int
+    >>> class MyFilter(BaseFilter):
+    ...    a: int
+    ...    b: NestedFilter
+    >>> flat_filter_model(MyFilter, "", "__").model_validate({"a": "1", "b__c": "2"})
+    MyFilterFlat(a=1, b__c=2)
+    """
+
+    return create_flat_model(f"{filter_.__name__}Flat", squash_filter(filter_, prefix, delimiter))
+
+
+_Path = Tuple[str, ...]
+"""Names of the nested filter fields from the root filter"""
+
+
+class _Routing(NamedTuple):
+    routes: Dict[str, Tuple[_Path, str]]
+    """Squashed key to the path of the nested filter and the field name in it"""
+
+    nested: Tuple[Tuple[_Path, Type[BaseFilter]], ...]
+    """Paths of the nested filters with their classes, the deepest first"""
+
+
+@lru_cache(maxsize=1024)
+def _get_routing(
+        filter_: Type[_Filter],
+        prefix: str,
+        delimiter: str,
+) -> _Routing:
+    routes: Dict[str, Tuple[_Path, str]] = {}
+    nested: List[Tuple[_Path, Type[BaseFilter]]] = []
+
+    def _walk(cls: Type[BaseFilter], path: _Path, key_prefix: str) -> None:
+        for key in chain(cls.filter_fields, cls.search_fields):
+            routes[add_prefix(key, key_prefix, delimiter)] = path, key
+        for key, nested_filter in cls.nested_filters.items():
+            nested_path = (*path, key)
+            nested.append((nested_path, nested_filter))
+            _walk(nested_filter, nested_path, add_prefix(key, key_prefix, delimiter))
+
+    _walk(filter_, (), prefix)
+    nested.sort(key=lambda item: len(item[0]), reverse=True)
+    return _Routing(routes, tuple(nested))
+
+
 def inflate_filter(
         filter_: Type[_Filter],
         prefix: str,
@@ -72,6 +162,9 @@ def inflate_filter(
         data: Dict[str, Any],
 ) -> _Filter:
     """
+    Keys are routed by the table precomputed once per filter class, prefix and delimiter,
+    unknown keys are ignored. With the prefix the keys without it are accepted too, as by `remove_prefix`.
+
     **Example:**
 
     >>> class DeepNestedFilter(BaseFilter):
@@ -86,34 +179,142 @@ def inflate_filter(
     MyFilter(a=1, b=NestedFilter(c=2, d=DeepNestedFilter(e=3)))
     """
 
-    to_construct: Dict[str, Any] = {}
-    nested_kwargs: Dict[str, Any] = {}
-    for k, v in data.items():
-        if v is None:
-            continue
-
-        k_without_prefix = remove_prefix(k, prefix, delimiter)
-        if k_without_prefix in filter_.filter_fields.keys() | filter_.search_fields.keys():
-            to_construct[k_without_prefix] = v
-        else:
-            nested_kwargs[k_without_prefix] = v
-
-    for field_name, nested_filter in filter_.nested_filters.items():
-        nested = inflate_filter(
-            filter_=nested_filter,
-            prefix=field_name,
-            delimiter=delimiter,
-            data={
-                k: v
-                for k, v in nested_kwargs.items()
-                if k.startswith(field_name)
-            },
+    with start_span("pydantic_filters.inflate_filter") as span:
+        routing = _get_routing(filter_, prefix, delimiter)
+
+        to_construct: Dict[_Path, Dict[str, Any]] = {}
+        for k, v in data.items():
+            if v is None:
+                continue
+
+            route = routing.routes.get(k)
+            if route is None and prefix:
+                route = routing.routes.get(add_prefix(k, prefix, delimiter))
+            if route is None:
+                continue
+
+            path, key = route
+            to_construct.setdefault(path, {})[key] = v
+
+        # Nested filters without data are skipped,
+        # the deepest ones are constructed first to be set into their parents
+        if len(to_construct) > 1 or () not in to_construct:
+            for path, nested_filter in routing.nested:
+                kwargs = to_construct.get(path)
+                if kwargs is not None:
+                    to_construct.setdefault(path[:-1], {})[path[-1]] = nested_filter.model_construct(**kwargs)
+
+        result = filter_.model_construct(**to_construct.get((), {}))
+        set_filter_attributes(span, result)
+        return result
+
+
+class ListParams(NamedTuple):
+    """Filter, sort and pagination of the list route, resolved together."""
+
+    filter: Optional[BaseFilter]
+    """Filter object, `None` if the filter class is not specified"""
+
+    sort: Optional[BaseSort]
+    """Sort object, `None` if the sort class is not specified"""
+
+    pagination: Optional[BasePagination]
+    """Pagination object, `None` if the pagination class is not specified"""
+
+
+class ListParamsBuilder:
+    """Flattened fields of the filter, sort and pagination classes, and their assembling back"""
+
+    def __init__(
+            self,
+            filter_: Optional[Type[_Filter]],
+            sort: Optional[Type[_Sort]],
+            pagination: Optional[Type[_Pagination]],
+            prefix: str,
+            delimiter: str,
+    ) -> None:
+        self.filter_ = filter_
+        self.sort = sort
+        self.pagination = pagination
+        self.prefix = prefix
+        self.delimiter = delimiter
+
+        self.filter_fields = {} if filter_ is None else squash_filter(filter_, prefix, delimiter)
+        self.sort_fields = {} if sort is None else sort.model_fields
+        self.pagination_fields = {} if pagination is None else pagination.model_fields
+
+        keys = [*self.filter_fields, *self.sort_fields, *self.pagination_fields]
+        duplicates = sorted({k for k in keys if keys.count(k) > 1})
+        if duplicates:
+            raise ValueError(f"Query parameters {', '.join(duplicates)} are declared by several models")
+
+        self.fields: Dict[str, "FieldInfo"] = {**self.filter_fields, **self.sort_fields, **self.pagination_fields}
+
+    @cached_property
+    def model(self) -> Type[BaseModel]:
+        """Flattened model of all the classes"""
+
+        name = "".join(m.__name__ for m in (self.filter_, self.sort, self.pagination) if m is not None)
+        return create_flat_model(f"{name}Flat", self.fields)
+
+    @cached_property
+    def sequence_keys(self) -> FrozenSet[str]:
+        """Keys of the sequence fields, e.g. of the tuples of the range filters"""
+
+        keys = {
+            key for key, field_info in self.fields.items()
+            if _is_sequence(field_info.annotation, sequence_types=_sequence_types)
+        }
+        if self.filter_ is not None:
+            # The sequence types of the filter config may be not in `_sequence_types`
+            routing = _get_routing(self.filter_, self.prefix, self.delimiter)
+            classes = dict(routing.nested)
+            classes[()] = self.filter_
+            for flat_key, (path, key) in routing.routes.items():
+                cls = classes[path]
+                info = cls.filter_fields.get(key) or cls.search_fields[key]
+                if info.is_sequence:
+                    keys.add(flat_key)
+
+        return frozenset(keys)
+
+    def build(self, data: Mapping[str, Any]) -> ListParams:
+        """Assemble the objects from the validated flat data, missing keys are not set"""
+
+        return ListParams(
+            filter=None if self.filter_ is None else inflate_filter(
+                filter_=self.filter_,
+                prefix=self.prefix,
+                delimiter=self.delimiter,
+                data={k: data[k] for k in self.filter_fields if k in data},
+            ),
+            sort=None if self.sort is None else self.sort.model_construct(
+                **{k: data[k] for k in self.sort_fields if k in data},
+            ),
+            pagination=None if self.pagination is None else self.pagination.model_construct(
+                **{k: data[k] for k in self.pagination_fields if k in data},
+            ),
         )
 
-        # skip if nested data is empty
-        if not nested.model_dump(exclude_unset=True):
-            continue
+    def build_from_model(self, validated: BaseModel) -> ListParams:
+        """Assemble the objects from the instance of the flattened model"""
+
+        return self.build({k: getattr(validated, k) for k in validated.model_fields_set})
+
+
+@lru_cache(maxsize=1024)
+def get_list_params_builder(
+        filter_: Optional[Type[_Filter]],
+        sort: Optional[Type[_Sort]],
+        pagination: Optional[Type[_Pagination]],
+        prefix: str,
+        delimiter: str,
+) -> ListParamsBuilder:
+    """
+    Builder created once per set of classes, prefix and delimiter.
 
-        to_construct[field_name] = nested
+    Raises:
+        ValueError: The same query parameter is declared by several classes.
+    """
 
-    return filter_.model_construct(**to_construct)
+    return ListParamsBuilder(filter_, sort, pagination, prefix, delimiter)
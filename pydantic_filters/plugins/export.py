@@ -0,0 +1,295 @@
+import csv
+import io
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+from urllib.parse import quote
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing_extensions import Literal
+
+_T = TypeVar("_T")
+
+ExportFormat = Literal["ndjson", "csv"]
+"""
+- `ndjson` - a JSON object per line, `application/x-ndjson`
+- `csv` - the header and a row per line, `text/csv`
+"""
+
+SessionSource = Union[so.Session, AsyncSession, so.sessionmaker, async_sessionmaker]
+"""
+Session to execute the statement in, or the factory to open the session
+for the duration of the streaming
+"""
+
+_Batch = List[Dict[str, Any]]
+
+_media_types: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _get_keys(statement: sa.Select[Any]) -> List[str]:
+    """Keys of the rows converted by `_get_converter`, known before the statement is executed"""
+
+    descriptions = statement.column_descriptions
+    if len(descriptions) == 1:
+        info = sa.inspect(descriptions[0]["expr"], raiseerr=False)
+        if getattr(info, "is_mapper", False) or getattr(info, "is_aliased_class", False):
+            return [attr.key for attr in info.mapper.column_attrs]
+    return [d["name"] for d in descriptions]
+
+
+def _get_converter(keys: Sequence[str], first: sa.Row) -> Callable[[sa.Row], Dict[str, Any]]:
+    """Rows of a single ORM entity are serialized by its column attributes"""
+
+    mapper = getattr(first[0], "__mapper__", None) if len(first) == 1 else None
+    if mapper is not None:
+        attributes = [attr.key for attr in mapper.column_attrs]
+        return lambda row: {k: getattr(row[0], k) for k in attributes}
+
+    keys = list(keys)
+    return lambda row: dict(zip(keys, row))
+
+
+@contextmanager
+def _open_session(source: Union[so.Session, so.sessionmaker]) -> Iterator[so.Session]:
+    if isinstance(source, so.Session):
+        yield source
+        return
+    with source() as session:
+        yield session
+
+
+@asynccontextmanager
+async def _open_async_session(source: Union[AsyncSession, async_sessionmaker]) -> AsyncIterator[AsyncSession]:
+    if isinstance(source, AsyncSession):
+        yield source
+        return
+    async with source() as session:
+        yield session
+
+
+def iter_batches(
+        session: Union[so.Session, so.sessionmaker],
+        statement: sa.Select[_T],
+        *,
+        batch_size: int = 1000,
+) -> Iterator[_Batch]:
+    """
+    Execute the statement with a server-side cursor and yield the rows by batches of dicts.
+    Only a single batch is held in memory.
+
+    Args:
+        session: Session or the factory of the sessions.
+        statement: Select statement, e.g. with the filter and the sort appended.
+        batch_size: Number of rows fetched from the cursor at once.
+    """
+
+    with _open_session(session) as s:
+        result = s.execute(statement, execution_options={"stream_results": True, "yield_per": batch_size})
+        convert = None
+        try:
+            for partition in result.partitions():
+                if convert is None:
+                    convert = _get_converter(result.keys(), partition[0])
+                yield [convert(row) for row in partition]
+        finally:
+            result.close()
+
+
+async def aiter_batches(
+        session: Union[AsyncSession, async_sessionmaker],
+        statement: sa.Select[_T],
+        *,
+        batch_size: int = 1000,
+) -> AsyncIterator[_Batch]:
+    """
+    Async counterpart of [`iter_batches`][pydantic_filters.plugins.export.iter_batches].
+
+    Args:
+        session: Async session or the factory of the sessions.
+        statement: Select statement, e.g. with the filter and the sort appended.
+        batch_size: Number of rows fetched from the cursor at once.
+    """
+
+    async with _open_async_session(session) as s:
+        result = await s.stream(statement, execution_options={"yield_per": batch_size})
+        convert = None
+        try:
+            async for partition in result.partitions():
+                if convert is None:
+                    convert = _get_converter(result.keys(), partition[0])
+                yield [convert(row) for row in partition]
+        finally:
+            await result.close()
+
+
+class _NdjsonEncoder:
+
+    @staticmethod
+    def header(keys: Sequence[str]) -> bytes:  # noqa: ARG004
+        return b""
+
+    @staticmethod
+    def batch(rows: _Batch) -> bytes:
+        return b"".join([to_json(row) + b"\n" for row in rows])
+
+
+class _CsvEncoder:
+
+    @staticmethod
+    def _encode(rows: Sequence[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode()
+
+    @classmethod
+    def header(cls, keys: Sequence[str]) -> bytes:
+        return cls._encode([keys])
+
+    @classmethod
+    def batch(cls, rows: _Batch) -> bytes:
+        return cls._encode([list(row.values()) for row in rows])
+
+
+_encoders: Mapping[str, Union[_NdjsonEncoder, _CsvEncoder]] = {
+    "ndjson": _NdjsonEncoder(),
+    "csv": _CsvEncoder(),
+}
+
+
+def encode_batches(
+        batches: Iterator[_Batch],
+        format_: ExportFormat = "ndjson",
+        *,
+        keys: Optional[Sequence[str]] = None,
+) -> Iterator[bytes]:
+    """
+    Serialize the batches of rows incrementally, a chunk per batch.
+
+    Args:
+        batches: Batches of rows, e.g. from [`iter_batches`][pydantic_filters.plugins.export.iter_batches].
+        format_: Output format.
+        keys: Keys of the header, written even if there are no rows.
+            By default, the header is taken from the first row and omitted if there are no rows.
+    """
+
+    encoder = _encoders[format_]
+    header = True
+    for batch in batches:
+        if not batch:
+            continue
+        if header:
+            header = False
+            yield encoder.header(list(batch[0]) if keys is None else keys) + encoder.batch(batch)
+        else:
+            yield encoder.batch(batch)
+    if header and keys is not None:
+        yield encoder.header(keys)
+
+
+async def aencode_batches(
+        batches: AsyncIterator[_Batch],
+        format_: ExportFormat = "ndjson",
+        *,
+        keys: Optional[Sequence[str]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Async counterpart of [`encode_batches`][pydantic_filters.plugins.export.encode_batches].
+
+    Args:
+        batches: Batches of rows, e.g. from [`aiter_batches`][pydantic_filters.plugins.export.aiter_batches].
+        format_: Output format.
+        keys: Keys of the header, written even if there are no rows.
+    """
+
+    encoder = _encoders[format_]
+    header = True
+    async for batch in batches:
+        if not batch:
+            continue
+        if header:
+            header = False
+            yield encoder.header(list(batch[0]) if keys is None else keys) + encoder.batch(batch)
+        else:
+            yield encoder.batch(batch)
+    if header and keys is not None:
+        yield encoder.header(keys)
+
+
+def _content_disposition(filename: str) -> str:
+    """`filename*` of RFC 6266 keeps any name, `filename` is its ASCII fallback for the older clients"""
+
+    fallback = "".join(c if " " <= c <= "~" and c not in '"\\' else "_" for c in filename)
+    value = f'attachment; filename="{fallback}"'
+    if fallback != filename:
+        value += f"; filename*=UTF-8''{quote(filename, safe='')}"
+    return value
+
+
+def stream_export(
+        session: SessionSource,
+        statement: sa.Select[_T],
+        *,
+        format_: ExportFormat = "ndjson",
+        batch_size: int = 1000,
+        filename: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    Stream the rows of the statement as NDJSON or CSV.
+
+    The statement is executed with a server-side cursor, the rows are fetched and serialized
+    by batches, so the memory is bounded by a single batch whatever the size of the result.
+    The next batch is fetched only when the previous chunk is sent to the client.
+
+    **Example**
+
+    >>> @app.get("/users/export")
+    ... async def export_users(filter_: UserFilter = FilterDepends(UserFilter)):
+    ...     statement = append_filter_to_statement(sa.select(User.id, User.login), User, filter_)
+    ...     return stream_export(async_session_factory, statement, format_="csv", filename="users.csv")
+
+    Args:
+        session: Session, async session, or the factory of either. Pass the factory if the session
+            is provided by a dependency with `yield`, FastAPI may close it before the response is streamed.
+        statement: Select statement, e.g. with the filter and the sort appended.
+        format_: Output format.
+        batch_size: Number of rows fetched from the cursor and serialized at once.
+        filename: Download as the attachment with this name.
+    """
+
+    if format_ not in _encoders:
+        raise ValueError(f"Unknown export format {format_!r}, expected one of: {', '.join(_encoders)}")
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    keys = _get_keys(statement)
+    if isinstance(session, (AsyncSession, async_sessionmaker)):
+        content: Union[Iterator[bytes], AsyncIterator[bytes]] = aencode_batches(
+            aiter_batches(session, statement, batch_size=batch_size),
+            format_,
+            keys=keys,
+        )
+    else:
+        # Sync iterators are consumed in the thread pool by Starlette
+        content = encode_batches(iter_batches(session, statement, batch_size=batch_size), format_, keys=keys)
+
+    headers = None if filename is None else {"Content-Disposition": _content_disposition(filename)}
+    return StreamingResponse(content, media_type=_media_types[format_], headers=headers)
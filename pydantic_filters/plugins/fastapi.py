@@ -1,20 +1,137 @@
+import hashlib
+from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache, partial
 from inspect import Parameter, signature
-from typing import Any, List, Type, TypeVar
+from threading import Lock
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from fastapi import Depends, Query
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi import params as fastapi_params
-from pydantic import BaseModel
+from fastapi.dependencies.models import Dependant
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
 from pydantic.fields import FieldInfo
+from pydantic_core import to_json
 
 from pydantic_filters import BaseFilter, BasePagination, BaseSort
+from pydantic_filters._metrics import record_usage
+from pydantic_filters._tracing import set_filter_attributes, start_span
 
-from ._utils import inflate_filter, squash_filter
+from ._utils import (
+    ListParams,
+    ListParamsBuilder,
+    flat_filter_model,
+    get_list_params_builder,
+    inflate_filter,
+    squash_filter,
+)
+from .querystring import QueryStringDecoder, get_query_string_decoder
 
 _Filter = TypeVar("_Filter", bound=BaseFilter)
 _Pagination = TypeVar("_Pagination", bound=BasePagination)
 _Sort = TypeVar("_Sort", bound=BaseSort)
 _PydanticModel = TypeVar("_PydanticModel", bound=BaseModel)
+_T = TypeVar("_T")
+
+_OPENAPI_ATTRIBUTE = "__pydantic_filters_openapi__"
+"""Attribute of the dependencies unknown to FastAPI, the function returning their OpenAPI fragment"""
+
+
+_MISSING: Any = object()
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of the validated values, keyed by the normalized query parameters.
+    Pass it to the dependencies to skip the validation of the repeated queries.
+
+    The dependencies cache the flat values with the lists frozen into tuples,
+    every request gets new objects assembled from them without validation,
+    so modifying the objects does not affect the other requests.
+
+    **Example**
+
+    >>> cache = QueryCache(maxsize=1024)
+    >>> @app.get("/users")
+    ... async def get_multiple_users(filter_: UserFilter = FilterDepends(UserFilter, cache=cache)):
+    ...     ...
+    >>> cache.hits, cache.misses
+    (0, 0)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Args:
+            maxsize: Maximum number of the cached queries.
+        """
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        """Number of the queries found in the cache"""
+        self.misses = 0
+        """Number of the queries validated"""
+
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """
+        Get the cached value or create and cache it, exceptions of the factory are not cached.
+        The value is shared by all the callers, it must not be modified.
+        """
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                cached = self._data[key]
+            else:
+                cached = _MISSING
+                self.misses += 1
+
+        if cached is not _MISSING:
+            return cached
+
+        value = factory()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all the cached values and reset the counters"""
+
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
 
 
 def _field_info_to_query(
@@ -61,60 +178,262 @@ def _get_custom_params(
     ]
 
 
-def FilterDepends(  # noqa: N802
+def _get_flat_params(
         filter_: Type[_Filter],
-        prefix: str = "",
-        delimiter: str = "__",
-) -> _Filter:  # pragma: no cover
-    """
-    Use this as fastapi.Depends, but for filters.
+        prefix: str,
+        delimiter: str,
+) -> List[Parameter]:
+    """Single query parameters model, FastAPI validates it in one call"""
 
-    Args:
-        filter_: Filter class.
-        prefix: key prefix.
-        delimiter: Delimiter for prefix and nested models.
+    return [
+        Parameter(
+            name="query",
+            kind=Parameter.KEYWORD_ONLY,
+            default=Query(),
+            annotation=flat_filter_model(filter_, prefix, delimiter),
+        ),
+    ]
+
+
+def _normalize_query(query: bytes) -> bytes:
+    """Order the parameters by the keys, the order of the repeated keys is kept"""
+
+    chunks = [c for c in query.split(b"&") if c]
+    chunks.sort(key=lambda c: c.partition(b"=")[0])
+    return b"&".join(chunks)
+
+
+class _FrozenValues(NamedTuple):
+    """Validated flat values shared by the cached queries, the lists and sets are stored as tuples"""
+
+    values: Dict[str, Any]
+    sequences: Tuple[Tuple[str, type], ...]
+    """Keys of the frozen values and their original types"""
+
+    @classmethod
+    def freeze(cls, values: Dict[str, Any]) -> "_FrozenValues":
+        frozen = dict(values)
+        sequences = []
+        for key, value in values.items():
+            if type(value) in (list, set):
+                frozen[key] = tuple(value)
+                sequences.append((key, type(value)))
+        return cls(frozen, tuple(sequences))
+
+    def thaw(self) -> Dict[str, Any]:
+        """New values for a request, with new lists and sets"""
+
+        values = dict(self.values)
+        for key, type_ in self.sequences:
+            values[key] = type_(values[key])
+        return values
+
+
+@lru_cache(maxsize=1024)
+def _get_query_string_dependency(
+        decoder: QueryStringDecoder,
+        cache: Optional[QueryCache],
+        select: Optional[str],
+) -> Callable[..., Any]:
+    """
+    Dependency reading the raw query string, FastAPI does not extract and validate the parameters,
+    they are decoded and validated by the decoder, only if the query is not in the cache
     """
 
+    def _decode(query: bytes) -> Tuple[Dict[str, Any], ListParams]:
+        with start_span("pydantic_filters.validate") as span:
+            try:
+                values = decoder.validate(query)
+            except ValidationError as e:
+                raise RequestValidationError(
+                    [{**error, "loc": ("query", *error["loc"])} for error in e.errors(include_url=False)],
+                ) from e
+            params = decoder.builder.build(values)
+            set_filter_attributes(span, params.filter)
+            return values, params
+
+    if cache is None:
+        def _depends_query_string(request: Request) -> Any:  # noqa: ANN401
+            _, params = _decode(request.scope["query_string"])
+            record_usage(params.filter, params.sort)
+            return params if select is None else getattr(params, select)
+    else:
+        def _depends_query_string(request: Request) -> Any:  # noqa: ANN401
+            query = _normalize_query(request.scope["query_string"])
+            decoded: List[ListParams] = []
+
+            def _validate() -> _FrozenValues:
+                values, params = _decode(query)
+                decoded.append(params)
+                return _FrozenValues.freeze(values)
+
+            frozen = cache.get_or_set((decoder, query), _validate)
+            # The objects of a hit are assembled from the cached values, which is much cheaper than the validation
+            params = decoded[0] if decoded else decoder.builder.build(frozen.thaw())
+            record_usage(params.filter, params.sort)
+            return params if select is None else getattr(params, select)
+
+    # Parameters are added to the OpenAPI schema by `setup_openapi`
+    setattr(_depends_query_string, _OPENAPI_ATTRIBUTE, partial(_get_openapi_fragment, decoder.builder))
+
+    return _depends_query_string
+
+
+@lru_cache(maxsize=1024)
+def _get_filter_dependency(
+        filter_: Type[_Filter],
+        prefix: str,
+        delimiter: str,
+        one_pass: bool,
+) -> Callable[..., _Filter]:
+    """Dependency with the generated signature, created once per filter class, prefix and delimiter"""
+
+    if one_pass:
+        def _depends_one_pass(query: BaseModel) -> _Filter:
+            """Signature of this function is replaced with the flattened model of the filter,
+            which is validated by FastAPI as a whole"""
+            result = inflate_filter(
+                filter_=filter_,
+                prefix=prefix,
+                delimiter=delimiter,
+                data={k: getattr(query, k) for k in query.model_fields_set},
+            )
+            record_usage(result)
+            return result
+
+        _depends_one_pass.__signature__ = signature(_depends_one_pass).replace(
+            parameters=_get_flat_params(filter_, prefix, delimiter),
+        )
+
+        return _depends_one_pass
+
     def _depends(**kwargs: Any) -> _Filter:  # noqa: ANN401
         """Signature of this function is replaced with Query parameters,
         and kwargs contains already valid data with
         our filters in the form of strings, which we collect into a filter object
         """
-        return inflate_filter(
+        result = inflate_filter(
             filter_=filter_,
             prefix=prefix,
             delimiter=delimiter,
             data=kwargs,
         )
+        record_usage(result)
+        return result
 
     _depends.__signature__ = signature(_depends).replace(
         parameters=_get_custom_params(filter_, prefix, delimiter),
     )
 
-    return Depends(_depends)
+    return _depends
 
 
-def _PydanticModelAsDepends(pydantic_model: Type[_PydanticModel]) -> _PydanticModel:  # pragma: no cover
-    def _depends(**kwargs: Any) -> _Filter:  # noqa: ANN401
-        return pydantic_model.model_construct(**kwargs)
-
-    custom_params = []
-    for key, field_info in pydantic_model.model_fields.items():
-
-        custom_params.append(
-            Parameter(
-                name=key,
-                kind=Parameter.KEYWORD_ONLY,
-                default=_field_info_to_query(field_info),
-                annotation=field_info.annotation,
-            ),
+def FilterDepends(  # noqa: N802
+        filter_: Type[_Filter],
+        prefix: str = "",
+        delimiter: str = "__",
+        *,
+        one_pass: bool = False,
+        query_string: bool = False,
+        cache: Optional[QueryCache] = None,
+) -> _Filter:  # pragma: no cover
+    """
+    Use this as fastapi.Depends, but for filters.
+    The dependency is created once per filter class, prefix and delimiter and shared by the routes.
+
+    Args:
+        filter_: Filter class.
+        prefix: key prefix.
+        delimiter: Delimiter for prefix and nested models.
+        one_pass: Validate all the query parameters in a single call
+            by the flattened model instead of one by one. Requires `FastAPI>=0.115`.
+        query_string: Decode the raw query string by the query string decoder
+            instead of declaring the parameters to FastAPI. Use `setup_openapi` to document them.
+        cache: Cache of the validated filters, the query string is not decoded for the repeated queries.
+            Implies `query_string`.
+    """
+
+    if query_string or cache is not None:
+        decoder = get_query_string_decoder(filter_, prefix=prefix, delimiter=delimiter)
+        return Depends(_get_query_string_dependency(decoder, cache, "filter"))
+
+    return Depends(_get_filter_dependency(filter_, prefix, delimiter, one_pass))
+
+
+@lru_cache(maxsize=1024)
+def _get_body_dependency(filter_: Type[_Filter]) -> Callable[..., Awaitable[_Filter]]:
+    """Dependency validating the raw request body by the filter class, without an intermediate dict"""
+
+    async def _depends_body(request: Request) -> _Filter:
+        body = await request.body()
+        with start_span("pydantic_filters.validate") as span:
+            try:
+                result = filter_.model_validate_json(body or b"{}")
+            except ValidationError as e:
+                raise RequestValidationError(
+                    [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+                    body=body,
+                ) from e
+            set_filter_attributes(span, result)
+        record_usage(result)
+        return result
+
+    # Request body is added to the OpenAPI schema by `setup_openapi`
+    setattr(_depends_body, _OPENAPI_ATTRIBUTE, partial(_get_body_openapi_fragment, filter_))
+
+    return _depends_body
+
+
+def FilterBodyDepends(filter_: Type[_Filter]) -> _Filter:  # noqa: N802  # pragma: no cover
+    """
+    Use this as fastapi.Depends, but for the filter passed as the JSON request body.
+    The body has the nested shape of the filter, it is validated from the raw bytes by `model_validate_json`.
+    An empty body is an empty filter.
+
+    FastAPI does not know the body, use `setup_openapi` to document it.
+
+    **Example**
+
+    >>> @app.post("/users/search")
+    ... async def search_users(filter_: UserFilter = FilterBodyDepends(UserFilter)):
+    ...     ...
+
+    Args:
+        filter_: Filter class.
+    """
+
+    return Depends(_get_body_dependency(filter_))
+
+
+def _get_model_params(pydantic_model: Type[_PydanticModel]) -> List[Parameter]:
+    return [
+        Parameter(
+            name=key,
+            kind=Parameter.KEYWORD_ONLY,
+            default=_field_info_to_query(field_info),
+            annotation=field_info.annotation,
         )
+        for key, field_info in pydantic_model.model_fields.items()
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _get_model_dependency(pydantic_model: Type[_PydanticModel]) -> Callable[..., _PydanticModel]:
+    def _depends(**kwargs: Any) -> _PydanticModel:  # noqa: ANN401
+        result = pydantic_model.model_construct(**kwargs)
+        if isinstance(result, BaseSort):
+            record_usage(sort=result)
+        return result
 
     _depends.__signature__ = signature(_depends).replace(
-        parameters=custom_params,
+        parameters=_get_model_params(pydantic_model),
     )
 
-    return Depends(_depends)
+    return _depends
+
+
+def _PydanticModelAsDepends(pydantic_model: Type[_PydanticModel]) -> _PydanticModel:  # pragma: no cover
+    return Depends(_get_model_dependency(pydantic_model))
 
 
 def PaginationDepends(pagination: Type[_Pagination]) -> _Pagination:  # pragma: no cover
@@ -135,3 +454,394 @@ def SortDepends(sort: Type[_Sort]) -> _Sort:  # pragma: no cover
         sort: Sort class.
     """
     return _PydanticModelAsDepends(sort)
+
+
+@lru_cache(maxsize=1024)
+def _get_list_dependency(
+        filter_: Optional[Type[_Filter]],
+        sort: Optional[Type[_Sort]],
+        pagination: Optional[Type[_Pagination]],
+        prefix: str,
+        delimiter: str,
+        one_pass: bool,
+) -> Callable[..., ListParams]:
+    """Dependency with the generated signature, created once per set of classes"""
+
+    builder = get_list_params_builder(filter_, sort, pagination, prefix, delimiter)
+
+    if one_pass:
+        def _depends_one_pass(query: BaseModel) -> ListParams:
+            """Signature of this function is replaced with the flattened model of all the classes,
+            which is validated by FastAPI as a whole"""
+            params = builder.build_from_model(query)
+            record_usage(params.filter, params.sort)
+            return params
+
+        _depends_one_pass.__signature__ = signature(_depends_one_pass).replace(
+            parameters=[
+                Parameter(name="query", kind=Parameter.KEYWORD_ONLY, default=Query(), annotation=builder.model),
+            ],
+        )
+
+        return _depends_one_pass
+
+    def _depends(**kwargs: Any) -> ListParams:  # noqa: ANN401
+        params = builder.build(kwargs)
+        record_usage(params.filter, params.sort)
+        return params
+
+    params = [] if filter_ is None else _get_custom_params(filter_, prefix, delimiter)
+    if sort is not None:
+        params.extend(_get_model_params(sort))
+    if pagination is not None:
+        params.extend(_get_model_params(pagination))
+
+    _depends.__signature__ = signature(_depends).replace(parameters=params)
+
+    return _depends
+
+
+def ListDepends(  # noqa: N802
+        filter_: Optional[Type[_Filter]] = None,
+        sort: Optional[Type[_Sort]] = None,
+        pagination: Optional[Type[_Pagination]] = None,
+        *,
+        prefix: str = "",
+        delimiter: str = "__",
+        one_pass: bool = False,
+        query_string: bool = False,
+        cache: Optional[QueryCache] = None,
+) -> ListParams:  # pragma: no cover
+    """
+    Use this as fastapi.Depends, but for filter, sort and pagination at once.
+    A single dependency instead of three, resolved in one call.
+
+    Args:
+        filter_: Filter class.
+        sort: Sort class.
+        pagination: Pagination class.
+        prefix: key prefix of the filter.
+        delimiter: Delimiter for prefix and nested models of the filter.
+        one_pass: Validate all the query parameters in a single call
+            by the flattened model instead of one by one. Requires `FastAPI>=0.115`.
+        query_string: Decode the raw query string by the query string decoder
+            instead of declaring the parameters to FastAPI. Use `setup_openapi` to document them.
+        cache: Cache of the validated objects, the query string is not decoded for the repeated queries.
+            Implies `query_string`.
+
+    Raises:
+        ValueError: The same query parameter is declared by several classes.
+    """
+
+    if query_string or cache is not None:
+        decoder = get_query_string_decoder(filter_, sort, pagination, prefix=prefix, delimiter=delimiter)
+        return Depends(_get_query_string_dependency(decoder, cache, None))
+
+    return Depends(_get_list_dependency(filter_, sort, pagination, prefix, delimiter, one_pass))
+
+
+class VersionCounter:
+    """
+    In-process data version for [`ETagDepends`][pydantic_filters.plugins.fastapi.ETagDepends],
+    incremented on every change of the data. Use a query (e.g. `max(updated_at)`)
+    if the data is changed by several processes.
+
+    **Example**
+
+    >>> users_version = VersionCounter()
+    >>> users_version.increment()  # after the users are changed
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = Lock()
+
+    def __call__(self) -> int:
+        return self._value
+
+    def increment(self) -> int:
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+def _canonical(value: Any) -> Any:  # noqa: ANN401
+    """Representation of the value, independent of the order of the query parameters and of the sets"""
+
+    if isinstance(value, BaseModel):
+        keys = value.model_fields_set if isinstance(value, BaseFilter) else value.model_fields
+        return {k: _canonical(getattr(value, k)) for k in sorted(keys)}
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def get_etag(params: ListParams, version: Any) -> str:  # noqa: ANN401
+    """
+    Strong ETag of the list: the hash of the filter, sort and pagination values and the data version.
+
+    Args:
+        params: Filter, sort and pagination.
+        version: Data version, any JSON serializable value.
+    """
+
+    data = to_json([_canonical(params), version], fallback=str)
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def _if_none_match(header: str, etag: str) -> bool:
+    for tag in header.split(","):
+        tag = tag.strip()  # noqa: PLW2901
+        if tag == "*" or tag == etag or tag == f"W/{etag}":
+            return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _get_etag_dependency(
+        list_dependency: Callable[..., ListParams],
+        version: Callable[..., Any],
+) -> Callable[..., str]:
+
+    def _depends_etag(
+            request: Request,
+            response: Response,
+            params: ListParams = Depends(list_dependency),
+            data_version: Any = Depends(version),  # noqa: ANN401
+    ) -> str:
+        etag = get_etag(params, data_version)
+        header = request.headers.get("if-none-match")
+        if header is not None and request.method in {"GET", "HEAD"} and _if_none_match(header, etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return etag
+
+    return _depends_etag
+
+
+def ETagDepends(  # noqa: N802
+        filter_: Optional[Type[_Filter]] = None,
+        sort: Optional[Type[_Sort]] = None,
+        pagination: Optional[Type[_Pagination]] = None,
+        *,
+        version: Callable[..., Any],
+        prefix: str = "",
+        delimiter: str = "__",
+        one_pass: bool = False,
+) -> str:  # pragma: no cover
+    """
+    Conditional GET of the list route. The ETag is computed from the filter, sort and pagination values
+    and the data version. If it matches `If-None-Match`, the 304 response is returned before
+    the route is called, so the main query and count are not executed. Otherwise the ETag header is set.
+
+    Use it with [`ListDepends`][pydantic_filters.plugins.fastapi.ListDepends] with the same arguments,
+    then the query parameters are validated once.
+
+    **Example**
+
+    >>> async def get_users_version(session: AsyncSession = Depends(get_session)) -> Any:
+    ...     return await session.scalar(sa.select(sa.func.max(User.updated_at)))
+    ...
+    >>> @app.get("/users")
+    ... async def get_users(
+    ...     params: ListParams = ListDepends(UserFilter, UserSort, OffsetPagination),
+    ...     etag: str = ETagDepends(UserFilter, UserSort, OffsetPagination, version=get_users_version),
+    ... ):
+    ...     ...
+
+    Args:
+        filter_: Filter class.
+        sort: Sort class.
+        pagination: Pagination class.
+        version: Provider of the data version, a FastAPI dependency, so it can depend on the session.
+            For example the `max(updated_at)` query
+            or the [`VersionCounter`][pydantic_filters.plugins.fastapi.VersionCounter].
+        prefix: key prefix of the filter.
+        delimiter: Delimiter for prefix and nested models of the filter.
+        one_pass: Validate all the query parameters in a single call, as in `ListDepends`.
+
+    Raises:
+        ValueError: The same query parameter is declared by several classes.
+    """
+
+    list_dependency = _get_list_dependency(filter_, sort, pagination, prefix, delimiter, one_pass)
+    return Depends(_get_etag_dependency(list_dependency, version))
+
+
+class _OpenAPIFragment(NamedTuple):
+    """Part of the OpenAPI schema describing the query parameters or the request body of the classes"""
+
+    parameters: List[Dict[str, Any]]
+    responses: Dict[str, Any]
+    schemas: Dict[str, Any]
+    owners: Dict[str, str]
+    """Name of the class declaring the parameter, by the parameter name"""
+    request_body: Optional[Dict[str, Any]] = None
+
+
+@lru_cache(maxsize=1024)
+def _get_openapi_fragment(builder: ListParamsBuilder) -> _OpenAPIFragment:
+    """
+    OpenAPI of the query parameters, generated once per set of classes
+    by FastAPI itself on a single stub route, so it is the same as for the declared parameters
+    """
+
+    dependency = _get_list_dependency(
+        builder.filter_, builder.sort, builder.pagination, builder.prefix, builder.delimiter, False,
+    )
+
+    def _endpoint(params: ListParams = Depends(dependency)) -> None:  # pragma: no cover
+        pass
+
+    schema = get_openapi(title="", version="", routes=[APIRoute("/", _endpoint, methods=["GET"])])
+    operation = schema["paths"]["/"]["get"]
+
+    owners = {}
+    for model, fields in (
+            (builder.filter_, builder.filter_fields),
+            (builder.sort, builder.sort_fields),
+            (builder.pagination, builder.pagination_fields),
+    ):
+        for key in fields:
+            owners[key] = model.__name__
+
+    return _OpenAPIFragment(
+        parameters=operation.get("parameters", []),
+        responses={k: v for k, v in operation["responses"].items() if k != "200"},
+        schemas=schema.get("components", {}).get("schemas", {}),
+        owners=owners,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _get_body_openapi_fragment(filter_: Type[_Filter]) -> _OpenAPIFragment:
+    """OpenAPI of the optional request body, generated by FastAPI itself on a single stub route"""
+
+    def _endpoint(body: filter_ = Body(None)) -> None:  # pragma: no cover
+        pass
+
+    schema = get_openapi(title="", version="", routes=[APIRoute("/", _endpoint, methods=["POST"])])
+    operation = schema["paths"]["/"]["post"]
+
+    return _OpenAPIFragment(
+        parameters=[],
+        responses={k: v for k, v in operation["responses"].items() if k != "200"},
+        schemas=schema["components"]["schemas"],
+        owners={},
+        request_body=operation["requestBody"],
+    )
+
+
+def _iter_fragments(dependant: Dependant) -> Iterator[_OpenAPIFragment]:
+    for dependency in dependant.dependencies:
+        get_fragment = getattr(dependency.call, _OPENAPI_ATTRIBUTE, None)
+        if get_fragment is not None:
+            yield get_fragment()
+        yield from _iter_fragments(dependency)
+
+
+def _share_parameter(components: Dict[str, Any], name: str, parameter: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the parameter to the components, returns the reference to it"""
+
+    key, i = name, 1
+    while components.setdefault(key, parameter) != parameter:
+        i += 1
+        key = f"{name}_{i}"
+    return {"$ref": f"#/components/parameters/{key}"}
+
+
+def _collect_parameters(
+        fragments: List[_OpenAPIFragment],
+        components: Dict[str, Any],
+        shared_components: bool,
+) -> List[Dict[str, Any]]:
+    parameters = []
+    for fragment in fragments:
+        components.setdefault("schemas", {}).update(fragment.schemas)
+        for parameter in fragment.parameters:
+            if shared_components:
+                name = f"{fragment.owners[parameter['name']]}.{parameter['name']}"
+                parameter = _share_parameter(components.setdefault("parameters", {}), name, parameter)  # noqa: PLW2901
+            parameters.append(parameter)
+    return parameters
+
+
+def add_openapi_parameters(
+        schema: Dict[str, Any],
+        routes: Sequence[Any],
+        *,
+        shared_components: bool = False,
+) -> Dict[str, Any]:
+    """
+    Add the parameters of the query string dependencies and the request bodies of the body dependencies
+    to the OpenAPI schema. The parameters declared to FastAPI by the other dependencies are left as they are.
+
+    Args:
+        schema: OpenAPI schema of the routes, modified in place.
+        routes: Routes of the application.
+        shared_components: Declare every parameter once in `components/parameters`
+            and refer to it from the operations instead of repeating it inline.
+
+    Returns:
+        The same schema.
+    """
+
+    components = schema.setdefault("components", {})
+
+    for route in routes:
+        if not isinstance(route, APIRoute) or not route.include_in_schema:
+            continue
+
+        fragments = list(_iter_fragments(route.dependant))
+        if not fragments:
+            continue
+
+        parameters = _collect_parameters(fragments, components, shared_components)
+        for method in route.methods:
+            operation = schema["paths"].get(route.path_format, {}).get(method.lower())
+            if operation is None:
+                continue
+            operation.setdefault("parameters", []).extend(parameters)
+            for fragment in fragments:
+                for status_code, response in fragment.responses.items():
+                    operation["responses"].setdefault(status_code, response)
+                if fragment.request_body is not None:
+                    operation.setdefault("requestBody", fragment.request_body)
+
+    return schema
+
+
+def setup_openapi(app: FastAPI, *, shared_components: bool = False) -> None:
+    """
+    Document the parameters of the query string dependencies
+    (`FilterDepends`, `ListDepends` with `query_string=True` or `cache`)
+    and the request bodies of `FilterBodyDepends` in the OpenAPI schema of the app.
+
+    The parameters are generated once per set of classes and reused by all the routes,
+    FastAPI does not analyze them for every route.
+
+    Only the query string and the body dependencies are covered.
+    The parameters of the default dependencies are declared to FastAPI,
+    it describes them for every route and `shared_components` does not apply to them.
+
+    **Example**
+
+    >>> app = FastAPI()
+    >>> setup_openapi(app, shared_components=True)
+
+    Args:
+        app: FastAPI application.
+        shared_components: Declare every parameter once in `components/parameters`
+            and refer to it from the operations instead of repeating it inline.
+    """
+
+    openapi = app.openapi
+
+    def _openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            add_openapi_parameters(openapi(), app.routes, shared_components=shared_components)
+        return app.openapi_schema
+
+    app.openapi = _openapi
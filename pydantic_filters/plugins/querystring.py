@@ -0,0 +1,170 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+from urllib.parse import unquote_plus
+
+from pydantic_filters import BaseFilter, BasePagination, BaseSort
+
+from ._utils import ListParams, get_list_params_builder
+
+_Filter = TypeVar("_Filter", bound=BaseFilter)
+_Pagination = TypeVar("_Pagination", bound=BasePagination)
+_Sort = TypeVar("_Sort", bound=BaseSort)
+
+QueryString = Union[str, bytes, bytearray, memoryview]
+"""Query string without the leading `?`, e.g. `scope["query_string"]` of ASGI"""
+
+
+class QueryStringDecoder:
+    """
+    Decoder of the query strings into the filter, sort and pagination objects,
+    without any web framework.
+
+    The query parameters are the same as with the FastAPI dependencies.
+    Keys are routed by the table precomputed from `squash_filter`,
+    repeated keys of the sequence fields are collected into lists, the last value wins for the others,
+    unknown keys are ignored. All the values are validated by a single flattened model.
+
+    **Example**
+
+    >>> decoder = QueryStringDecoder(UserFilter, BaseSort, OffsetPagination)
+    >>> decoder.decode(b"login=alice&login=bob&department__chef_id=5&limit=10")
+    ListParams(filter=UserFilter(login=['alice', 'bob'], department=DepartmentFilter(chef_id=[5])), ...)
+    """
+
+    def __init__(
+            self,
+            filter_: Optional[Type[_Filter]] = None,
+            sort: Optional[Type[_Sort]] = None,
+            pagination: Optional[Type[_Pagination]] = None,
+            *,
+            prefix: str = "",
+            delimiter: str = "__",
+    ) -> None:
+        """
+        Args:
+            filter_: Filter class.
+            sort: Sort class.
+            pagination: Pagination class.
+            prefix: key prefix of the filter.
+            delimiter: Delimiter for prefix and nested models of the filter.
+
+        Raises:
+            ValueError: The same query parameter is declared by several classes.
+        """
+
+        self.builder = get_list_params_builder(filter_, sort, pagination, prefix, delimiter)
+        self._model = self.builder.model
+        sequence_keys = self.builder.sequence_keys
+        self._routes: Dict[str, bool] = {key: key in sequence_keys for key in self.builder.fields}
+
+    def collect(self, query: QueryString) -> Dict[str, Any]:
+        """
+        Parse the query string into the raw values of the known keys.
+        Only the chunks containing escapes are unquoted.
+        """
+
+        if not isinstance(query, str):
+            # Query strings are ASCII, percent-encoded UTF-8 is unquoted below
+            query = str(query, "latin-1")
+
+        routes = self._routes
+        data: Dict[str, Any] = {}
+
+        for chunk in query.split("&"):
+            if not chunk:
+                continue
+
+            key, _, value = chunk.partition("=")
+            if "%" in key or "+" in key:
+                key = unquote_plus(key)
+
+            is_sequence = routes.get(key)
+            if is_sequence is None:
+                continue
+
+            if "%" in value or "+" in value:
+                value = unquote_plus(value)
+
+            if is_sequence:
+                values = data.get(key)
+                if values is None:
+                    data[key] = [value]
+                else:
+                    values.append(value)
+            else:
+                data[key] = value
+
+        return data
+
+    def validate(self, query: QueryString) -> Dict[str, Any]:
+        """
+        Decode and validate the query string into the flat values of the set keys,
+        `builder.build` assembles the objects from them without validation.
+
+        Raises:
+            pydantic.ValidationError: Invalid values, the locations are the query keys.
+        """
+
+        validated = self._model.model_validate(self.collect(query))
+        return {k: getattr(validated, k) for k in validated.model_fields_set}
+
+    def decode(self, query: QueryString) -> ListParams:
+        """
+        Decode and validate the query string.
+
+        Raises:
+            pydantic.ValidationError: Invalid values, the locations are the query keys.
+        """
+
+        return self.builder.build(self.validate(query))
+
+
+@lru_cache(maxsize=1024)
+def get_query_string_decoder(
+        filter_: Optional[Type[_Filter]] = None,
+        sort: Optional[Type[_Sort]] = None,
+        pagination: Optional[Type[_Pagination]] = None,
+        *,
+        prefix: str = "",
+        delimiter: str = "__",
+) -> QueryStringDecoder:
+    """Decoder created once per set of classes, prefix and delimiter."""
+
+    return QueryStringDecoder(filter_, sort, pagination, prefix=prefix, delimiter=delimiter)
+
+
+def decode_query_string(
+        query: QueryString,
+        filter_: Optional[Type[_Filter]] = None,
+        sort: Optional[Type[_Sort]] = None,
+        pagination: Optional[Type[_Pagination]] = None,
+        *,
+        prefix: str = "",
+        delimiter: str = "__",
+) -> ListParams:
+    """
+    Decode and validate the query string by the cached decoder.
+
+    **Example**
+
+    >>> async def app(scope, receive, send):
+    ...     filter_, sort, pagination = decode_query_string(
+    ...         scope["query_string"], UserFilter, BaseSort, OffsetPagination,
+    ...     )
+
+    Args:
+        query: Query string or bytes.
+        filter_: Filter class.
+        sort: Sort class.
+        pagination: Pagination class.
+        prefix: key prefix of the filter.
+        delimiter: Delimiter for prefix and nested models of the filter.
+
+    Raises:
+        ValueError: The same query parameter is declared by several classes.
+        pydantic.ValidationError: Invalid values, the locations are the query keys.
+    """
+
+    return get_query_string_decoder(
+        filter_, sort, pagination, prefix=prefix, delimiter=delimiter,
+    ).decode(query)
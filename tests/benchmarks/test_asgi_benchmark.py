@@ -0,0 +1,108 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from pydantic_filters.benchmarks.asgi import (
+    SCENARIOS,
+    Company,
+    Department,
+    User,
+    create_app,
+    main,
+    run,
+    run_scenario,
+    seed,
+)
+
+
+@pytest.fixture(scope="module")
+def session_factory(tmp_path_factory: pytest.TempPathFactory) -> so.sessionmaker:
+    engine = sa.create_engine(f"sqlite:///{tmp_path_factory.mktemp('asgi') / 'benchmark.db'}")
+    seed(engine, 500)
+    yield so.sessionmaker(engine)
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("name", "expected_total"),
+    [
+        ("baseline", 500),
+        ("large_in", 250),
+        ("search", 11),
+    ],
+)
+def test_scenario_response(session_factory: so.sessionmaker, name: str, expected_total: int) -> None:
+    async def _get() -> httpx.Response:
+        transport = httpx.ASGITransport(app=create_app(session_factory))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/users", params=SCENARIOS[name])
+
+    response = asyncio.run(_get())
+    assert response.status_code == 200
+    assert response.json()["total"] == expected_total
+    assert len(response.json()["items"]) == min(expected_total, 20)
+
+
+def test_scenario_response_deep_nesting(session_factory: so.sessionmaker) -> None:
+    params = SCENARIOS["deep_nesting"]
+    statement = (
+        sa.select(sa.func.count())
+        .select_from(User)
+        .join(Department, User.department_id == Department.id)
+        .join(Company, Department.company_id == Company.id)
+        .where(
+            Department.id.in_(params["department__id"]),
+            Department.name.ilike(params["department__name__ilike"]),
+            Company.id.in_(params["department__company__id"]),
+            Company.name.ilike(params["department__company__name__ilike"]),
+        )
+    )
+    with session_factory() as session:
+        expected_total = session.scalar(statement)
+
+    async def _get() -> httpx.Response:
+        transport = httpx.ASGITransport(app=create_app(session_factory))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/users", params=params)
+
+    response = asyncio.run(_get())
+    assert response.status_code == 200
+    assert 0 < response.json()["total"] == expected_total < 500
+
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_run_scenario(session_factory: so.sessionmaker, name: str) -> None:
+    async def _run() -> dict:
+        transport = httpx.ASGITransport(app=create_app(session_factory))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await run_scenario(client, SCENARIOS[name], requests=6, concurrency=3)
+
+    result = asyncio.run(_run())
+    assert result["requests"] == 6
+    assert result["throughput"] > 0
+    assert 0 < result["p50"] <= result["p95"] <= result["p99"]
+
+
+def test_run_scenario_error(session_factory: so.sessionmaker) -> None:
+    async def _run() -> dict:
+        transport = httpx.ASGITransport(app=create_app(session_factory))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await run_scenario(client, {"age__gt": "old"}, requests=2, concurrency=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(_run())
+
+
+def test_run() -> None:
+    results = run("s*", size=100, requests=2, concurrency=1)
+    assert list(results) == ["search"]
+
+
+def test_main(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+    main(["-k", "baseline", "--size", "100", "--requests", "2", "--output", str(output)])
+    assert output.exists()
@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from pydantic_filters.benchmarks.suite import (
+    CASES,
+    DEEP_DATA,
+    DEEP_FLAT,
+    DeepFilter,
+    Regression,
+    compare,
+    create_inherited_filter,
+    main,
+    run,
+)
+from pydantic_filters.plugins._utils import inflate_filter
+
+
+def _results(**results: float) -> Dict[str, Any]:
+    return {"environment": {}, "results": results}
+
+
+def test_deep_flat_parity() -> None:
+    assert inflate_filter(DeepFilter, "", "__", DEEP_FLAT) == DeepFilter.model_validate(DEEP_DATA)
+
+
+def test_inherited_filter() -> None:
+    filter_ = create_inherited_filter()
+    assert len(filter_.filter_fields) == 100
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_case_runs(name: str) -> None:
+    CASES[name]()()
+
+
+@pytest.mark.parametrize(
+    ("results", "baseline", "expected"),
+    [
+        (_results(a=1.0, b=2.0), _results(a=1.0, b=2.0), []),
+        (_results(a=1.2), _results(a=1.0), []),
+        (_results(a=1.3), _results(a=1.0), [Regression("a", 1.0, 1.3)]),
+        (_results(a=0.5), _results(a=1.0), []),
+        (_results(a=2.0), _results(b=1.0), []),
+        (_results(), _results(a=1.0), []),
+    ],
+)
+def test_compare(results: Dict[str, Any], baseline: Dict[str, Any], expected: list) -> None:
+    assert compare(results, baseline, tolerance=0.25) == expected
+
+
+def test_run() -> None:
+    results = run("validation.*", min_time=0.001, repeat=2)
+    assert set(results["results"]) == {"validation.wide", "validation.deep"}
+    assert all(v > 0 for v in results["results"].values())
+    assert {"python", "pydantic", "sqlalchemy"} <= set(results["environment"])
+
+
+def test_main(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+    argv = ["-k", "squash_filter.*", "--min-time", "0.001", "--repeat", "1"]
+
+    assert main([*argv, "--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert list(results["results"]) == ["squash_filter.wide"]
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_results(**{"squash_filter.wide": 1e-12})))
+    assert main([*argv, "--baseline", str(baseline)]) == 1
+
+    baseline.write_text(json.dumps(_results(**{"squash_filter.wide": 1.0})))
+    assert main([*argv, "--baseline", str(baseline)]) == 0
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_benchmark(name: str, request: pytest.FixtureRequest) -> None:
+    pytest.importorskip("pytest_benchmark")
+    benchmark: Callable[..., Any] = request.getfixturevalue("benchmark")
+    benchmark(CASES[name]())
@@ -0,0 +1,107 @@
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+import sqlalchemy as sa
+
+from pydantic_filters.benchmarks.dataset import (
+    compare_plans,
+    explain,
+    get_cases,
+    get_statements,
+    main,
+    run,
+    seed,
+)
+from pydantic_filters.benchmarks.suite import compare
+
+SIZE = int(os.environ.get("PYDANTIC_FILTERS_DATASET_SIZE", "2000"))
+"""Number of the users and the posts, e.g. `PYDANTIC_FILTERS_DATASET_SIZE=1000000`"""
+
+BASELINE = os.environ.get("PYDANTIC_FILTERS_DATASET_BASELINE")
+"""Results of `python -m pydantic_filters.benchmarks.dataset --output` to compare the timing with"""
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory: pytest.TempPathFactory) -> sa.Engine:
+    engine = sa.create_engine(f"sqlite:///{tmp_path_factory.mktemp('dataset') / 'dataset.db'}")
+    seed(engine, SIZE)
+    yield engine
+    engine.dispose()
+
+
+PRIMARY_KEY = "INTEGER PRIMARY KEY"
+
+
+def _uses_index(plan: List[str], table: str, index: str) -> bool:
+    """The table or its alias, e.g. `posts_1`, is searched by the index, covering or not"""
+
+    using = re.escape(index) if index == PRIMARY_KEY else rf"(COVERING )?INDEX {re.escape(index)}"
+    return any(re.match(rf"SEARCH {re.escape(table)}(_\d+)? USING {using}\b", line.strip()) for line in plan)
+
+
+def _scans(plan: List[str], table: str) -> bool:
+    return any(re.match(rf"SCAN {re.escape(table)}(_\d+)?\b", line.strip()) for line in plan)
+
+
+# The search and the select of the deep offset scan the users, there is no index to check
+@pytest.mark.parametrize(
+    ("name", "kind", "indexes"),
+    [
+        ("primary_key_in", "select", {"users": PRIMARY_KEY}),
+        ("primary_key_in", "count", {"users": PRIMARY_KEY}),
+        ("index_range", "select", {"users": "ix_users_age"}),
+        ("index_range", "count", {"users": "ix_users_age"}),
+        ("login_in", "select", {"users": "ix_users_login"}),
+        ("login_in", "count", {"users": "ix_users_login"}),
+        ("many_to_one", "select", {"departments": PRIMARY_KEY, "users": "ix_users_department_id"}),
+        ("many_to_one", "count", {"departments": PRIMARY_KEY, "users": "ix_users_department_id"}),
+        ("one_to_many", "select", {"posts": "ix_posts_views", "users": PRIMARY_KEY}),
+        ("one_to_many", "count", {"posts": "ix_posts_views", "users": PRIMARY_KEY}),
+        ("deep_offset", "count", {"users": "ix_users_age"}),
+    ],
+)
+def test_query_plan(engine: sa.Engine, name: str, kind: str, indexes: Dict[str, str]) -> None:
+    statement = get_statements(get_cases(SIZE)[name])[kind]
+    with engine.connect() as connection:
+        plan = explain(connection, statement)
+
+    for table, index in indexes.items():
+        assert _uses_index(plan, table, index), plan
+        assert not _scans(plan, table), plan
+
+
+@pytest.mark.parametrize("name", get_cases(SIZE))
+def test_count_parity(engine: sa.Engine, name: str) -> None:
+    statements = get_statements(get_cases(SIZE)[name]._replace(sort=None, pagination=None))
+    with engine.connect() as connection:
+        ids = {row.id for row in connection.execute(statements["select"])}
+        assert connection.execute(statements["count"]).scalar() == len(ids)
+
+
+@pytest.mark.skipif(BASELINE is None, reason="PYDANTIC_FILTERS_DATASET_BASELINE is not set")
+def test_timing(engine: sa.Engine) -> None:
+    baseline = json.loads(Path(BASELINE).read_text())
+    assert baseline["size"] == SIZE, "Baseline is measured on the dataset of other size"
+
+    results = run(engine, SIZE)
+    assert compare_plans(results, baseline) == []
+    assert compare(results, baseline) == []
+
+
+def test_main(tmp_path: Path) -> None:
+    database = tmp_path / "dataset.db"
+    output = tmp_path / "results.json"
+    argv = ["-k", "index_*", "--size", "100", "--database", str(database), "--repeat", "1"]
+
+    assert main([*argv, "--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert list(results["results"]) == ["index_range.select", "index_range.count"]
+    assert results["size"] == 100
+
+    results["plans"]["index_range.count"] = ["SCAN users"]
+    output.write_text(json.dumps(results))
+    assert main([*argv, "--baseline", str(output)]) == 1
@@ -0,0 +1,26 @@
+import pytest
+
+from pydantic_filters.benchmarks.memory import DepartmentFilter, UserFilter, _naive_compare, make_users, naive_match
+from pydantic_filters.drivers.memory import filter_items
+
+USERS = make_users(5000)
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        UserFilter(),
+        UserFilter(id__n=[1, 2, 3], age__ge=25, age__lt=60),
+        UserFilter(score__null=True),
+        UserFilter(q="USER-1"),
+        UserFilter(department=DepartmentFilter(id=[1, 5])),
+        UserFilter(age__ge=30, q="example", department=DepartmentFilter(id=list(range(0, 100, 3)))),
+    ]
+)
+def test_compiled_matches_naive(filter_: UserFilter) -> None:
+    assert filter_items(USERS, filter_) == [u for u in USERS if naive_match(filter_, u)]
+
+
+def test_naive_unknown_type() -> None:
+    with pytest.raises(ValueError, match="Unknown filter type 'xor'"):
+        _naive_compare("xor", 1, 1)
@@ -0,0 +1,190 @@
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+from typing import List, Optional, Type
+
+import pytest
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    FilterField,
+    OffsetPagination,
+    PagePagination,
+    SearchField,
+    SortByOrder,
+)
+from pydantic_filters.drivers.memory import (
+    AttributeNotFoundMemoryDriverError,
+    apply_to_items,
+    compile_predicate,
+    count_items,
+    filter_items,
+    get_predicate_source,
+    paginate_items,
+    sort_items,
+)
+from pydantic_filters.drivers.memory._compiler import _build_factory
+
+
+@dataclass
+class B:
+    id: int
+
+
+@dataclass
+class C:
+    id: int
+
+
+@dataclass
+class A:
+    id: int
+    name: Optional[str]
+    attrs: dict = field(default_factory=dict)
+    b: Optional[B] = None
+    c: List[C] = field(default_factory=list)
+
+
+class BFilter(BaseFilter):
+    id: int
+
+
+class CFilter(BaseFilter):
+    id: List[int]
+
+
+class AFilter(BaseFilter):
+    id: List[int]
+    id__gt: int
+    name__null: bool
+    color: str = FilterField(target="attrs.color")
+    q: str = SearchField(target=["name"])
+    biba: str
+    b: BFilter
+    c: CFilter
+
+
+ITEMS = [
+    A(id=1, name="Alice", attrs={"color": "red"}, b=B(id=1), c=[C(id=1), C(id=2)]),
+    A(id=2, name="Bob", attrs={"color": "blue"}, b=B(id=2)),
+    A(id=3, name=None, c=[C(id=3)]),
+]
+
+
+@pytest.mark.parametrize(
+    "filter_, res_ids",
+    [
+        (AFilter(), [1, 2, 3]),
+        (AFilter(id=[1, 3]), [1, 3]),
+        (AFilter(id__gt=1), [2, 3]),
+        (AFilter(name__null=True), [3]),
+        (AFilter(color="red"), [1]),
+        (AFilter(q="o"), [2]),
+        (AFilter(q="A"), [1]),
+        (AFilter(b=BFilter(id=2)), [2]),
+        (AFilter(b=BFilter()), [1, 2]),
+        (AFilter(c=CFilter(id=[2, 3])), [1, 3]),
+        (AFilter(id=[1, 2], c=CFilter(id=[2, 3])), [1]),
+    ]
+)
+def test_filter_items(filter_: BaseFilter, res_ids: List[int]) -> None:
+    assert [a.id for a in filter_items(ITEMS, filter_)] == res_ids
+    assert [a["id"] for a in filter_items([asdict(a) for a in ITEMS], filter_)] == res_ids
+    assert [a.id for a in filter_items(iter(ITEMS), filter_)] == res_ids
+
+
+def test_filter_items_raises() -> None:
+    with pytest.raises(AttributeNotFoundMemoryDriverError):
+        filter_items(ITEMS, AFilter(biba="biba"))
+
+
+def test_filter_items_mapping_missing_key() -> None:
+    assert filter_items([{"id": 1}], AFilter(biba="biba")) == []
+
+
+def test_filter_items_keyword_target() -> None:
+    class KeywordFilter(BaseFilter):
+        class_: str = FilterField(target="class")
+
+    items = [SimpleNamespace(id=1, **{"class": "a"}), SimpleNamespace(id=2, **{"class": "b"})]
+    assert [i.id for i in filter_items(items, KeywordFilter(class_="b"))] == [2]
+    assert "getattr(item, 'class')" in get_predicate_source(KeywordFilter(class_="b"))
+
+
+def test_compile_predicate_cache() -> None:
+    _build_factory.cache_clear()
+    p1 = compile_predicate(AFilter(id=[1], q="a"))
+    p2 = compile_predicate(AFilter(id=[2], q="b"))
+    compile_predicate(AFilter(id=[2]))
+
+    assert _build_factory.cache_info().hits == 1
+    assert _build_factory.cache_info().misses == 2
+    assert p1(ITEMS[0]) is True
+    assert p2(ITEMS[1]) is True
+
+
+def test_get_predicate_source() -> None:
+    assert get_predicate_source(AFilter(id=[1]), mapping=True) == (
+        "def _factory(params):\n"
+        "    p0, = params\n"
+        "    def _predicate_0(item):\n"
+        "        v = item.get('id')\n"
+        "        if not (v in p0):\n"
+        "            return False\n"
+        "        return True\n"
+        "    return _predicate_0"
+    )
+
+
+@pytest.mark.parametrize(
+    "pagination, res_ids",
+    [
+        (OffsetPagination(limit=2), [1, 2]),
+        (OffsetPagination(limit=2, offset=2), [3]),
+        (PagePagination(page=2, per_page=1), [2]),
+    ]
+)
+def test_paginate_items(pagination: BasePagination, res_ids: List[int]) -> None:
+    assert [a.id for a in paginate_items(ITEMS, pagination)] == res_ids
+    assert [a.id for a in paginate_items(iter(ITEMS), pagination)] == res_ids
+
+
+@pytest.mark.parametrize(
+    "sort, res_ids",
+    [
+        (BaseSort(), [1, 2, 3]),
+        (BaseSort(sort_by="id", sort_by_order=SortByOrder.desc), [3, 2, 1]),
+        (BaseSort(sort_by="name"), [1, 2, 3]),
+        (BaseSort(sort_by="name", sort_by_order=SortByOrder.desc), [3, 2, 1]),
+    ]
+)
+def test_sort_items(sort: BaseSort, res_ids: List[int]) -> None:
+    assert [a.id for a in sort_items(ITEMS, sort)] == res_ids
+    assert [a["id"] for a in sort_items([asdict(a) for a in ITEMS], sort)] == res_ids
+
+
+@pytest.mark.parametrize(
+    "sort, exception",
+    [
+        (BaseSort(sort_by="biba"), AttributeNotFoundMemoryDriverError),
+    ]
+)
+def test_sort_items_raises(sort: BaseSort, exception: Type[Exception]) -> None:
+    with pytest.raises(exception):
+        sort_items(ITEMS, sort)
+
+
+def test_apply_to_items() -> None:
+    items = apply_to_items(
+        ITEMS,
+        filter_=AFilter(id=[1, 2, 3]),
+        sort=BaseSort(sort_by="id", sort_by_order=SortByOrder.desc),
+        pagination=OffsetPagination(limit=1, offset=1),
+    )
+    assert [a.id for a in items] == [2]
+
+
+def test_count_items() -> None:
+    assert count_items(ITEMS, AFilter(id__gt=1)) == 2
+    assert count_items([], AFilter(id__gt=1)) == 0
@@ -0,0 +1,109 @@
+import re
+from typing import Any, Dict
+
+import pytest
+
+from pydantic_filters import FilterType, SearchType
+from pydantic_filters.drivers.memory._operators import (
+    _filter_type_to_operator_map,
+    _search_type_to_operator_map,
+    _like_to_regex,
+    get_filter_operator,
+    get_search_operator,
+    in_ranges,
+)
+
+
+def evaluate(template: str, param: Any, value: Any) -> bool:
+    return eval(template.format(v="v", p="p"), {"_in_ranges": in_ranges}, {"v": value, "p": param})
+
+
+@pytest.mark.parametrize(
+    "pattern, flags, value, res",
+    [
+        ("a%", 0, "abc", True),
+        ("a%", 0, "bac", False),
+        ("a_c", 0, "abc", True),
+        ("a_c", 0, "abbc", False),
+        ("A%", 0, "abc", False),
+        ("A%", re.IGNORECASE, "abc", True),
+        ("a.c", 0, "abc", False),
+        ("%\n%", 0, "a\nb", True),
+    ]
+)
+def test_like_to_regex(pattern: str, flags: int, value: str, res: bool):
+    assert (_like_to_regex(pattern, flags=flags).fullmatch(value) is not None) is res
+
+
+@pytest.mark.parametrize(
+    "type_, is_sequence, obj, value, res",
+    [
+        (FilterType.eq, False, 1, 1, True),
+        (FilterType.eq, False, 1, 2, False),
+        (FilterType.eq, False, None, None, True),
+        (FilterType.eq, True, [1, 2], 2, True),
+        (FilterType.eq, True, [[1], [2]], [2], True),
+        (FilterType.ne, False, 1, 2, True),
+        (FilterType.ne, False, 1, None, False),
+        (FilterType.ne, True, [1, 2], 2, False),
+        (FilterType.ne, True, [1, 2], 3, True),
+        (FilterType.gt, False, 1, 2, True),
+        (FilterType.gt, False, 1, None, False),
+        (FilterType.gt, True, [5, 1], 2, True),
+        (FilterType.gt, True, [], 2, False),
+        (FilterType.le, True, [1, 5], 5, True),
+        (FilterType.lt, True, [1, 5], 5, False),
+        (FilterType.like, False, "a%", "abc", True),
+        (FilterType.like, True, ["x%", "a%"], "abc", True),
+        (FilterType.ilike, False, "A%", "abc", True),
+        (FilterType.ilike, False, "A%", None, False),
+        (FilterType.null, False, True, None, True),
+        (FilterType.null, False, False, None, False),
+        (FilterType.null, True, [False, True], 1, False),
+        (FilterType.overlap, True, ["a", "b"], ["b", "c"], True),
+        (FilterType.overlap, True, ["a", "b"], ["c"], False),
+        (FilterType.contains, True, ["a", "b"], ["a", "b", "c"], True),
+        (FilterType.contains, True, ["a", "b"], ["a"], False),
+        (FilterType.contains, False, "a", None, False),
+        (FilterType.range, False, (1, 3), 3, True),
+        (FilterType.range, False, (1, 3), 4, False),
+        (FilterType.range, False, (None, 3), 0, True),
+        (FilterType.range, False, (1, None), 0, False),
+        (FilterType.range, True, [(1, 2), (5, 6)], 5, True),
+        (FilterType.range, True, [(1, 2), (5, 6)], 4, False),
+        (FilterType.range, True, [], 4, False),
+    ]
+)
+def test_filter_operator(type_: FilterType, is_sequence: bool, obj: Any, value: Any, res: bool):
+    template, param = get_filter_operator(type_)(is_sequence, obj)
+    assert evaluate(template, param, value) is res
+
+
+@pytest.mark.parametrize(
+    "type_, is_sequence, obj, value, res",
+    [
+        (SearchType.case_sensitive, False, "b", "abc", True),
+        (SearchType.case_sensitive, False, "B", "abc", False),
+        (SearchType.case_insensitive, False, "B", "abc", True),
+        (SearchType.case_insensitive, False, "B", None, False),
+        (SearchType.case_insensitive, False, 1, 123, True),
+        (SearchType.case_sensitive, False, "a_c", "xabcx", True),
+        (SearchType.case_sensitive, True, ["x", "c"], "abc", True),
+        (SearchType.case_insensitive, True, ["X", "C"], "abc", True),
+        (SearchType.case_insensitive, True, [], "abc", False),
+    ]
+)
+def test_search_operator(type_: SearchType, is_sequence: bool, obj: Any, value: Any, res: bool):
+    template, param = get_search_operator(type_)(is_sequence, obj)
+    assert evaluate(template, param, value) is res
+
+
+@pytest.mark.parametrize(
+    "map_, enum",
+    [
+        (_filter_type_to_operator_map, FilterType),
+        (_search_type_to_operator_map, SearchType),
+    ]
+)
+def test_fullness_map(map_: Dict, enum):
+    assert set(map_.keys()) == set(enum)
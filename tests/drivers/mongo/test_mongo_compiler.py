@@ -0,0 +1,261 @@
+from typing import List, Optional
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from pydantic_filters import (
+    BaseFilter,
+    BaseSort,
+    FilterField,
+    OffsetPagination,
+    Range,
+    SearchField,
+    SearchType,
+    SortByOrder,
+)
+from pydantic_filters.drivers.mongo import (
+    count_documents,
+    filter_to_query,
+    find,
+    get_query_source,
+    pagination_to_skip_limit,
+    sort_to_spec,
+)
+from pydantic_filters.drivers.mongo._compiler import _build_factory
+from pydantic_filters.drivers.mongo._operators import like_to_regex
+from pydantic_filters.drivers.sqlalchemy import append_to_statement, get_count_statement
+
+mongomock = pytest.importorskip("mongomock")
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class BModel(Base):
+    __tablename__ = "b"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+
+
+class AModel(Base):
+    __tablename__ = "a"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[Optional[str]]
+    title: so.Mapped[str]
+    score: so.Mapped[Optional[float]]
+    attrs: so.Mapped[dict] = so.mapped_column(sa.JSON)
+    b_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(BModel.id))
+
+    b: so.Mapped[BModel] = so.relationship()
+
+
+class BFilter(BaseFilter):
+    id: List[int]
+    name__like: str
+
+
+class AFilter(BaseFilter):
+    id: int
+    id__in: List[int] = FilterField(target="id")
+    id__n: List[int]
+    id__gt: int
+    id__lt: List[int]
+    id__range: List[Range[int]]
+    name: Optional[str]
+    name__ne: Optional[str]
+    name__null: bool
+    name__ilike: List[str]
+    name__like: Optional[str]
+    score__ge: float
+    color: str = FilterField(target="attrs.color")
+    size__gt: int = FilterField(target="attrs.size", type_="gt")
+    q: str = SearchField(target=["name", "title"])
+    qs: List[str] = SearchField(target=["title"], type_=SearchType.case_sensitive)
+    tags__ov: List[str]
+    tags__ct: List[str]
+    b: BFilter
+
+
+B_ROWS = [{"id": 1, "name": "first"}, {"id": 2, "name": "second"}]
+A_ROWS = [
+    {
+        "id": i,
+        "name": None if i % 5 == 0 else f"Name-{i}",
+        "title": f"Title {i % 3}",
+        "score": None if i % 4 == 0 else i / 2,
+        "attrs": {"color": ["red", "blue"][i % 2], "size": i % 7},
+        "b_id": i % 2 + 1,
+    }
+    for i in range(1, 41)
+]
+
+
+@pytest.fixture(scope="module")
+def engine() -> sa.Engine:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with so.Session(engine) as session:
+        session.add_all([BModel(**row) for row in B_ROWS])
+        session.add_all([AModel(**row) for row in A_ROWS])
+        session.commit()
+    return engine
+
+
+@pytest.fixture(scope="module")
+def collection() -> "mongomock.Collection":
+    collection = mongomock.MongoClient().db.a
+    collection.insert_many([
+        {**row, "_id": row["id"], "b": B_ROWS[row["b_id"] - 1]}
+        for row in A_ROWS
+    ])
+    return collection
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        AFilter(),
+        AFilter(id=3),
+        AFilter(id__in=[1, 2, 30]),
+        AFilter(id__in=[]),
+        AFilter(id__n=[1, 2, 30]),
+        AFilter(id__gt=35),
+        AFilter(id__lt=[3, 5]),
+        AFilter(id__range=[Range[int](start=3, end=5), Range[int](start=30)]),
+        AFilter(name=None),
+        AFilter(name="Name-7"),
+        AFilter(name__ne="Name-7"),
+        AFilter(name__ne=None),
+        AFilter(name__null=True),
+        AFilter(name__null=False, id__gt=30),
+        AFilter(name__ilike=["name-1%", "%-2_"]),
+        AFilter(score__ge=10),
+        AFilter(color="red"),
+        AFilter(size__gt=4),
+        AFilter(q="TITLE 1"),
+        AFilter(q="-3"),
+        AFilter(qs=["Title 2", "-1"]),
+        AFilter(b=BFilter(id=[2])),
+        AFilter(b=BFilter(name__like="s%"), id__gt=20),
+        AFilter(b=BFilter()),
+    ]
+)
+def test_parity_with_sqlalchemy(engine: sa.Engine, collection: "mongomock.Collection", filter_: AFilter) -> None:
+    sort = BaseSort(sort_by="id", sort_by_order=SortByOrder.desc)
+    pagination = OffsetPagination(limit=15, offset=2)
+
+    with engine.connect() as conn:
+        expected = conn.execute(
+            append_to_statement(sa.select(AModel.id), AModel, filter_=filter_, sort=sort, pagination=pagination),
+        ).scalars().all()
+        expected_count = conn.execute(get_count_statement(AModel, filter_)).scalar_one()
+
+    cursor = find(collection, filter_=filter_, sort=sort, pagination=pagination, projection={"id": True})
+    assert [d["id"] for d in cursor] == expected
+    assert count_documents(collection, filter_) == expected_count
+
+
+@pytest.mark.parametrize(
+    "filter_, expected",
+    [
+        (AFilter(), {}),
+        (AFilter(id=1), {"id": 1}),
+        (
+            AFilter(id__in=[1, 2], id__n=[3]),
+            {"$and": [{"id": {"$in": [1, 2]}}, {"id": {"$nin": [3, None]}}]},
+        ),
+        (AFilter(id__lt=[3, 5]), {"id": {"$lt": 5}}),
+        (AFilter(id__lt=[]), {"id": {"$in": []}}),
+        (AFilter(name__ne=None), {"name": {"$ne": None}}),
+        (AFilter(name__null=True), {"name": None}),
+        (AFilter(name__ilike=["a%"]), {"name": {"$regex": "^a.*$", "$options": "is"}}),
+        (AFilter(name__like=None), {"name": {"$in": []}}),
+        (
+            AFilter(id__range=[{"start": 1, "end": 2}, {"start": 5}]),
+            {"$or": [{"id": {"$gte": 1, "$lte": 2}}, {"id": {"$gte": 5}}]},
+        ),
+        (
+            AFilter(q="x"),
+            {"$or": [
+                {"name": {"$regex": "^.*x.*$", "$options": "is"}},
+                {"title": {"$regex": "^.*x.*$", "$options": "is"}},
+            ]},
+        ),
+        (AFilter(tags__ov=["a", "b"]), {"tags": {"$in": ["a", "b"]}}),
+        (AFilter(tags__ct=["a", "b"]), {"tags": {"$all": ["a", "b"]}}),
+        (
+            AFilter(b=BFilter(id=[1])),
+            {"$and": [{"b": {"$ne": None}}, {"b.id": {"$in": [1]}}]},
+        ),
+    ]
+)
+def test_filter_to_query(filter_: AFilter, expected: dict) -> None:
+    assert filter_to_query(filter_) == expected
+
+
+def test_array_filter_types() -> None:
+    collection = mongomock.MongoClient().db.items
+    collection.insert_many([
+        {"_id": 1, "tags": ["a", "b"]},
+        {"_id": 2, "tags": ["b", "c"]},
+        {"_id": 3, "tags": []},
+    ])
+
+    def ids(filter_: AFilter) -> List[int]:
+        return [d["_id"] for d in find(collection, filter_=filter_, sort=BaseSort(sort_by="_id"))]
+
+    assert ids(AFilter(tags__ov=["a", "c"])) == [1, 2]
+    assert ids(AFilter(tags__ct=["b", "c"])) == [2]
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("abc", "^abc$"),
+        ("a%c_", "^a.*c.$"),
+        ("a.b*", r"^a\.b\*$"),
+    ]
+)
+def test_like_to_regex(pattern: str, expected: str) -> None:
+    assert like_to_regex(pattern) == expected
+
+
+def test_filter_to_query_cache() -> None:
+    _build_factory.cache_clear()
+    filter_to_query(AFilter(id__in=[1], q="a"))
+    first = filter_to_query(AFilter(id__in=[1, 2, 3], q="b"))
+    second = filter_to_query(AFilter(id__in=[1, 2, 3], q="b"))
+
+    assert first == second
+    assert first is not second
+    assert _build_factory.cache_info().hits == 2
+    assert _build_factory.cache_info().misses == 1
+
+
+def test_get_query_source() -> None:
+    assert get_query_source(AFilter(id=1, q="a")) == (
+        "def _factory(params):\n"
+        "    p0, p1, = params\n"
+        "    return {'$and': [{'id': p0}, {'$or': ["
+        "{'name': {'$regex': p1, '$options': 'is'}}, {'title': {'$regex': p1, '$options': 'is'}}]}]}"
+    )
+
+
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        (BaseSort(), None),
+        (BaseSort(sort_by="id"), [("id", 1)]),
+        (BaseSort(sort_by="id", sort_by_order=SortByOrder.desc), [("id", -1)]),
+    ]
+)
+def test_sort_to_spec(sort: BaseSort, expected: Optional[list]) -> None:
+    assert sort_to_spec(sort) == expected
+
+
+def test_pagination_to_skip_limit() -> None:
+    assert pagination_to_skip_limit(OffsetPagination(limit=10, offset=5)) == (5, 10)
@@ -0,0 +1,158 @@
+from typing import List, Type
+
+import pytest
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    FilterField,
+    OffsetPagination,
+    PagePagination,
+    SearchField,
+    SortByOrder,
+)
+
+np = pytest.importorskip("numpy")
+
+from pydantic_filters.drivers.numpy import (  # noqa: E402
+    AttributeNotFoundNumpyDriverError,
+    apply_to_columns,
+    count_columns,
+    filter_columns,
+    filter_to_mask,
+    paginate_columns,
+    sort_columns,
+)
+
+
+class BFilter(BaseFilter):
+    id: int
+
+
+class AFilter(BaseFilter):
+    id: List[int]
+    id__gt: int
+    name__null: bool
+    name__ilike: str
+    score__ge: float
+    q: str = SearchField(target=["name", "b.name"])
+    biba: str = FilterField(target="biba")
+    b: BFilter
+
+
+STRUCTURED = np.array(
+    [
+        (1, "Alice", 1.5, 1, "Engineering"),
+        (2, "Bob", np.nan, 2, "Sales"),
+        (3, "", 3.5, 1, "Engineering"),
+    ],
+    dtype=[("id", "i8"), ("name", "U16"), ("score", "f8"), ("b.id", "i8"), ("b.name", "U16")],
+)
+
+COLUMNS = {
+    "id": np.array([1, 2, 3]),
+    "name": np.array(["Alice", "Bob", None], dtype=object),
+    "score": np.array([1.5, np.nan, 3.5]),
+    "b.id": np.array([1, 2, 1]),
+    "b.name": np.array(["Engineering", "Sales", "Engineering"]),
+}
+
+
+@pytest.mark.parametrize(
+    "filter_, res_ids",
+    [
+        (AFilter(), [1, 2, 3]),
+        (AFilter(id=[1, 3]), [1, 3]),
+        (AFilter(id__gt=1), [2, 3]),
+        (AFilter(name__ilike="%O%"), [2]),
+        (AFilter(score__ge=2), [3]),
+        (AFilter(q="ales"), [2]),
+        (AFilter(q="ALI"), [1]),
+        (AFilter(b=BFilter(id=1)), [1, 3]),
+        (AFilter(b=BFilter()), [1, 2, 3]),
+        (AFilter(id=[1, 2], b=BFilter(id=1)), [1]),
+    ]
+)
+def test_filter_columns(filter_: BaseFilter, res_ids: List[int]) -> None:
+    assert filter_columns(STRUCTURED, filter_)["id"].tolist() == res_ids
+    assert filter_columns(COLUMNS, filter_)["id"].tolist() == res_ids
+
+
+def test_filter_to_mask_null() -> None:
+    assert filter_to_mask(COLUMNS, AFilter(name__null=True)).tolist() == [False, False, True]
+    assert filter_to_mask(STRUCTURED, AFilter(name__null=True)).tolist() == [False, False, False]
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [STRUCTURED, COLUMNS],
+)
+def test_filter_columns_raises(columns) -> None:
+    with pytest.raises(AttributeNotFoundNumpyDriverError):
+        filter_columns(columns, AFilter(biba="biba"))
+
+
+@pytest.mark.parametrize(
+    "pagination, res_ids",
+    [
+        (OffsetPagination(limit=2), [1, 2]),
+        (OffsetPagination(limit=2, offset=2), [3]),
+        (PagePagination(page=2, per_page=1), [2]),
+    ]
+)
+def test_paginate_columns(pagination: BasePagination, res_ids: List[int]) -> None:
+    assert paginate_columns(STRUCTURED, pagination)["id"].tolist() == res_ids
+    assert paginate_columns(COLUMNS, pagination)["id"].tolist() == res_ids
+
+
+@pytest.mark.parametrize(
+    "sort, res_ids",
+    [
+        (BaseSort(), [1, 2, 3]),
+        (BaseSort(sort_by="id", sort_by_order=SortByOrder.desc), [3, 2, 1]),
+        (BaseSort(sort_by="score"), [1, 3, 2]),
+        (BaseSort(sort_by="score", sort_by_order=SortByOrder.desc), [2, 3, 1]),
+        (BaseSort(sort_by="b.id"), [1, 3, 2]),
+        (BaseSort(sort_by="b.id", sort_by_order=SortByOrder.desc), [2, 1, 3]),
+    ]
+)
+def test_sort_columns(sort: BaseSort, res_ids: List[int]) -> None:
+    assert sort_columns(STRUCTURED, sort)["id"].tolist() == res_ids
+    assert sort_columns(COLUMNS, sort)["id"].tolist() == res_ids
+
+
+def test_sort_columns_object_nulls() -> None:
+    assert sort_columns(COLUMNS, BaseSort(sort_by="name"))["id"].tolist() == [1, 2, 3]
+    assert sort_columns(
+        COLUMNS, BaseSort(sort_by="name", sort_by_order=SortByOrder.desc),
+    )["id"].tolist() == [3, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "sort, exception",
+    [
+        (BaseSort(sort_by="biba"), AttributeNotFoundNumpyDriverError),
+    ]
+)
+def test_sort_columns_raises(sort: BaseSort, exception: Type[Exception]) -> None:
+    with pytest.raises(exception):
+        sort_columns(COLUMNS, sort)
+
+
+def test_apply_to_columns() -> None:
+    for columns in (STRUCTURED, COLUMNS):
+        res = apply_to_columns(
+            columns,
+            filter_=AFilter(id=[1, 2, 3]),
+            sort=BaseSort(sort_by="id", sort_by_order=SortByOrder.desc),
+            pagination=OffsetPagination(limit=1, offset=1),
+        )
+        assert res["id"].tolist() == [2]
+
+    assert apply_to_columns(COLUMNS)["id"].tolist() == [1, 2, 3]
+
+
+def test_count_columns() -> None:
+    assert count_columns(STRUCTURED, AFilter(id__gt=1)) == 2
+    assert count_columns({"id": np.array([], dtype=int)}, AFilter(id__gt=1)) == 0
@@ -0,0 +1,100 @@
+from typing import Any, List
+
+import pytest
+
+from pydantic_filters import FilterType, Range, SearchType
+
+np = pytest.importorskip("numpy")
+
+from pydantic_filters.drivers.numpy._operators import (  # noqa: E402
+    _filter_type_to_operator_map,
+    _search_type_to_operator_map,
+    get_filter_operator,
+    get_search_operator,
+    null_mask,
+)
+
+INTS = np.array([1, 2, 3, 4])
+FLOATS = np.array([1.0, np.nan, 3.0, 4.0])
+STRINGS = np.array(["abc", "Abd", "xbc", "a_c"])
+OBJECTS = np.array(["abc", None, "xbc", "a_c"], dtype=object)
+DATES = np.array(["2024-01-01", "NaT", "2024-01-03", "2024-01-04"], dtype="datetime64[D]")
+TAGS = np.empty(4, dtype=object)
+TAGS[:] = [["a", "b"], ["b"], None, []]
+
+
+@pytest.mark.parametrize(
+    "column, res",
+    [
+        (INTS, [False, False, False, False]),
+        (FLOATS, [False, True, False, False]),
+        (STRINGS, [False, False, False, False]),
+        (OBJECTS, [False, True, False, False]),
+        (DATES, [False, True, False, False]),
+    ]
+)
+def test_null_mask(column: Any, res: List[bool]) -> None:
+    assert null_mask(column).tolist() == res
+
+
+@pytest.mark.parametrize(
+    "type_, column, is_sequence, obj, res",
+    [
+        (FilterType.eq, INTS, False, 2, [False, True, False, False]),
+        (FilterType.eq, INTS, True, [2, 4], [False, True, False, True]),
+        (FilterType.eq, OBJECTS, False, None, [False, True, False, False]),
+        (FilterType.eq, OBJECTS, False, "abc", [True, False, False, False]),
+        (FilterType.ne, INTS, True, [2, 4], [True, False, True, False]),
+        (FilterType.ne, FLOATS, False, 1.0, [False, False, True, True]),
+        (FilterType.ne, OBJECTS, True, ["abc"], [False, False, True, True]),
+        (FilterType.gt, INTS, False, 2, [False, False, True, True]),
+        (FilterType.gt, INTS, True, [3, 1], [False, True, True, True]),
+        (FilterType.gt, INTS, True, [], [False, False, False, False]),
+        (FilterType.ge, FLOATS, False, 3.0, [False, False, True, True]),
+        (FilterType.lt, OBJECTS, False, "b", [True, False, False, True]),
+        (FilterType.le, INTS, True, [1, 3], [True, True, True, False]),
+        (FilterType.le, DATES, False, np.datetime64("2024-01-03"), [True, False, True, False]),
+        (FilterType.like, STRINGS, False, "a%", [True, False, False, True]),
+        (FilterType.like, STRINGS, False, "%bc", [True, False, True, False]),
+        (FilterType.like, STRINGS, False, "%b%", [True, True, True, False]),
+        (FilterType.like, STRINGS, False, "abc", [True, False, False, False]),
+        (FilterType.like, STRINGS, False, "a_c", [True, False, False, True]),
+        (FilterType.like, STRINGS, True, ["x%", "a%"], [True, False, True, True]),
+        (FilterType.like, OBJECTS, False, "%", [True, False, True, True]),
+        (FilterType.ilike, STRINGS, False, "A%", [True, True, False, True]),
+        (FilterType.ilike, OBJECTS, False, "%BC", [True, False, True, False]),
+        (FilterType.null, OBJECTS, False, True, [False, True, False, False]),
+        (FilterType.null, FLOATS, False, False, [True, False, True, True]),
+        (FilterType.overlap, TAGS, True, ["a", "c"], [True, False, False, False]),
+        (FilterType.overlap, TAGS, False, "b", [True, True, False, False]),
+        (FilterType.contains, TAGS, True, ["a", "b"], [True, False, False, False]),
+        (FilterType.contains, TAGS, True, [], [True, True, False, True]),
+        (FilterType.range, INTS, False, Range(start=2, end=3), [False, True, True, False]),
+        (FilterType.range, INTS, False, (None, 2), [True, True, False, False]),
+        (FilterType.range, INTS, True, [(1, 1), (4, None)], [True, False, False, True]),
+        (FilterType.range, FLOATS, False, (None, None), [True, False, True, True]),
+        (FilterType.range, INTS, True, [], [False, False, False, False]),
+    ]
+)
+def test_filter_operator(type_: FilterType, column: Any, is_sequence: bool, obj: Any, res: List[bool]) -> None:
+    assert get_filter_operator(type_)(column, is_sequence, obj).tolist() == res
+
+
+@pytest.mark.parametrize(
+    "type_, column, is_sequence, obj, res",
+    [
+        (SearchType.case_sensitive, STRINGS, False, "bc", [True, False, True, False]),
+        (SearchType.case_sensitive, STRINGS, False, "A", [False, True, False, False]),
+        (SearchType.case_insensitive, STRINGS, False, "A", [True, True, False, True]),
+        (SearchType.case_insensitive, OBJECTS, True, ["X", "_"], [True, False, True, True]),
+        (SearchType.case_insensitive, OBJECTS, True, ["X", "C_"], [False, False, True, False]),
+        (SearchType.case_insensitive, OBJECTS, True, [], [False, False, False, False]),
+    ]
+)
+def test_search_operator(type_: SearchType, column: Any, is_sequence: bool, obj: Any, res: List[bool]) -> None:
+    assert get_search_operator(type_)(column, is_sequence, obj).tolist() == res
+
+
+def test_operator_maps() -> None:
+    assert set(_filter_type_to_operator_map) == set(FilterType)
+    assert set(_search_type_to_operator_map) == set(SearchType)
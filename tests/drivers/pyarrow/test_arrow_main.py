@@ -0,0 +1,191 @@
+from pathlib import Path
+from typing import List, Type
+
+import pytest
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    FilterField,
+    OffsetPagination,
+    PagePagination,
+    SearchField,
+    SortByOrder,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+import pyarrow.dataset as ds  # noqa: E402
+
+from pydantic_filters.drivers.pyarrow import (  # noqa: E402
+    AttributeNotFoundArrowDriverError,
+    SupportArrowDriverError,
+    apply_to_dataset,
+    count_dataset,
+    filter_dataset,
+    filter_to_expression,
+    iter_batches,
+    paginate_table,
+    sort_table,
+)
+
+
+class BFilter(BaseFilter):
+    id: int
+
+
+class AFilter(BaseFilter):
+    id: List[int]
+    id__gt: int
+    name: List[str]
+    name__ne: List[str]
+    name__null: bool
+    year: int
+    tags__ov: List[str]
+    color: str = FilterField(target="attrs.color")
+    q: str = SearchField(target=["name", "attrs.color"])
+    biba: str
+    b: BFilter
+
+
+TABLE = pa.table({
+    "id": [1, 2, 3, 4],
+    "name": ["Alice", "Bob", None, "Eva"],
+    "year": [2023, 2023, 2024, 2024],
+    "tags": [["a"], ["b"], [], None],
+    "attrs": [{"color": "red"}, {"color": "blue"}, {"color": None}, None],
+    "b": [{"id": 1}, {"id": 2}, {"id": 1}, None],
+})
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory: pytest.TempPathFactory) -> "ds.Dataset":
+    path: Path = tmp_path_factory.mktemp("parquet")
+    ds.write_dataset(TABLE, path, format="parquet", partitioning=["year"], partitioning_flavor="hive")
+    return ds.dataset(path, format="parquet", partitioning="hive")
+
+
+@pytest.mark.parametrize(
+    "filter_, res_ids",
+    [
+        (AFilter(), [1, 2, 3, 4]),
+        (AFilter(id=[1, 3]), [1, 3]),
+        (AFilter(id__gt=1), [2, 3, 4]),
+        (AFilter(name__null=True), [3]),
+        (AFilter(name=["Bob", "Eva"]), [2, 4]),
+        (AFilter(name=[]), []),
+        (AFilter(name__ne=["Bob"]), [1, 4]),
+        (AFilter(name__ne=[]), [1, 2, 4]),
+        (AFilter(year=2024), [3, 4]),
+        (AFilter(color="red"), [1]),
+        (AFilter(q="E"), [1, 2, 4]),
+        (AFilter(q="blu"), [2]),
+        (AFilter(b=BFilter(id=1)), [1, 3]),
+        (AFilter(b=BFilter()), [1, 2, 3, 4]),
+        (AFilter(id=[1, 2], b=BFilter(id=1)), [1]),
+    ]
+)
+def test_filter_dataset(dataset: "ds.Dataset", filter_: BaseFilter, res_ids: List[int]) -> None:
+    assert sorted(filter_dataset(dataset, filter_).column("id").to_pylist()) == res_ids
+    assert sorted(filter_dataset(TABLE, filter_).column("id").to_pylist()) == res_ids
+
+
+def test_filter_dataset_columns(dataset: "ds.Dataset") -> None:
+    table = filter_dataset(dataset, AFilter(q="E"), columns=["id"])
+    assert table.column_names == ["id"]
+
+
+def test_filter_to_expression_partition_pruning(dataset: "ds.Dataset") -> None:
+    assert len(list(dataset.get_fragments())) == 2
+    assert len(list(dataset.get_fragments(filter=filter_to_expression(AFilter(year=2024))))) == 1
+
+
+def test_filter_to_expression_empty() -> None:
+    assert filter_to_expression(AFilter()) is None
+    assert filter_to_expression(AFilter(b=BFilter())) is None
+
+
+@pytest.mark.parametrize(
+    "filter_, exception",
+    [
+        (AFilter(biba="biba"), AttributeNotFoundArrowDriverError),
+        (AFilter(q="a", b=BFilter(id=1), biba="biba"), AttributeNotFoundArrowDriverError),
+        (AFilter(tags__ov=["a"]), SupportArrowDriverError),
+    ]
+)
+def test_filter_dataset_raises(filter_: BaseFilter, exception: Type[Exception]) -> None:
+    with pytest.raises(exception):
+        filter_dataset(TABLE, filter_)
+
+
+def test_filter_to_expression_schema_nested() -> None:
+    schema = pa.schema([("id", pa.int64()), ("b", pa.int64())])
+    with pytest.raises(AttributeNotFoundArrowDriverError):
+        filter_to_expression(AFilter(b=BFilter(id=1)), schema=schema)
+
+
+@pytest.mark.parametrize(
+    "pagination, res_ids",
+    [
+        (OffsetPagination(limit=2), [1, 2]),
+        (OffsetPagination(limit=2, offset=3), [4]),
+        (PagePagination(page=2, per_page=1), [2]),
+    ]
+)
+def test_paginate_table(pagination: BasePagination, res_ids: List[int]) -> None:
+    assert paginate_table(TABLE, pagination).column("id").to_pylist() == res_ids
+
+
+@pytest.mark.parametrize(
+    "sort, res_ids",
+    [
+        (BaseSort(), [1, 2, 3, 4]),
+        (BaseSort(sort_by="id", sort_by_order=SortByOrder.desc), [4, 3, 2, 1]),
+        (BaseSort(sort_by="name"), [1, 2, 4, 3]),
+        (BaseSort(sort_by="name", sort_by_order=SortByOrder.desc), [3, 4, 2, 1]),
+        (BaseSort(sort_by="year", sort_by_order=SortByOrder.desc), [3, 4, 1, 2]),
+    ]
+)
+def test_sort_table(sort: BaseSort, res_ids: List[int]) -> None:
+    assert sort_table(TABLE, sort).column("id").to_pylist() == res_ids
+
+
+def test_sort_table_raises() -> None:
+    with pytest.raises(AttributeNotFoundArrowDriverError):
+        sort_table(TABLE, BaseSort(sort_by="biba"))
+
+
+def test_apply_to_dataset(dataset: "ds.Dataset") -> None:
+    table = apply_to_dataset(
+        dataset,
+        filter_=AFilter(id=[1, 2, 3]),
+        sort=BaseSort(sort_by="id", sort_by_order=SortByOrder.desc),
+        pagination=OffsetPagination(limit=1, offset=1),
+        columns=["name"],
+    )
+    assert table.to_pylist() == [{"name": "Bob"}]
+
+    table = apply_to_dataset(TABLE, pagination=OffsetPagination(limit=2, offset=1))
+    assert table.column("id").to_pylist() == [2, 3]
+    assert apply_to_dataset(TABLE).num_rows == 4
+
+
+@pytest.mark.parametrize(
+    "pagination, res_ids",
+    [
+        (None, [1, 2, 3, 4]),
+        (OffsetPagination(limit=2, offset=1), [2, 3]),
+        (OffsetPagination(limit=10, offset=3), [4]),
+        (OffsetPagination(limit=1, offset=10), []),
+    ]
+)
+def test_iter_batches(pagination: BasePagination, res_ids: List[int]) -> None:
+    batches = list(iter_batches(TABLE, pagination=pagination, batch_size=1))
+    assert all(b.num_rows == 1 for b in batches)
+    assert [i for b in batches for i in b.column("id").to_pylist()] == res_ids
+
+
+def test_count_dataset(dataset: "ds.Dataset") -> None:
+    assert count_dataset(dataset, AFilter(id__gt=1)) == 3
+    assert count_dataset(dataset, AFilter()) == 4
@@ -0,0 +1,88 @@
+from typing import Any, List
+
+import pytest
+
+from pydantic_filters import FilterType, Range, SearchType
+
+pa = pytest.importorskip("pyarrow")
+
+from pydantic_filters.drivers.pyarrow._operators import (  # noqa: E402
+    _search_type_to_operator_map,
+    get_filter_operator,
+    get_search_operator,
+)
+
+import pyarrow.compute as pc  # noqa: E402
+import pyarrow.dataset as ds  # noqa: E402
+
+DATASET = ds.dataset(pa.table({
+    "i": [1, 2, 3, None],
+    "s": ["abc", "Abd", "xbc", None],
+}))
+
+
+def matched(expression: Any) -> List[Any]:
+    return DATASET.to_table(filter=expression).column("s").to_pylist()
+
+
+@pytest.mark.parametrize(
+    "type_, name, is_sequence, obj, res",
+    [
+        (FilterType.eq, "i", False, 2, ["Abd"]),
+        (FilterType.eq, "i", True, [2, 3], ["Abd", "xbc"]),
+        (FilterType.eq, "i", False, None, [None]),
+        (FilterType.eq, "i", True, [], []),
+        (FilterType.eq, "s", True, [], []),
+        (FilterType.ne, "i", False, 2, ["abc", "xbc"]),
+        (FilterType.ne, "i", True, [2, 3], ["abc"]),
+        (FilterType.ne, "i", False, None, ["abc", "Abd", "xbc"]),
+        (FilterType.ne, "i", True, [], ["abc", "Abd", "xbc"]),
+        (FilterType.ne, "s", True, [], ["abc", "Abd", "xbc"]),
+        (FilterType.gt, "i", False, 2, ["xbc"]),
+        (FilterType.gt, "i", True, [3, 1], ["Abd", "xbc"]),
+        (FilterType.gt, "i", True, [], []),
+        (FilterType.ge, "i", False, 2, ["Abd", "xbc"]),
+        (FilterType.lt, "i", False, None, []),
+        (FilterType.le, "i", True, [1, 2], ["abc", "Abd"]),
+        (FilterType.like, "s", False, "a%", ["abc"]),
+        (FilterType.like, "s", True, ["x%", "a%"], ["abc", "xbc"]),
+        (FilterType.like, "s", False, "_bc", ["abc", "xbc"]),
+        (FilterType.ilike, "s", False, "A%", ["abc", "Abd"]),
+        (FilterType.null, "s", False, True, [None]),
+        (FilterType.null, "s", False, False, ["abc", "Abd", "xbc"]),
+        (FilterType.range, "i", False, Range(start=2, end=3), ["Abd", "xbc"]),
+        (FilterType.range, "i", False, (None, 1), ["abc"]),
+        (FilterType.range, "i", True, [(1, 1), (3, None)], ["abc", "xbc"]),
+        (FilterType.range, "i", False, (None, None), ["abc", "Abd", "xbc"]),
+        (FilterType.range, "i", True, [], []),
+    ]
+)
+def test_filter_operator(type_: FilterType, name: str, is_sequence: bool, obj: Any, res: List[Any]) -> None:
+    assert matched(get_filter_operator(type_)(pc.field(name), is_sequence, obj)) == res
+
+
+@pytest.mark.parametrize(
+    "type_",
+    [FilterType.overlap, FilterType.contains],
+)
+def test_filter_operator_not_supported(type_: FilterType) -> None:
+    assert get_filter_operator(type_) is None
+
+
+@pytest.mark.parametrize(
+    "type_, is_sequence, obj, res",
+    [
+        (SearchType.case_sensitive, False, "bc", ["abc", "xbc"]),
+        (SearchType.case_sensitive, False, "A", ["Abd"]),
+        (SearchType.case_insensitive, False, "A", ["abc", "Abd"]),
+        (SearchType.case_insensitive, True, ["X", "D"], ["Abd", "xbc"]),
+        (SearchType.case_insensitive, True, ["a_d"], ["Abd"]),
+        (SearchType.case_insensitive, True, [], []),
+    ]
+)
+def test_search_operator(type_: SearchType, is_sequence: bool, obj: Any, res: List[Any]) -> None:
+    assert matched(get_search_operator(type_)(pc.field("s"), is_sequence, obj)) == res
+
+
+def test_operator_maps() -> None:
+    assert set(_search_type_to_operator_map) == set(SearchType)
@@ -0,0 +1,327 @@
+import re
+from typing import List, Optional, Type
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from sqlalchemy.dialects import postgresql
+
+from pydantic_filters import (
+    BaseFilter,
+    BaseSort,
+    FilterField,
+    OffsetPagination,
+    Range,
+    SearchField,
+    SearchType,
+    SortByOrder,
+)
+from pydantic_filters.drivers.sql import (
+    AttributeNotFoundSqlDriverError,
+    RelationshipNotFoundSqlDriverError,
+    SqlJoin,
+    SqlTable,
+    SupportSqlDriverError,
+    compile_count,
+    compile_select,
+)
+from pydantic_filters.drivers.sql._compiler import _render_select
+from pydantic_filters.drivers.sqlalchemy import append_to_statement, get_count_statement
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class BModel(Base):
+    __tablename__ = "b"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+
+
+class AModel(Base):
+    __tablename__ = "a"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[Optional[str]]
+    title: so.Mapped[str]
+    score: so.Mapped[Optional[float]]
+    attrs: so.Mapped[dict] = so.mapped_column(sa.JSON)
+    b_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(BModel.id))
+
+    b: so.Mapped[BModel] = so.relationship()
+
+
+class PgBase(so.DeclarativeBase):
+    pass
+
+
+class CModel(PgBase):
+    __tablename__ = "c"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    tags: so.Mapped[List[str]] = so.mapped_column(postgresql.ARRAY(sa.String))
+
+
+B_TABLE = SqlTable("b", columns={"id", "name"}, primary_key="id")
+A_TABLE = SqlTable(
+    "a",
+    columns={"id", "name", "title", "score", "attrs", "b_id"},
+    primary_key="id",
+    joins={"b": SqlJoin(B_TABLE, on=("b_id", "id"))},
+)
+A_PG_TABLE = SqlTable("a", columns={*A_TABLE.columns, "tags"}, joins=A_TABLE.joins)
+C_TABLE = SqlTable("c", columns={"id", "tags"}, array_columns={"tags"})
+
+
+class BFilter(BaseFilter):
+    id: List[int]
+    name__like: str
+
+
+class AFilter(BaseFilter):
+    id: int
+    id__in: List[int] = FilterField(target="id")
+    id__n: List[int]
+    id__gt: int
+    id__lt: List[int]
+    id__range: List[Range[int]]
+    name: Optional[str]
+    name__ne: Optional[str]
+    name__null: bool
+    name__ilike: List[str]
+    score__ge: float
+    color: str = FilterField(target="attrs.color")
+    size__gt: int = FilterField(target="attrs.size", type_="gt")
+    q: str = SearchField(target=["name", "title"])
+    qs: List[str] = SearchField(target=["title"], type_=SearchType.case_sensitive)
+    tags__ov: List[str]
+    biba: int
+    b: BFilter
+    c: BFilter
+
+
+class CFilter(BaseFilter):
+    tag: str = FilterField(target="tags")
+    tag__in: List[str] = FilterField(target="tags")
+    tag__n: str = FilterField(target="tags", type_="ne")
+    tags__ov: List[str]
+    tags__ct: List[str]
+    q: str = SearchField(target=["tags"])
+
+
+@pytest.fixture(scope="module")
+def engine() -> sa.Engine:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with so.Session(engine) as session:
+        session.add_all([BModel(id=1, name="first"), BModel(id=2, name="second")])
+        session.add_all([
+            AModel(
+                id=i,
+                name=None if i % 5 == 0 else f"Name-{i}",
+                title=f"Title {i % 3}",
+                score=None if i % 4 == 0 else i / 2,
+                attrs={"color": ["red", "blue"][i % 2], "size": i % 7},
+                b_id=i % 2 + 1,
+            )
+            for i in range(1, 41)
+        ])
+        session.commit()
+    return engine
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        AFilter(),
+        AFilter(id=3),
+        AFilter(id__in=[1, 2, 30]),
+        AFilter(id__in=[]),
+        AFilter(id__n=[1, 2, 30]),
+        AFilter(id__gt=35),
+        AFilter(id__lt=[3, 5]),
+        AFilter(id__range=[Range[int](start=3, end=5), Range[int](start=30)]),
+        AFilter(name=None),
+        AFilter(name="Name-7"),
+        AFilter(name__ne="Name-7"),
+        AFilter(name__ne=None),
+        AFilter(name__null=True),
+        AFilter(name__null=False, id__gt=30),
+        AFilter(name__ilike=["name-1%", "%-2_"]),
+        AFilter(score__ge=10),
+        AFilter(color="red"),
+        AFilter(size__gt=4),
+        AFilter(q="TITLE 1"),
+        AFilter(q="-3"),
+        AFilter(qs=["Title 2", "-1"]),
+        AFilter(b=BFilter(id=[2])),
+        AFilter(b=BFilter(name__like="s%"), id__gt=20),
+        AFilter(b=BFilter()),
+    ]
+)
+def test_parity_with_sqlalchemy(engine: sa.Engine, filter_: AFilter) -> None:
+    sort = BaseSort(sort_by="id", sort_by_order=SortByOrder.desc)
+    pagination = OffsetPagination(limit=15, offset=2)
+
+    with engine.connect() as conn:
+        expected = conn.execute(
+            append_to_statement(sa.select(AModel.id), AModel, filter_=filter_, sort=sort, pagination=pagination),
+        ).scalars().all()
+        expected_count = conn.execute(get_count_statement(AModel, filter_)).scalar_one()
+
+        text, params = compile_select(
+            A_TABLE, filter_=filter_, sort=sort, pagination=pagination, columns=["id"], paramstyle="qmark",
+        )
+        count_text, count_params = compile_count(A_TABLE, filter_, paramstyle="qmark")
+
+        assert conn.exec_driver_sql(text, tuple(params)).scalars().all() == expected
+        assert conn.exec_driver_sql(count_text, tuple(count_params)).scalar_one() == expected_count
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        CFilter(tag="a"),
+        CFilter(tags__ov=["a", "b"]),
+        CFilter(tags__ct=["a", "b"]),
+        CFilter(tag="a", tags__ov=["b"]),
+    ]
+)
+def test_parity_with_sqlalchemy_array(filter_: CFilter) -> None:
+    """PostgreSQL is not available in the tests, the statements are compared up to the quoting"""
+
+    compiled = append_to_statement(sa.select(CModel.id), CModel, filter_=filter_).compile(
+        dialect=postgresql.psycopg2.dialect(paramstyle="format"),
+    )
+    expected = re.sub(r"::\w+\[\]", "", " ".join(compiled.string.split()).replace(" (", "("))
+    expected_params = [compiled.params[name] for name in compiled.positiontup]
+
+    text, params = compile_select(C_TABLE, filter_=filter_, columns=["id"], paramstyle="format")
+
+    assert text.replace('"', "") == expected
+    assert params == expected_params
+
+
+@pytest.mark.parametrize(
+    "filter_, paramstyle, expected_text, expected_params",
+    [
+        (
+            AFilter(),
+            "numeric_dollar",
+            'SELECT "a".* FROM "a"',
+            [],
+        ),
+        (
+            AFilter(id__in=[1, 2], name__ilike=["a%"], id__lt=[1, 2]),
+            "numeric_dollar",
+            (
+                'SELECT "a".* FROM "a" WHERE "a"."id" = ANY($1) AND "a"."id" < ANY($2) '
+                'AND "a"."name" ILIKE ANY($3)'
+            ),
+            [[1, 2], [1, 2], ["a%"]],
+        ),
+        (
+            AFilter(id__n=[1], q="x", b=BFilter(id=[1])),
+            "format",
+            (
+                'SELECT "a".* FROM "a" JOIN "b" AS "b_1" ON "a"."b_id" = "b_1"."id" '
+                'WHERE "a"."id" <> ALL(%s) AND ("a"."name" ILIKE %s OR "a"."title" ILIKE %s) '
+                'AND "b_1"."id" = ANY(%s)'
+            ),
+            [[1], "%x%", "%x%", [1]],
+        ),
+        (
+            AFilter(tags__ov=["a", "b"], size__gt=1, name__null=True),
+            "numeric_dollar",
+            (
+                'SELECT "a".* FROM "a" WHERE "a"."name" IS NULL '
+                'AND CAST(("a"."attrs" #>> \'{"size"}\') AS INTEGER) > $1 AND "a"."tags" && $2'
+            ),
+            [1, ["a", "b"]],
+        ),
+        (
+            AFilter(id__range=[{"start": 1, "end": 2}, {"start": 5}], id__in=[1, 2]),
+            "qmark",
+            'SELECT "a".* FROM "a" WHERE "a"."id" IN (?, ?) AND ("a"."id" BETWEEN ? AND ? OR "a"."id" >= ?)',
+            [1, 2, 1, 2, 5],
+        ),
+    ]
+)
+def test_compile_select(filter_: AFilter, paramstyle: str, expected_text: str, expected_params: list) -> None:
+    assert compile_select(A_PG_TABLE, filter_=filter_, paramstyle=paramstyle) == (expected_text, expected_params)
+
+
+def test_compile_select_array_columns() -> None:
+    assert compile_select(C_TABLE, filter_=CFilter(tag="a", tag__in=["b", "c"])) == (
+        'SELECT "c".* FROM "c" WHERE $1 = ANY("c"."tags") AND "c"."tags" && $2',
+        ["a", ["b", "c"]],
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"filter_": CFilter(tag__n="a")},
+        {"filter_": CFilter(q="a")},
+        {"filter_": CFilter(tag="a"), "paramstyle": "qmark"},
+    ]
+)
+def test_compile_select_array_columns_raises(kwargs: dict) -> None:
+    with pytest.raises(SupportSqlDriverError):
+        compile_select(C_TABLE, **kwargs)
+
+
+def test_compile_select_sort_pagination() -> None:
+    assert compile_select(
+        A_TABLE,
+        sort=BaseSort(sort_by="name"),
+        pagination=OffsetPagination(limit=10, offset=5),
+        columns=["id", "name"],
+    ) == (
+        'SELECT "a"."id", "a"."name" FROM "a" ORDER BY "a"."name" ASC LIMIT $1 OFFSET $2',
+        [10, 5],
+    )
+
+
+def test_compile_select_format_escape() -> None:
+    table = SqlTable("100%", columns={"id"})
+    assert compile_select(table, filter_=AFilter(id=1), paramstyle="format") == (
+        'SELECT "100%%".* FROM "100%%" WHERE "100%%"."id" = %s',
+        [1],
+    )
+
+
+def test_compile_select_cache() -> None:
+    _render_select.cache_clear()
+    compile_select(A_TABLE, filter_=AFilter(id__in=[1], q="a"))
+    text, params = compile_select(A_TABLE, filter_=AFilter(id__in=[1, 2, 3], q="b"))
+    compile_select(A_TABLE, filter_=AFilter(id__in=[1, 2, 3], q="b"), paramstyle="qmark")
+
+    assert params == [[1, 2, 3], "%b%", "%b%"]
+    assert _render_select.cache_info().hits == 1
+    assert _render_select.cache_info().misses == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs, exception",
+    [
+        ({"filter_": AFilter(biba=1)}, AttributeNotFoundSqlDriverError),
+        ({"filter_": AFilter(c=BFilter())}, RelationshipNotFoundSqlDriverError),
+        ({"filter_": AFilter(tags__ov=["a"]), "paramstyle": "qmark"}, SupportSqlDriverError),
+        ({"sort": BaseSort(sort_by="biba")}, AttributeNotFoundSqlDriverError),
+        ({"columns": ["biba"]}, AttributeNotFoundSqlDriverError),
+    ]
+)
+def test_compile_select_raises(kwargs: dict, exception: Type[Exception]) -> None:
+    with pytest.raises(exception):
+        compile_select(A_PG_TABLE, **kwargs)
+
+
+def test_compile_count() -> None:
+    assert compile_count(A_TABLE, AFilter(id=1)) == ('SELECT count(*) FROM "a" WHERE "a"."id" = $1', [1])
+
+    table = SqlTable("a", columns={"id"}, joins=A_TABLE.joins)
+    with pytest.raises(SupportSqlDriverError):
+        compile_count(table, AFilter(b=BFilter()))
@@ -0,0 +1,272 @@
+import re
+from typing import Type
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects.sqlite import dialect as sa_sqlite_dialect
+
+from pydantic_filters import (
+    BaseFilter,
+    BasePagination,
+    BaseSort,
+    OffsetPagination,
+    PagePagination,
+    SearchField,
+    SortByOrder,
+)
+from pydantic_filters.drivers.sqlalchemy import (
+    AttributeNotFoundSaDriverError,
+    RelationshipNotFoundSaDriverError,
+    SupportSaDriverError,
+    TableJoin,
+    append_filter_to_table_statement,
+    append_sort_to_table_statement,
+    append_to_table_statement,
+    get_table_count_statement,
+)
+
+metadata = sa.MetaData()
+
+c_table = sa.Table(
+    "c",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+)
+
+b_table = sa.Table(
+    "b",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("c_id", sa.ForeignKey("c.id")),
+)
+
+a_table = sa.Table(
+    "a",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String),
+    sa.Column("b_id", sa.ForeignKey("b.id")),
+    sa.Column("b2_id", sa.ForeignKey("b.id")),
+)
+
+ab_table = sa.Table(
+    "ab",
+    metadata,
+    sa.Column("a_id", sa.Integer, primary_key=True),
+    sa.Column("b_id", sa.Integer, primary_key=True),
+)
+
+k_table = sa.Table(
+    "k",
+    metadata,
+    sa.Column("keys", sa.Integer),
+    sa.Column("index", sa.Integer),
+)
+
+b2_alias = b_table.alias("b2")
+
+A_JOINS = {
+    "b": TableJoin(b_table, a_table.c.b_id == b_table.c.id, joins={"c": TableJoin(c_table)}),
+    "b2": TableJoin(b2_alias, a_table.c.b2_id == b2_alias.c.id),
+    "b3": TableJoin(b_table),
+}
+
+
+class CFilter(BaseFilter):
+    id: int
+
+
+class BFilter(BaseFilter):
+    id: int
+    c: CFilter
+
+
+class AFilter(BaseFilter):
+    id: int
+    q: str = SearchField(target=["name"])
+    biba: int
+    b: BFilter
+    b2: BFilter
+    b3: BFilter
+    b4: BFilter
+
+
+class KFilter(BaseFilter):
+    keys: int
+    index__gt: int
+    items: int
+
+
+def compile_statement(stmt: sa.Select) -> str:
+    compiled = stmt.compile(
+        dialect=sa_sqlite_dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    return " ".join(re.split(r"\s+", compiled.string))
+
+
+@pytest.mark.parametrize(
+    "filter_, expected_stmt",
+    [
+        (
+            AFilter(),
+            "SELECT a.id FROM a",
+        ),
+        (
+            AFilter(id=1, q="x"),
+            "SELECT a.id FROM a WHERE a.id = 1 AND lower(a.name) LIKE lower('%x%')",
+        ),
+        (
+            AFilter(id=1, b=BFilter(id=2)),
+            "SELECT a.id FROM a JOIN b ON a.b_id = b.id AND b.id = 2 WHERE a.id = 1",
+        ),
+        (
+            AFilter(b=BFilter(id=2, c=CFilter(id=3)), b2=BFilter(id=4)),
+            (
+                "SELECT a.id FROM a "
+                "JOIN b ON a.b_id = b.id AND b.id = 2 "
+                "JOIN c ON c.id = b.c_id AND c.id = 3 "
+                "JOIN b AS b2 ON a.b2_id = b2.id AND b2.id = 4"
+            ),
+        ),
+    ]
+)
+def test_append_filter_to_table_statement(filter_: BaseFilter, expected_stmt: str) -> None:
+    stmt = append_filter_to_table_statement(sa.select(a_table.c.id), a_table, filter_, joins=A_JOINS)
+    assert compile_statement(stmt) == expected_stmt
+
+
+def test_append_filter_to_table_statement_collection_attributes() -> None:
+    """Columns named as the attributes of the column collection"""
+
+    stmt = append_filter_to_table_statement(sa.select(k_table.c["keys"]), k_table, KFilter(keys=1, index__gt=2))
+    assert compile_statement(stmt) == 'SELECT k.keys FROM k WHERE k.keys = 1 AND k."index" > 2'
+
+    with pytest.raises(AttributeNotFoundSaDriverError):
+        append_filter_to_table_statement(sa.select(k_table.c["keys"]), k_table, KFilter(items=1))
+
+
+@pytest.mark.parametrize(
+    "filter_, exception",
+    [
+        (AFilter(biba=1), AttributeNotFoundSaDriverError),
+        (AFilter(b4=BFilter(id=1)), RelationshipNotFoundSaDriverError),
+        (AFilter(b3=BFilter(id=1)), RelationshipNotFoundSaDriverError),
+        (AFilter(b=BFilter(c=CFilter(id=1)), b2=BFilter(c=CFilter(id=1))), RelationshipNotFoundSaDriverError),
+    ]
+)
+def test_append_filter_to_table_statement_raises(filter_: BaseFilter, exception: Type[Exception]) -> None:
+    with pytest.raises(exception):
+        append_filter_to_table_statement(sa.select(a_table.c.id), a_table, filter_, joins=A_JOINS)
+
+
+@pytest.mark.parametrize(
+    "sort, expected_stmt",
+    [
+        (BaseSort(), "SELECT a.id FROM a"),
+        (BaseSort(sort_by="name"), "SELECT a.id FROM a ORDER BY a.name ASC"),
+        (BaseSort(sort_by="name", sort_by_order=SortByOrder.desc), "SELECT a.id FROM a ORDER BY a.name DESC"),
+    ]
+)
+def test_append_sort_to_table_statement(sort: BaseSort, expected_stmt: str) -> None:
+    stmt = append_sort_to_table_statement(sa.select(a_table.c.id), a_table, sort)
+    assert compile_statement(stmt) == expected_stmt
+
+
+def test_append_sort_to_table_statement_raises() -> None:
+    with pytest.raises(AttributeNotFoundSaDriverError):
+        append_sort_to_table_statement(sa.select(a_table.c.id), a_table, BaseSort(sort_by="biba"))
+
+
+@pytest.mark.parametrize(
+    "pagination, expected_stmt",
+    [
+        (None, "SELECT a.id FROM a JOIN b ON a.b_id = b.id AND b.id = 2 WHERE a.id = 1 ORDER BY a.id DESC"),
+        (
+            PagePagination(page=3, per_page=10),
+            (
+                "SELECT a.id FROM a JOIN b ON a.b_id = b.id AND b.id = 2 WHERE a.id = 1 "
+                "ORDER BY a.id DESC LIMIT 10 OFFSET 20"
+            ),
+        ),
+    ]
+)
+def test_append_to_table_statement(pagination: BasePagination, expected_stmt: str) -> None:
+    stmt = append_to_table_statement(
+        sa.select(a_table.c.id),
+        a_table,
+        filter_=AFilter(id=1, b=BFilter(id=2)),
+        sort=BaseSort(sort_by="id", sort_by_order=SortByOrder.desc),
+        pagination=pagination,
+        joins=A_JOINS,
+    )
+    assert compile_statement(stmt) == expected_stmt
+
+
+@pytest.mark.parametrize(
+    "filter_, expected_stmt",
+    [
+        (AFilter(id=1), "SELECT count(*) AS count_1 FROM a WHERE a.id = 1"),
+        (
+            AFilter(id=1, b=BFilter(id=2)),
+            "SELECT count(DISTINCT a.id) AS count_1 FROM a JOIN b ON a.b_id = b.id AND b.id = 2 WHERE a.id = 1",
+        ),
+    ]
+)
+def test_get_table_count_statement(filter_: BaseFilter, expected_stmt: str) -> None:
+    stmt = get_table_count_statement(a_table, filter_, joins=A_JOINS)
+    assert compile_statement(stmt) == expected_stmt
+
+
+def test_get_table_count_statement_raises() -> None:
+    assert compile_statement(get_table_count_statement(ab_table, AFilter())) == "SELECT count(*) AS count_1 FROM ab"
+    with pytest.raises(SupportSaDriverError):
+        get_table_count_statement(ab_table, AFilter(b=BFilter(id=1)), joins={"b": TableJoin(b_table, sa.true())})
+    with pytest.raises(SupportSaDriverError):
+        get_table_count_statement(
+            sa.select(a_table.c.name).subquery(),
+            AFilter(b=BFilter(id=1)),
+            joins={"b": TableJoin(b_table, sa.true())},
+        )
+
+
+def test_table_statement_execute() -> None:
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(c_table), [{"id": 1}, {"id": 2}])
+        conn.execute(sa.insert(b_table), [{"id": 1, "c_id": 1}, {"id": 2, "c_id": 2}])
+        conn.execute(
+            sa.insert(a_table),
+            [
+                {"id": 1, "name": "Alice", "b_id": 1, "b2_id": 2},
+                {"id": 2, "name": "Bob", "b_id": 2, "b2_id": 2},
+                {"id": 3, "name": "Eva", "b_id": 1, "b2_id": 1},
+            ],
+        )
+
+        filter_ = AFilter(b=BFilter(c=CFilter(id=1)), b2=BFilter(id=2))
+        stmt = append_filter_to_table_statement(sa.select(a_table.c.id), a_table, filter_, joins=A_JOINS)
+        assert conn.execute(stmt).scalars().all() == [1]
+        assert conn.execute(get_table_count_statement(a_table, filter_, joins=A_JOINS)).scalar_one() == 1
+
+
+def test_benchmark_statements_parity() -> None:
+    from pydantic_filters.benchmarks.sqlalchemy_core import Base, Department, User, build_core, build_orm
+
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(Department), [{"id": 1, "name": "Sales"}, {"id": 2, "name": "Support"}])
+        conn.execute(
+            sa.insert(User),
+            [
+                {"id": i, "login": f"alice-{i}", "email": f"{i}@example.com", "age": 20 + i % 50, "department_id": i % 2 + 1}
+                for i in range(1, 1000)
+            ],
+        )
+        orm_ids = [row.id for row in conn.execute(build_orm())]
+        core_ids = [row.id for row in conn.execute(build_core())]
+
+    assert orm_ids
+    assert orm_ids == core_ids
@@ -1,5 +1,5 @@
 import re
-from typing import Type
+from typing import Optional, Type
 
 import pytest
 import sqlalchemy as sa
@@ -58,6 +58,18 @@ class ABModel(Base):
     b_id: so.Mapped[int]
 
 
+class NodeModel(Base):
+    __tablename__ = "nodes"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True, autoincrement=True)
+    name: so.Mapped[str]
+    parent_id: so.Mapped[Optional[int]] = so.mapped_column(sa.ForeignKey("nodes.id"))
+    a_id: so.Mapped[Optional[int]] = so.mapped_column(sa.ForeignKey(AModel.id))
+
+    parent: so.Mapped[Optional["NodeModel"]] = so.relationship(remote_side=[id])
+    a: so.Mapped[Optional[AModel]] = so.relationship()
+
+
 class BFilter(BaseFilter):
     id: int
     
@@ -66,6 +78,16 @@ class AFilter(BaseFilter):
     id: int
     b: BFilter
     b2: BFilter
+
+
+class NodeParentFilter(BaseFilter):
+    name: str
+    a: AFilter
+
+
+class NodeFilter(BaseFilter):
+    name: str
+    parent: NodeParentFilter
     
     
 def compile_statement(stmt: sa.Select) -> str:
@@ -103,6 +125,32 @@ def compile_statement(stmt: sa.Select) -> str:
 def test_append_filter_to_statement(filter_: BaseFilter, expected_stmt: str) -> None:
     stmt = append_filter_to_statement(sa.select(AModel), AModel, filter_)
     assert compile_statement(stmt) == expected_stmt
+
+
+def test_append_filter_to_statement_deep_nesting() -> None:
+    filter_ = NodeFilter(name="a", parent=NodeParentFilter(name="b", a=AFilter(id=1, b=BFilter(id=2))))
+    stmt = append_filter_to_statement(sa.select(NodeModel), NodeModel, filter_)
+    assert compile_statement(stmt) == (
+        "SELECT nodes.id, nodes.name, nodes.parent_id, nodes.a_id "
+        "FROM nodes "
+        "JOIN nodes AS nodes_1 ON nodes.parent_id = nodes_1.id AND nodes_1.name = 'b' "
+        "JOIN a AS a_1 ON nodes_1.a_id = a_1.id AND a_1.id = 1 "
+        "JOIN b AS b_1 ON a_1.b_id = b_1.id AND b_1.id = 2 "
+        "WHERE nodes.name = 'a'"
+    )
+
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with so.Session(engine) as session:
+        session.add_all([BModel(id=1), BModel(id=2), AModel(id=1, b_id=2, b2_id=1), AModel(id=2, b_id=1, b2_id=1)])
+        session.add_all([
+            NodeModel(id=1, name="b", a_id=1),
+            NodeModel(id=2, name="b", a_id=2),
+            NodeModel(id=3, name="a", parent_id=1, a_id=2),
+            NodeModel(id=4, name="a", parent_id=2, a_id=1),
+        ])
+        session.flush()
+        assert session.scalars(stmt).all() == [session.get(NodeModel, 3)]
     
 
 @pytest.mark.parametrize(
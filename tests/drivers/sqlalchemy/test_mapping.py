@@ -4,16 +4,18 @@ import pytest
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
-from pydantic_filters import BaseFilter, SearchField, SearchType
+from pydantic_filters import BaseFilter, FilterField, SearchField, SearchType
 from pydantic_filters.drivers.sqlalchemy._exceptions import (
     AttributeNotFoundSaDriverError,
     RelationshipNotFoundSaDriverError,
+    SupportSaDriverError,
 )
 from pydantic_filters.drivers.sqlalchemy._mapping import (
     filter_to_column_clauses,
     filter_to_join_targets,
     JoinParams,
 )
+from pydantic_filters.drivers.sqlalchemy._operators import _op_overlap
 
 
 class Base(so.DeclarativeBase):
@@ -38,6 +40,8 @@ class AModel(Base):
     __tablename__ = 'a'
     id: so.Mapped[int] = so.mapped_column(primary_key=True)
     name: so.Mapped[str]
+    tags: so.Mapped[List[str]] = so.mapped_column(sa.ARRAY(sa.String))
+    attrs: so.Mapped[dict] = so.mapped_column(sa.JSON)
     b_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(BModel.id))
     b: so.Mapped[BModel] = so.relationship()
     c: so.Mapped[List[CModel]] = so.relationship()
@@ -58,6 +62,13 @@ class FilterTest(BaseFilter):
     name__null: bool
     name__n: List[str]
     biba: str
+    tags: str
+    tags__ov: List[str]
+    name__ct: List[str]
+    color: List[str] = FilterField(target="attrs.color")
+    name_color: str = FilterField(target="name.color")
+    attrs_tags__ov: List[str] = FilterField(target="attrs.tags", type_="overlap")
+    q4: str = SearchField(target=["attrs.name"])
 
     q1: str = SearchField(target=["name"])
     q1_2: str = SearchField(target=["id", "name"])
@@ -80,6 +91,10 @@ class FilterTest(BaseFilter):
         (FilterTest(q1="a"), AModel.name.ilike("%a%")),
         (FilterTest(q1_2="a"), sa.or_(AModel.name.ilike("%a%"), AModel.id.ilike("%a%"))),
         (FilterTest(q2=["a", "b"]), sa.or_(AModel.name.like("%a%"), AModel.name.like("%b%"))),
+        (FilterTest(tags="a"), AModel.tags.any_() == "a"),
+        (FilterTest(tags__ov=["a", "b"]), _op_overlap(AModel.tags, True, ["a", "b"])),
+        (FilterTest(color=["red"]), AModel.attrs["color"].as_string().in_(["red"])),
+        (FilterTest(q4="a"), AModel.attrs["name"].as_string().ilike("%a%")),
     ]
 )
 def test_filter_to_column_clauses(filter_: BaseFilter, res_clause: sa.BinaryExpression[bool]) -> None:
@@ -93,6 +108,9 @@ def test_filter_to_column_clauses(filter_: BaseFilter, res_clause: sa.BinaryExpr
     [
         (FilterTest(biba="biba"), AttributeNotFoundSaDriverError),
         (FilterTest(q3="boba"), AttributeNotFoundSaDriverError),
+        (FilterTest(name__ct=["a"]), SupportSaDriverError),
+        (FilterTest(name_color="red"), SupportSaDriverError),
+        (FilterTest(attrs_tags__ov=["a"]), SupportSaDriverError),
     ]
 )
 def test_filter_to_column_clauses_raises(filter_: BaseFilter, exception: Type[Exception]) -> None:
@@ -1,8 +1,10 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 import sqlalchemy as sa
 import sqlalchemy.orm as so
+from sqlalchemy.dialects.postgresql import JSONB, dialect as sa_postgresql_dialect
+from sqlalchemy.dialects.sqlite import dialect as sa_sqlite_dialect
 
 from pydantic_filters import FilterType, SearchType
 from pydantic_filters.drivers.sqlalchemy._operators import (
@@ -12,8 +14,13 @@ from pydantic_filters.drivers.sqlalchemy._operators import (
     _op_null,
     _op_case_sensitive_search,
     _op_case_insensitive_search,
+    _op_overlap,
+    _op_contains,
+    _op_range,
     _filter_type_to_operator_map,
     _search_type_to_operator_map,
+    get_json_filter_operator,
+    get_json_search_operator,
 )
 
 
@@ -24,6 +31,8 @@ class Base(so.DeclarativeBase):
 class ModelTest(Base):
     __tablename__ = 'tests'
     id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    tags: so.Mapped[List[str]] = so.mapped_column(sa.ARRAY(sa.String))
+    attrs: so.Mapped[dict] = so.mapped_column(JSONB)
 
 
 @pytest.mark.parametrize(
@@ -112,6 +121,115 @@ def test_op_case_insensitive_search(is_sequence: bool, obj: Any, res_clause: sa.
     assert clause.compare(res_clause)
     
 
+def compile_clause(clause: sa.ColumnElement, dialect: sa.Dialect) -> str:
+    return str(clause.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize(
+    "is_sequence, obj, res_postgresql, res_sqlite",
+    [
+        (False, "a", "tests.tags && ARRAY['a']", "('a' = ANY (tests.tags))"),
+        (
+            True, ["a", "b"],
+            "tests.tags && ARRAY['a', 'b']",
+            "('a' = ANY (tests.tags) OR 'b' = ANY (tests.tags))",
+        ),
+    ]
+)
+def test_op_overlap(is_sequence: bool, obj: Any, res_postgresql: str, res_sqlite: str):
+    clause = _op_overlap(ModelTest.tags, is_sequence, obj)
+    assert compile_clause(clause, sa_postgresql_dialect()) == res_postgresql
+    assert compile_clause(clause, sa_sqlite_dialect()) == res_sqlite
+
+
+@pytest.mark.parametrize(
+    "is_sequence, obj, res_postgresql, res_sqlite",
+    [
+        (False, "a", "tests.tags @> ARRAY['a']", "('a' = ANY (tests.tags))"),
+        (
+            True, ["a", "b"],
+            "tests.tags @> ARRAY['a', 'b']",
+            "('a' = ANY (tests.tags) AND 'b' = ANY (tests.tags))",
+        ),
+    ]
+)
+def test_op_contains(is_sequence: bool, obj: Any, res_postgresql: str, res_sqlite: str):
+    clause = _op_contains(ModelTest.tags, is_sequence, obj)
+    assert compile_clause(clause, sa_postgresql_dialect()) == res_postgresql
+    assert compile_clause(clause, sa_sqlite_dialect()) == res_sqlite
+
+
+@pytest.mark.parametrize(
+    "is_sequence, obj, res_clause",
+    [
+        (False, (1, 2), ModelTest.id.between(1, 2)),
+        (False, (1, None), ModelTest.id >= 1),
+        (False, (None, 2), ModelTest.id <= 2),
+        (False, (None, None), sa.or_(sa.false(), sa.true())),
+        (False, (2, 1), sa.or_(sa.false())),
+        (True, [(5, 7), (1, 3), (4, 4)], ModelTest.id.between(1, 7)),
+        (True, [(1, 2), (10, None)], sa.or_(ModelTest.id.between(1, 2), ModelTest.id >= 10)),
+        (True, [], sa.or_(sa.false())),
+    ]
+)
+def test_op_range(is_sequence: bool, obj: Any, res_clause: sa.ColumnElement[bool]):
+    clause = _op_range(ModelTest.id, is_sequence, obj)
+    assert clause.compare(res_clause)
+
+
+def test_array_operation_cache_key():
+    assert (
+        _op_overlap(ModelTest.tags, True, ["a", "b"])._generate_cache_key()
+        == _op_overlap(ModelTest.tags, True, ["c", "d"])._generate_cache_key()
+    )
+
+
+@pytest.mark.parametrize(
+    "type_, path, is_sequence, obj, res_postgresql, res_params, res_sqlite",
+    [
+        (
+            FilterType.eq, ("color",), False, "red",
+            "tests.attrs @> %(param_1)s", {"param_1": {"color": "red"}},
+            "JSON_EXTRACT(tests.attrs, ?) = ?",
+        ),
+        (
+            FilterType.eq, ("size", "w"), True, [1, 2],
+            "tests.attrs @> ANY (%(param_1)s::JSONB[])", {"param_1": [{"size": {"w": 1}}, {"size": {"w": 2}}]},
+            "JSON_EXTRACT(tests.attrs, ?) IN (__[POSTCOMPILE_param_1])",
+        ),
+        (
+            FilterType.gt, ("size",), False, 1.5,
+            "CAST((tests.attrs ->> %(attrs_1)s) AS FLOAT) > %(param_1)s", {"attrs_1": "size", "param_1": 1.5},
+            "JSON_EXTRACT(tests.attrs, ?) > ?",
+        ),
+        (
+            FilterType.null, ("color",), False, True,
+            "CAST((tests.attrs ->> %(attrs_1)s) AS VARCHAR) IS NULL", {"attrs_1": "color"},
+            "JSON_EXTRACT(tests.attrs, ?) IS NULL",
+        ),
+    ]
+)
+def test_json_filter_operator(
+        type_: FilterType,
+        path: tuple,
+        is_sequence: bool,
+        obj: Any,
+        res_postgresql: str,
+        res_params: Dict[str, Any],
+        res_sqlite: str,
+):
+    clause = get_json_filter_operator(type_, path)(ModelTest.attrs, is_sequence, obj)
+    compiled = clause.compile(dialect=sa_postgresql_dialect())
+    assert str(compiled) == res_postgresql
+    assert compiled.params == res_params
+    assert str(clause.compile(dialect=sa_sqlite_dialect())) == res_sqlite
+
+
+def test_json_search_operator():
+    clause = get_json_search_operator(SearchType.case_sensitive, ("name",))(ModelTest.attrs, False, "a")
+    assert compile_clause(clause, sa_sqlite_dialect()) == "JSON_EXTRACT(tests.attrs, '$.\"name\"') LIKE '%a%'"
+
+
 @pytest.mark.parametrize(
     "map_, enum",
     [
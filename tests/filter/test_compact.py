@@ -0,0 +1,120 @@
+from datetime import date
+from typing import Any, List, Optional, Set
+
+import pytest
+from pydantic import ValidationError
+from typing_extensions import Annotated
+
+from pydantic_filters import BaseFilter, CompactSequence, FilterConfigDict, FilterField, Range, SearchField
+
+
+class CompactFilter(BaseFilter):
+    model_config = FilterConfigDict(compact_sequences=True)
+
+    id: List[int]
+    tags: Optional[Set[int]]
+    day: List[date]
+    name: List[str] = FilterField(compact=False)
+    age__range: List[Range[int]]
+    q: List[str] = SearchField(target=["name"])
+
+
+class CompactFieldFilter(BaseFilter):
+    id: List[int] = FilterField(compact=True)
+    name: List[str]
+
+
+@pytest.mark.parametrize(
+    "data, res",
+    [
+        ({"id": ["1,2", "3"]}, {"id": [1, 2, 3]}),
+        ({"id": "1-3,7"}, {"id": [1, 2, 3, 7]}),
+        ({"id": ["-5--3", "-1"]}, {"id": [-5, -4, -3, -1]}),
+        ({"id": [1, 2]}, {"id": [1, 2]}),
+        ({"tags": ["1,2,2"]}, {"tags": {1, 2}}),
+        ({"day": ["2024-01-01,2024-01-03"]}, {"day": [date(2024, 1, 1), date(2024, 1, 3)]}),
+        ({"name": ["a,b"]}, {"name": ["a,b"]}),
+        ({"q": ["a,b"]}, {"q": ["a,b"]}),
+        ({"age__range": [{"start": 1, "end": 2}]}, {"age__range": [Range[int](start=1, end=2)]}),
+    ]
+)
+def test_compact_sequences(data: dict, res: dict):
+    assert CompactFilter(**data).model_dump(exclude_unset=True) == CompactFilter(**res).model_dump(exclude_unset=True)
+
+
+@pytest.mark.parametrize(
+    "data, res",
+    [
+        ({"id": ["1-3"]}, {"id": [1, 2, 3]}),
+        ({"name": ["a,b"]}, {"name": ["a,b"]}),
+    ]
+)
+def test_compact_field(data: dict, res: dict):
+    assert CompactFieldFilter(**data).model_dump(exclude_unset=True) == res
+
+
+@pytest.mark.parametrize(
+    "value, loc",
+    [
+        ("3-1", ("id",)),
+        ("1-10001", ("id",)),
+        ("1,a", ("id", 1)),
+        ("1,,2", ("id", 1)),
+        ("1-a", ("id", 0)),
+    ]
+)
+def test_compact_errors(value: Any, loc: tuple):
+    with pytest.raises(ValidationError) as e:
+        CompactFilter(id=value)
+    assert e.value.errors()[0]["loc"] == loc
+
+
+def test_compact_requires_sequence():
+    with pytest.raises(ValueError, match="sequence"):
+        class _Filter(BaseFilter):
+            id: int = FilterField(compact=True)
+
+
+@pytest.mark.parametrize(
+    "compact, value, res",
+    [
+        (CompactSequence(separator=";"), "1-2;4", [1, 2, 4]),
+        (CompactSequence(ranges=False), "1,2", [1, 2]),
+        (CompactSequence(max_items=2), "1,2", [1, 2]),
+    ]
+)
+def test_compact_sequence(compact: CompactSequence, value: str, res: List[int]):
+    class _Filter(BaseFilter):
+        id: Annotated[List[int], compact]
+
+    assert _Filter(id=value).id == res
+
+
+@pytest.mark.parametrize("value", ["1-3", "1-2,4-5", ["1-2", "3-3"]])
+def test_compact_sequence_max_items(value: Any):
+    class _Filter(BaseFilter):
+        id: Annotated[List[int], CompactSequence(max_items=2)]
+
+    with pytest.raises(ValidationError, match="too many items"):
+        _Filter(id=value)
+
+
+def test_compact_sequence_max_items_plain():
+    class _Filter(BaseFilter):
+        id: Annotated[List[int], CompactSequence(max_items=2)]
+        tags: Annotated[List[str], CompactSequence(max_items=2)]
+
+    assert _Filter(id=["1,2,3", "4"], tags="a,b,c").model_dump() == {"id": [1, 2, 3, 4], "tags": ["a", "b", "c"]}
+    assert _Filter(id="1,2,3,5-6").id == [1, 2, 3, 5, 6]
+
+
+def test_compact_json_schema():
+    properties = CompactFilter.model_json_schema()["properties"]
+
+    assert properties["id"]["items"]["anyOf"] == [
+        {"type": "integer"},
+        {"type": "string", "pattern": r"^-?\d+(?:--?\d+)?(?:,-?\d+(?:--?\d+)?)*$"},
+    ]
+    assert properties["tags"]["anyOf"][0]["items"]["anyOf"][0] == {"type": "integer"}
+    assert properties["day"]["items"]["anyOf"][1] == {"type": "string", "pattern": "^.*,.*$"}
+    assert properties["name"]["items"] == {"type": "string"}
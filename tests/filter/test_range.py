@@ -0,0 +1,48 @@
+from datetime import date, datetime
+from typing import Any, List
+
+import pytest
+
+from pydantic_filters import Range
+from pydantic_filters.filter._range import get_range_bounds, merge_ranges
+
+
+@pytest.mark.parametrize(
+    "obj, res",
+    [
+        (Range(start=1, end=2), (1, 2)),
+        (Range(end=2), (None, 2)),
+        ({"start": 1, "end": 2}, (1, 2)),
+        ({"start": 1}, (1, None)),
+        ((1, 2), (1, 2)),
+        ([None, 2], (None, 2)),
+    ]
+)
+def test_get_range_bounds(obj: Any, res: tuple):
+    assert get_range_bounds(obj) == res
+
+
+@pytest.mark.parametrize(
+    "ranges, res",
+    [
+        ([], []),
+        ([(1, 2)], [(1, 2)]),
+        ([(5, 7), (1, 2), (3, 4), (10, None)], [(1, 7), (10, None)]),
+        ([(1, 5), (2, 3)], [(1, 5)]),
+        ([(None, 3), (None, 1), (2, 8), (20, 30), (9, 9)], [(None, 9), (20, 30)]),
+        ([(1, None), (5, 10)], [(1, None)]),
+        ([(5, 1), (7, 8)], [(7, 8)]),
+        ([(1.0, 2.0), (2.5, 3.0), (3.0, None)], [(1.0, 2.0), (2.5, None)]),
+        (
+            [(date(2024, 2, 1), date(2024, 2, 29)), (date(2024, 1, 1), date(2024, 1, 31))],
+            [(date(2024, 1, 1), date(2024, 2, 29))],
+        ),
+        (
+            [(datetime(2024, 1, 1), datetime(2024, 1, 2)), (datetime(2024, 1, 3), datetime(2024, 1, 4))],
+            [(datetime(2024, 1, 1), datetime(2024, 1, 2)), (datetime(2024, 1, 3), datetime(2024, 1, 4))],
+        ),
+        ([Range(start=1, end=3), {"start": 4, "end": 6}], [(1, 6)]),
+    ]
+)
+def test_merge_ranges(ranges: List[Any], res: List[tuple]):
+    assert merge_ranges(ranges) == res
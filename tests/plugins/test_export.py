@@ -0,0 +1,175 @@
+import csv
+import io
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from pydantic_filters import BaseFilter, BaseSort, SortByOrder
+from pydantic_filters.drivers.sqlalchemy import append_filter_to_statement, append_sort_to_statement
+from pydantic_filters.plugins.export import _content_disposition, _get_keys, encode_batches, iter_batches, stream_export
+from pydantic_filters.plugins.fastapi import FilterDepends, SortDepends
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+    price: so.Mapped[float]
+
+
+class ItemFilter(BaseFilter):
+    id__ge: int
+    name__ilike: str
+
+
+ITEMS = [{"id": i, "name": f'item "{i}", x' if i % 2 else f"item {i}", "price": i / 2} for i in range(1, 11)]
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("export") / "items.db"
+    engine = sa.create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(sa.insert(Item), ITEMS)
+    engine.dispose()
+    return path
+
+
+@pytest.fixture(scope="module")
+def session_factory(database: Path) -> so.sessionmaker:
+    return so.sessionmaker(sa.create_engine(f"sqlite:///{database}"))
+
+
+@pytest.mark.parametrize("batch_size, sizes", [(3, [3, 3, 3, 1]), (10, [10]), (100, [10])])
+def test_iter_batches(session_factory: so.sessionmaker, batch_size: int, sizes: List[int]):
+    batches = list(iter_batches(session_factory, sa.select(Item.id, Item.name, Item.price), batch_size=batch_size))
+    assert [len(b) for b in batches] == sizes
+    assert [row for batch in batches for row in batch] == ITEMS
+
+
+def test_iter_batches_entities(session_factory: so.sessionmaker):
+    with session_factory() as session:
+        batches = list(iter_batches(session, sa.select(Item), batch_size=4))
+    assert [row for batch in batches for row in batch] == ITEMS
+
+
+@pytest.mark.parametrize(
+    "format_, res",
+    [
+        ("ndjson", [b'{"id":1,"name":"a, \\"b\\""}\n', b'{"id":2,"name":null}\n']),
+        ("csv", [b'id,name\n1,"a, ""b"""\n', b"2,\n"]),
+    ]
+)
+def test_encode_batches(format_: str, res: List[bytes]):
+    batches = [[{"id": 1, "name": 'a, "b"'}], [], [{"id": 2, "name": None}]]
+    assert list(encode_batches(iter(batches), format_)) == res
+
+
+@pytest.mark.parametrize(
+    "format_, batches, res",
+    [
+        ("csv", [], [b"id,name\n"]),
+        ("csv", [[]], [b"id,name\n"]),
+        ("csv", [[{"id": 1, "name": "a"}]], [b"id,name\n1,a\n"]),
+        ("ndjson", [], [b""]),
+    ]
+)
+def test_encode_batches_keys(format_: str, batches: List[list], res: List[bytes]):
+    assert list(encode_batches(iter(batches), format_, keys=["id", "name"])) == res
+
+
+@pytest.mark.parametrize(
+    "statement, res",
+    [
+        (sa.select(Item), ["id", "name", "price"]),
+        (sa.select(so.aliased(Item)), ["id", "name", "price"]),
+        (sa.select(Item.id, Item.name.label("n")), ["id", "n"]),
+        (sa.select(Item.__table__), ["id", "name", "price"]),
+    ]
+)
+def test_get_keys(session_factory: so.sessionmaker, statement: sa.Select, res: List[str]):
+    assert _get_keys(statement) == res
+    with session_factory() as session:
+        assert [list(row) for batch in iter_batches(session, statement) for row in batch][0] == res
+
+
+@pytest.mark.parametrize(
+    "filename, res",
+    [
+        ("items.csv", 'attachment; filename="items.csv"'),
+        ('a"b\\c.csv', 'attachment; filename="a_b_c.csv"; filename*=UTF-8\'\'a%22b%5Cc.csv'),
+        ("a\r\nX-Header: 1", 'attachment; filename="a__X-Header: 1"; filename*=UTF-8\'\'a%0D%0AX-Header%3A%201'),
+        ("товары.csv", 'attachment; filename="______.csv"; filename*=UTF-8\'\'%D1%82%D0%BE%D0%B2%D0%B0%D1%80%D1%8B.csv'),
+    ]
+)
+def test_content_disposition(filename: str, res: str):
+    assert _content_disposition(filename) == res
+
+
+def _parse(format_: str, content: bytes) -> List[dict]:
+    if format_ == "ndjson":
+        return [json.loads(line) for line in content.splitlines()]
+    return [
+        {"id": int(r["id"]), "name": r["name"], "price": float(r["price"])}
+        for r in csv.DictReader(io.StringIO(content.decode()))
+    ]
+
+
+def _app(session: object) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/export")
+    def _export(
+            format_: str = "ndjson",
+            filter_: ItemFilter = FilterDepends(ItemFilter),
+            sort: BaseSort = SortDepends(BaseSort),
+    ):
+        statement = sa.select(Item.id, Item.name, Item.price)
+        statement = append_filter_to_statement(statement, Item, filter_)
+        statement = append_sort_to_statement(statement, Item, sort)
+        return stream_export(session, statement, format_=format_, batch_size=3, filename=f"items.{format_}")
+
+    return app
+
+
+@pytest.mark.parametrize("format_, media_type", [("ndjson", "application/x-ndjson"), ("csv", "text/csv")])
+@pytest.mark.parametrize("async_", [False, True], ids=["sync", "async"])
+def test_stream_export(database: Path, session_factory: so.sessionmaker, async_: bool, format_: str, media_type: str):
+    if async_:
+        pytest.importorskip("aiosqlite")
+        session = async_sessionmaker(create_async_engine(f"sqlite+aiosqlite:///{database}"))
+    else:
+        session = session_factory
+
+    client = TestClient(_app(session))
+    response = client.get(f"/export?format_={format_}&id__ge=3&sort_by=id&sort_by_order={SortByOrder.desc.value}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(media_type)
+    assert response.headers["content-disposition"] == f'attachment; filename="items.{format_}"'
+    assert _parse(format_, response.content) == ITEMS[:1:-1]
+
+
+@pytest.mark.parametrize("format_, res", [("ndjson", b""), ("csv", b"id,name,price\n")])
+def test_stream_export_empty(session_factory: so.sessionmaker, format_: str, res: bytes):
+    response = TestClient(_app(session_factory)).get(f"/export?format_={format_}&id__ge=100")
+    assert (response.status_code, response.content) == (200, res)
+
+
+@pytest.mark.parametrize("kwargs", [{"format_": "xml"}, {"batch_size": 0}])
+def test_stream_export_raises(session_factory: so.sessionmaker, kwargs: dict):
+    with pytest.raises(ValueError):
+        stream_export(session_factory, sa.select(Item), **kwargs)
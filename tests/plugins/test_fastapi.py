@@ -1,17 +1,34 @@
 from inspect import Parameter
+from types import SimpleNamespace
+from typing import Any, List, Set
 from unittest import mock
 
 import pytest
 from pydantic import Field
 from pydantic.fields import FieldInfo
-from fastapi import Query
+from fastapi import FastAPI, Query
 from fastapi import params as fastapi_params
+from fastapi.testclient import TestClient
 
-from pydantic_filters import BaseFilter
+from pydantic_filters import BaseFilter, BaseSort, FilterConfigDict, FilterField, OffsetPagination, SearchField
 from pydantic_filters.plugins.fastapi import (
+    ETagDepends,
+    FilterBodyDepends,
+    FilterDepends,
+    ListDepends,
+    ListParams,
+    PaginationDepends,
+    QueryCache,
+    SortDepends,
+    VersionCounter,
     _field_info_to_query,
+    setup_openapi,
     _get_custom_params,
+    _normalize_query,
+    get_etag,
 )
+from pydantic_filters.benchmarks.suite import measure
+from pydantic_filters.plugins.querystring import QueryStringDecoder
 from tests.misc import __field_info_eq__
 
 
@@ -65,3 +82,515 @@ def test_filter_to_function():
             annotation=int,
         ),
     ]
+
+
+class OnePassNestedFilter(BaseFilter):
+    id: List[int]
+
+
+class OnePassFilter(BaseFilter):
+    a: int
+    b__lt: int = FilterField(gt=0, le=100)
+    q: str = SearchField(target=["x"])
+    c: OnePassNestedFilter
+
+
+@pytest.fixture(scope="module")
+def one_pass_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/one-pass")
+    def _one_pass(filter_: OnePassFilter = FilterDepends(OnePassFilter, one_pass=True)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    @app.get("/default")
+    def _default(filter_: OnePassFilter = FilterDepends(OnePassFilter)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "a=1&q=z",
+        "c__id=1&c__id=2&b__lt=5",
+        "b__lt=200",
+        "a=abc",
+    ]
+)
+def test_filter_depends_one_pass(one_pass_client: TestClient, query: str):
+    one_pass = one_pass_client.get(f"/one-pass?{query}")
+    default = one_pass_client.get(f"/default?{query}")
+    assert (one_pass.status_code, one_pass.json()) == (default.status_code, default.json())
+
+
+def test_filter_depends_one_pass_openapi(one_pass_client: TestClient):
+    paths = one_pass_client.app.openapi()["paths"]
+    assert paths["/one-pass"]["get"]["parameters"] == paths["/default"]["get"]["parameters"]
+
+
+def test_dependencies_cache():
+    assert FilterDepends(FilterTest).dependency is FilterDepends(FilterTest).dependency
+    assert FilterDepends(FilterTest).dependency is not FilterDepends(FilterTest, prefix="f").dependency
+    assert FilterDepends(FilterTest).dependency is not FilterDepends(FilterTest, one_pass=True).dependency
+    assert SortDepends(BaseSort).dependency is SortDepends(BaseSort).dependency
+    assert PaginationDepends(OffsetPagination).dependency is PaginationDepends(OffsetPagination).dependency
+
+
+@pytest.fixture(scope="module")
+def list_client() -> TestClient:
+    app = FastAPI()
+
+    def _dump(params: ListParams) -> dict:
+        return {
+            "filter": params.filter.model_dump(exclude_unset=True),
+            "sort": params.sort.model_dump(),
+            "pagination": params.pagination.model_dump(),
+        }
+
+    @app.get("/separate")
+    def _separate(
+            filter_: OnePassFilter = FilterDepends(OnePassFilter),
+            sort: BaseSort = SortDepends(BaseSort),
+            pagination: OffsetPagination = PaginationDepends(OffsetPagination),
+    ) -> dict:
+        return _dump(ListParams(filter_, sort, pagination))
+
+    @app.get("/list")
+    def _list(params: ListParams = ListDepends(OnePassFilter, BaseSort, OffsetPagination)) -> dict:
+        return _dump(params)
+
+    @app.get("/list-one-pass")
+    def _list_one_pass(
+            params: ListParams = ListDepends(OnePassFilter, BaseSort, OffsetPagination, one_pass=True),
+    ) -> dict:
+        return _dump(params)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "a=1&sort_by=a&sort_by_order=desc&limit=5",
+        "c__id=1&c__id=2&offset=3",
+        "b__lt=200&limit=0",
+    ]
+)
+@pytest.mark.parametrize("path", ["/list", "/list-one-pass"])
+def test_list_depends(list_client: TestClient, path: str, query: str):
+    separate = list_client.get(f"/separate?{query}")
+    combined = list_client.get(f"{path}?{query}")
+    assert (combined.status_code, combined.json()) == (separate.status_code, separate.json())
+
+
+@pytest.mark.parametrize("path", ["/list", "/list-one-pass"])
+def test_list_depends_openapi(list_client: TestClient, path: str):
+    paths = list_client.app.openapi()["paths"]
+    assert paths[path]["get"]["parameters"] == paths["/separate"]["get"]["parameters"]
+
+
+def test_list_depends_partial():
+    assert ListDepends(sort=BaseSort).dependency(sort_by="a") == ListParams(None, BaseSort(sort_by="a"), None)
+
+
+def test_list_depends_duplicates():
+    class LimitFilter(BaseFilter):
+        limit: int
+
+    with pytest.raises(ValueError, match="limit"):
+        ListDepends(LimitFilter, pagination=OffsetPagination)
+
+
+@pytest.mark.parametrize(
+    "query, res",
+    [
+        (b"", b""),
+        (b"b=1&a=2&&a=1", b"a=2&a=1&b=1"),
+        (b"c__id=2&a&c__id=1", b"a&c__id=2&c__id=1"),
+    ]
+)
+def test_normalize_query(query: bytes, res: bytes):
+    assert _normalize_query(query) == res
+
+
+@pytest.fixture()
+def cache() -> QueryCache:
+    return QueryCache(maxsize=2)
+
+
+@pytest.fixture()
+def cached_client(cache: QueryCache) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/filter")
+    def _filter(filter_: OnePassFilter = FilterDepends(OnePassFilter, cache=cache)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    @app.get("/list")
+    def _list(params: ListParams = ListDepends(OnePassFilter, BaseSort, OffsetPagination, cache=cache)) -> dict:
+        return {
+            "filter": params.filter.model_dump(exclude_unset=True),
+            "sort": params.sort.model_dump(),
+            "pagination": params.pagination.model_dump(),
+        }
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "a=1&q=z",
+        "c__id=1&c__id=2&b__lt=5",
+        "b__lt=200",
+        "a=abc",
+    ]
+)
+def test_filter_depends_cache(one_pass_client: TestClient, cached_client: TestClient, query: str):
+    expected = one_pass_client.get(f"/default?{query}")
+    for _ in range(2):
+        response = cached_client.get(f"/filter?{query}")
+        assert (response.status_code, response.json()) == (expected.status_code, expected.json())
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "a=1&sort_by=a&sort_by_order=desc&limit=5",
+        "c__id=1&c__id=2&offset=3",
+        "b__lt=200&limit=0",
+    ]
+)
+def test_list_depends_cache(list_client: TestClient, cached_client: TestClient, query: str):
+    expected = list_client.get(f"/separate?{query}")
+    for _ in range(2):
+        response = cached_client.get(f"/list?{query}")
+        assert (response.status_code, response.json()) == (expected.status_code, expected.json())
+
+
+def test_cache_counters(cached_client: TestClient, cache: QueryCache):
+    cached_client.get("/filter?a=1&q=x")
+    cached_client.get("/filter?q=x&&a=1")
+    cached_client.get("/filter?a=2")
+    cached_client.get("/list?a=2")
+    cached_client.get("/filter?a=x")
+    cached_client.get("/filter?a=x")
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 5, 2)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_cache_lru(cache: QueryCache):
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("b", lambda: 2)
+    cache.get_or_set("a", lambda: 3)
+    cache.get_or_set("c", lambda: 4)
+
+    assert cache.get_or_set("a", lambda: 5) == 1
+    assert cache.get_or_set("b", lambda: 6) == 6
+
+
+def test_cache_shares_values(cache: QueryCache):
+    value = cache.get_or_set("a", lambda: (1,))
+    assert cache.get_or_set("a", lambda: (2,)) is value
+
+
+def test_cache_mutation_does_not_leak(cache: QueryCache):
+    app = FastAPI()
+
+    @app.get("/filter")
+    def _filter(filter_: OnePassFilter = FilterDepends(OnePassFilter, cache=cache)) -> dict:
+        res = filter_.model_dump(exclude_unset=True)
+        filter_.c.id.append(100)
+        filter_.a = 0
+        return res
+
+    client = TestClient(app)
+    responses = [client.get("/filter?a=1&c__id=1").json() for _ in range(3)]
+
+    assert responses == [{"a": 1, "c": {"id": [1]}}] * 3
+    assert cache.hits == 2
+
+
+def test_cache_hit_skips_validation(cached_client: TestClient):
+    with mock.patch.object(QueryStringDecoder, "validate", autospec=True, side_effect=QueryStringDecoder.validate) as m:
+        responses = [cached_client.get("/filter?c__id=1&c__id=2&q=x").json() for _ in range(3)]
+
+    assert responses == [{"q": "x", "c": {"id": [1, 2]}}] * 3
+    assert m.call_count == 1
+
+
+def test_cache_hit_is_cheaper(cache: QueryCache):
+    dependency = FilterDepends(OnePassFilter, cache=cache).dependency
+    request = SimpleNamespace(scope={"query_string": "&".join(f"c__id={i}" for i in range(5000)).encode()})
+
+    def _miss() -> None:
+        cache.clear()
+        dependency(request)
+
+    dependency(request)
+    assert measure(lambda: dependency(request), min_time=0.05) < measure(_miss, min_time=0.05)
+
+
+def test_cache_maxsize():
+    with pytest.raises(ValueError):
+        QueryCache(maxsize=0)
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["inline", "shared"])
+def query_string_client(request: pytest.FixtureRequest) -> TestClient:
+    app = FastAPI()
+    setup_openapi(app, shared_components=request.param)
+
+    @app.get("/filter")
+    def _filter(filter_: OnePassFilter = FilterDepends(OnePassFilter, query_string=True)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    @app.get("/list")
+    def _list(params: ListParams = ListDepends(OnePassFilter, BaseSort, OffsetPagination, cache=QueryCache())) -> dict:
+        return {"filter": params.filter.model_dump(exclude_unset=True)}
+
+    @app.get("/hidden", include_in_schema=False)
+    def _hidden(filter_: OnePassFilter = FilterDepends(OnePassFilter, query_string=True)) -> None:
+        pass
+
+    return TestClient(app)
+
+
+def _resolve(schema: dict, parameters: List[dict]) -> List[dict]:
+    components = schema["components"].get("parameters", {})
+    return [components[p["$ref"].rsplit("/", 1)[-1]] if "$ref" in p else p for p in parameters]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "a=1&q=z",
+        "c__id=1&c__id=2&b__lt=5",
+        "b__lt=200",
+        "a=abc",
+    ]
+)
+def test_filter_depends_query_string(one_pass_client: TestClient, query_string_client: TestClient, query: str):
+    expected = one_pass_client.get(f"/default?{query}")
+    response = query_string_client.get(f"/filter?{query}")
+    assert (response.status_code, response.json()) == (expected.status_code, expected.json())
+
+
+@pytest.mark.parametrize(
+    "path, expected_client, expected_path",
+    [
+        ("/filter", "one_pass_client", "/default"),
+        ("/list", "list_client", "/separate"),
+    ]
+)
+def test_setup_openapi(
+        query_string_client: TestClient,
+        request: pytest.FixtureRequest,
+        path: str,
+        expected_client: str,
+        expected_path: str,
+):
+    schema = query_string_client.app.openapi()
+    expected_schema = request.getfixturevalue(expected_client).app.openapi()
+    operation = schema["paths"][path]["get"]
+    expected = expected_schema["paths"][expected_path]["get"]
+
+    assert _resolve(schema, operation["parameters"]) == expected["parameters"]
+    assert operation["responses"]["422"] == expected["responses"]["422"]
+    assert expected_schema["components"]["schemas"].items() <= schema["components"]["schemas"].items()
+    assert "/hidden" not in schema["paths"]
+    assert query_string_client.app.openapi() is schema
+
+
+def test_setup_openapi_shared_components(query_string_client: TestClient):
+    schema = query_string_client.app.openapi()
+    refs = [p.get("$ref") for op in schema["paths"].values() for p in op["get"]["parameters"]]
+
+    if "parameters" not in schema["components"]:
+        assert not any(refs)
+        return
+
+    assert all(refs)
+    assert refs.count("#/components/parameters/OnePassFilter.a") == 2
+    assert "BaseSort.sort_by" in schema["components"]["parameters"]
+
+
+def test_setup_openapi_declared_parameters(one_pass_client: TestClient):
+    app = FastAPI()
+    setup_openapi(app, shared_components=True)
+
+    @app.get("/default")
+    def _default(filter_: OnePassFilter = FilterDepends(OnePassFilter)) -> None:
+        pass
+
+    # The parameters declared to FastAPI are left inline
+    schema = app.openapi()
+    expected = one_pass_client.app.openapi()["paths"]["/default"]["get"]["parameters"]
+    assert schema["paths"]["/default"]["get"]["parameters"] == expected
+    assert "parameters" not in schema["components"]
+
+
+class CompactNestedFilter(BaseFilter):
+    id: List[int] = FilterField(compact=True)
+
+
+class CompactFilter(BaseFilter):
+    model_config = FilterConfigDict(compact_sequences=True)
+
+    id: List[int]
+    c: CompactNestedFilter
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"one_pass": True},
+        {"query_string": True},
+    ]
+)
+def test_filter_depends_compact(kwargs: dict):
+    app = FastAPI()
+    setup_openapi(app)
+
+    @app.get("/")
+    def _filter(filter_: CompactFilter = FilterDepends(CompactFilter, **kwargs)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    client = TestClient(app)
+
+    response = client.get("/?id=1-3,5&id=8&c__id=2,3")
+    assert (response.status_code, response.json()) == (200, {"id": [1, 2, 3, 5, 8], "c": {"id": [2, 3]}})
+
+    response = client.get("/?id=3-1")
+    assert (response.status_code, response.json()["detail"][0]["loc"]) == (422, ["query", "id"])
+
+    schema = app.openapi()["paths"]["/"]["get"]["parameters"][0]["schema"]
+    assert schema["items"]["anyOf"][0] == {"type": "integer"}
+
+
+@pytest.fixture(scope="module")
+def body_client() -> TestClient:
+    app = FastAPI()
+    setup_openapi(app)
+
+    @app.post("/search")
+    def _search(filter_: OnePassFilter = FilterBodyDepends(OnePassFilter)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "body, status_code, res",
+    [
+        (b"", 200, {}),
+        (b"{}", 200, {}),
+        (b'{"a": 1, "q": "z", "c": {"id": [1, 2]}}', 200, {"a": 1, "q": "z", "c": {"id": [1, 2]}}),
+        (b'{"b__lt": 200}', 422, [["body", "b__lt"]]),
+        (b'{"c": {"id": ["x"]}}', 422, [["body", "c", "id", 0]]),
+        (b'{"a": ', 422, [["body"]]),
+    ]
+)
+def test_filter_body_depends(body_client: TestClient, body: bytes, status_code: int, res: Any):
+    response = body_client.post("/search", content=body)
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert response.json() == res
+    else:
+        assert [e["loc"] for e in response.json()["detail"]] == res
+
+
+def test_filter_body_depends_openapi(body_client: TestClient):
+    schema = body_client.app.openapi()
+    operation = schema["paths"]["/search"]["post"]
+
+    assert operation["requestBody"] == {
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/OnePassFilter"}}},
+    }
+    assert "422" in operation["responses"]
+    assert {"OnePassFilter", "OnePassNestedFilter", "HTTPValidationError"} <= set(schema["components"]["schemas"])
+
+
+class SetFilter(BaseFilter):
+    a: int
+    tags: Set[str]
+
+
+@pytest.mark.parametrize(
+    "params1, params2, version1, version2, res",
+    [
+        (ListParams(SetFilter(a=1), None, None), ListParams(SetFilter(a=1), None, None), 1, 1, True),
+        (ListParams(SetFilter(a=1), None, None), ListParams(SetFilter(a=1), None, None), 1, 2, False),
+        (ListParams(SetFilter(a=1), None, None), ListParams(SetFilter(a=2), None, None), 1, 1, False),
+        (ListParams(SetFilter(a=1), None, None), ListParams(SetFilter(a=1, tags=set()), None, None), 1, 1, False),
+        (
+            ListParams(SetFilter(tags={"x", "y", "z"}), None, None),
+            ListParams(SetFilter(tags={"z", "x", "y"}), None, None),
+            1, 1, True,
+        ),
+        (
+            ListParams(None, BaseSort(), OffsetPagination()),
+            ListParams(None, BaseSort(sort_by=None), OffsetPagination(limit=100)),
+            1, 1, True,
+        ),
+    ]
+)
+def test_get_etag(params1: ListParams, params2: ListParams, version1: Any, version2: Any, res: bool):
+    assert (get_etag(params1, version1) == get_etag(params2, version2)) is res
+
+
+@pytest.fixture()
+def etag_client() -> TestClient:
+    app = FastAPI()
+    app.state.version = VersionCounter()
+    app.state.calls = 0
+
+    async def _version() -> int:
+        return app.state.version()
+
+    @app.get("/list")
+    def _list(
+            params: ListParams = ListDepends(OnePassFilter, BaseSort, OffsetPagination),
+            etag: str = ETagDepends(OnePassFilter, BaseSort, OffsetPagination, version=_version),
+    ) -> dict:
+        app.state.calls += 1
+        return {"filter": params.filter.model_dump(exclude_unset=True), "etag": etag}
+
+    return TestClient(app)
+
+
+def test_etag_depends(etag_client: TestClient):
+    response = etag_client.get("/list?a=1&limit=5")
+    etag = response.headers["etag"]
+    assert (response.status_code, response.json()) == (200, {"filter": {"a": 1}, "etag": etag})
+
+    for header in (etag, f"W/{etag}", f'"x", {etag}', "*"):
+        response = etag_client.get("/list?limit=5&a=1", headers={"If-None-Match": header})
+        assert (response.status_code, response.content, response.headers["etag"]) == (304, b"", etag)
+
+    response = etag_client.get("/list?a=2&limit=5", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    etag_client.app.state.version.increment()
+    response = etag_client.get("/list?a=1&limit=5", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    assert etag_client.app.state.calls == 3
+
+
+def test_etag_depends_validation(etag_client: TestClient):
+    response = etag_client.get("/list?a=x", headers={"If-None-Match": "*"})
+    assert response.status_code == 422
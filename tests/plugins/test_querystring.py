@@ -0,0 +1,184 @@
+import subprocess
+import sys
+from datetime import date
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from pydantic_filters import BaseFilter, BaseSort, FilterField, OffsetPagination, SearchField
+from pydantic_filters.benchmarks.querystring import run
+from pydantic_filters.plugins.fastapi import FilterDepends, ListDepends, ListParams
+from pydantic_filters.plugins.querystring import (
+    QueryStringDecoder,
+    decode_query_string,
+    get_query_string_decoder,
+)
+
+
+class NestedFilter(BaseFilter):
+    id: List[int]
+    name: str
+
+
+class FilterTest(BaseFilter):
+    a: int
+    b__lt: int = FilterField(gt=0, le=100)
+    q: str = SearchField(target=["x", "y"])
+    qs: List[str] = SearchField(target=["x"])
+    c: NestedFilter
+
+
+class SortByEnum(str, Enum):
+    a = "a"
+    b = "b"
+
+
+class SortTest(BaseSort):
+    sort_by: Optional[SortByEnum] = None
+
+
+def _dump(params: ListParams) -> dict:
+    return {
+        "filter": params.filter.model_dump(mode="json", exclude_unset=True),
+        "sort": params.sort.model_dump(mode="json"),
+        "pagination": params.pagination.model_dump(mode="json"),
+    }
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/")
+    def _list(params: ListParams = ListDepends(FilterTest, SortTest, OffsetPagination)) -> dict:
+        return _dump(params)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "a=1&a=2",
+        "c__id=1&c__id=2&c__name=x%20y&q=a+b",
+        "qs=1&qs=2&sort_by=b&sort_by_order=desc&limit=5&offset=10",
+        "unknown=1&c__unknown=2&&=&c__name",
+        "c__name=%D0%BF%D1%80%D0%B8%D0%B2%D0%B5%D1%82",
+    ]
+)
+def test_parity_with_fastapi(client: TestClient, query: str):
+    expected = client.get(f"/?{query}").json()
+    params = decode_query_string(query.encode(), FilterTest, SortTest, OffsetPagination)
+    assert _dump(params) == expected
+
+
+class TupleFilter(BaseFilter):
+    created__range: Tuple[Optional[date], Optional[date]]
+    tags: Tuple[str, ...]
+    name: str
+
+
+@pytest.fixture(scope="module")
+def tuple_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/default")
+    def _default(filter_: TupleFilter = FilterDepends(TupleFilter)) -> dict:
+        return filter_.model_dump(mode="json", exclude_unset=True)
+
+    @app.get("/one-pass")
+    def _one_pass(filter_: TupleFilter = FilterDepends(TupleFilter, one_pass=True)) -> dict:
+        return filter_.model_dump(mode="json", exclude_unset=True)
+
+    @app.get("/query-string")
+    def _query_string(filter_: TupleFilter = FilterDepends(TupleFilter, query_string=True)) -> dict:
+        return filter_.model_dump(mode="json", exclude_unset=True)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "query, status_code",
+    [
+        ("created__range=2024-01-01&created__range=2024-02-01", 200),
+        ("created__range=2024-01-01&created__range=2024-02-01&tags=a&tags=b&name=x", 200),
+        ("tags=a&name=x&name=y", 200),
+        ("created__range=2024-01-01&created__range=", 422),
+        ("created__range=2024-01-01", 422),
+    ]
+)
+def test_parity_with_fastapi_tuples(tuple_client: TestClient, query: str, status_code: int):
+    responses = [tuple_client.get(f"/{path}?{query}") for path in ("default", "one-pass", "query-string")]
+    assert [r.status_code for r in responses] == [status_code] * 3
+    assert responses[0].json() == responses[1].json() == responses[2].json()
+
+    if status_code == 200:
+        params = decode_query_string(query, TupleFilter)
+        assert params.filter.model_dump(mode="json", exclude_unset=True) == responses[0].json()
+    else:
+        with pytest.raises(ValidationError):
+            decode_query_string(query, TupleFilter)
+
+
+@pytest.mark.parametrize(
+    "query, locs",
+    [
+        ("a=x", [("a",)]),
+        ("b__lt=200&limit=0", [("b__lt",), ("limit",)]),
+        ("sort_by=c", [("sort_by",)]),
+    ]
+)
+def test_decode_raises(query: str, locs: list):
+    with pytest.raises(ValidationError) as e:
+        decode_query_string(query, FilterTest, SortTest, OffsetPagination)
+    assert [error["loc"] for error in e.value.errors()] == locs
+
+
+@pytest.mark.parametrize(
+    "query, res",
+    [
+        ("", {}),
+        ("a=1&a=2", {"a": "2"}),
+        ("c__id=1&c__id=2", {"c__id": ["1", "2"]}),
+        ("q=a+b%26c&x=1", {"q": "a b&c"}),
+        ("a%3D=1&a", {"a": ""}),
+    ]
+)
+@pytest.mark.parametrize("encode", [False, True])
+def test_collect(query: str, res: dict, encode: bool):
+    decoder = QueryStringDecoder(FilterTest)
+    assert decoder.collect(query.encode() if encode else query) == res
+
+
+def test_collect_memoryview():
+    decoder = QueryStringDecoder(FilterTest, prefix="f")
+    assert decoder.collect(memoryview(b"f__a=1&a=2&f__qs=3")) == {"f__a": "1", "f__qs": ["3"]}
+
+
+def test_decode_partial():
+    assert decode_query_string("sort_by=a", sort=SortTest) == ListParams(None, SortTest(sort_by="a"), None)
+
+
+def test_plugins_import():
+    code = (
+        "import sys, pydantic_filters.plugins as plugins; "
+        "assert 'fastapi' not in sys.modules; "
+        "assert plugins.fastapi.FilterDepends and 'fastapi' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_decoder_cache():
+    assert get_query_string_decoder(FilterTest) is get_query_string_decoder(FilterTest)
+    assert get_query_string_decoder(FilterTest) is not get_query_string_decoder(FilterTest, prefix="f")
+
+
+
+def test_benchmark():
+    """Both applications serve the benchmark query with 200"""
+    assert all(t > 0 for t in run(number=5, repeat=1).values())
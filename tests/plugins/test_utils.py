@@ -10,6 +10,8 @@ from pydantic_filters.plugins._utils import (
     remove_prefix,
     squash_filter,
     inflate_filter,
+    flat_filter_model,
+    _get_routing,
 )
 
 
@@ -92,3 +94,69 @@ def test_inflate_filter(prefix: str, delimiter: str, data: Dict[str, Any], res:
         delimiter=delimiter, 
         data=data,
     ).model_dump(exclude_unset=True) == res
+
+
+@pytest.mark.parametrize(
+    "prefix, delimiter, data, res",
+    [
+        ("", "__", {"a": "1"}, {"a": 1}),
+        ("f", "___", {"f___a": "1", "f___b___d___e": "3"}, {"f___a": 1, "f___b___d___e": 3}),
+        ("", "__", {"a": "1", "b__c": "2", "b__d__e": "3"}, {"a": 1, "b__c": 2, "b__d__e": 3}),
+    ]
+)
+def test_flat_filter_model(prefix: str, delimiter: str, data: Dict[str, Any], res: Dict[str, Any]):
+    model = flat_filter_model(filter_=FilterTest, prefix=prefix, delimiter=delimiter)
+    assert list(model.model_fields) == list(squash_filter(FilterTest, prefix, delimiter))
+    assert model.model_validate(data).model_dump(exclude_unset=True) == res
+
+
+@pytest.mark.parametrize(
+    "data, res",
+    [
+        ({}, {}),
+        ({"a": None, "b__c": None}, {}),
+        ({"b__d__e": 3}, {"b": {"d": {"e": 3}}}),
+        ({"x": 1, "b__x": 2, "bc": 3, "a": 1}, {"a": 1}),
+    ]
+)
+def test_inflate_filter_skips(data: Dict[str, Any], res: Dict[str, Any]):
+    assert inflate_filter(
+        filter_=FilterTest,
+        prefix="",
+        delimiter="__",
+        data=data,
+    ).model_dump(exclude_unset=True) == res
+
+
+@pytest.mark.parametrize(
+    "data, res",
+    [
+        ({"a": 1, "b__c": 2}, {"a": 1, "b": {"c": 2}}),
+        ({"f__a": 1, "b__d__e": 3}, {"a": 1, "b": {"d": {"e": 3}}}),
+        ({"f__x": 1, "x": 2}, {}),
+    ]
+)
+def test_inflate_filter_without_prefix(data: Dict[str, Any], res: Dict[str, Any]):
+    """Keys without the prefix are accepted, as before the routing table"""
+    assert inflate_filter(
+        filter_=FilterTest,
+        prefix="f",
+        delimiter="__",
+        data=data,
+    ).model_dump(exclude_unset=True) == res
+
+
+def test_inflate_filter_routing_cache():
+    _get_routing.cache_clear()
+    inflate_filter(FilterTest, "", "__", {"a": 1})
+    inflate_filter(FilterTest, "", "__", {"b__c": 1})
+    inflate_filter(FilterTest, "f", "__", {"f__a": 1})
+
+    assert _get_routing.cache_info().hits == 1
+    assert _get_routing.cache_info().misses == 2
+
+
+def test_squash_filter_cache():
+    assert squash_filter(FilterTest, "", "__") is squash_filter(FilterTest, "", "__")
+    assert flat_filter_model(FilterTest, "", "__") is flat_filter_model(FilterTest, "", "__")
+    assert flat_filter_model(FilterTest, "", "__") is not flat_filter_model(FilterTest, "f", "__")
@@ -0,0 +1,198 @@
+from typing import Iterator, List, Literal, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pydantic_filters import (
+    BaseFilter,
+    BaseSort,
+    MetricsCollector,
+    OffsetPagination,
+    SearchField,
+    SortByOrder,
+    get_collector,
+    set_collector,
+)
+from pydantic_filters._metrics import record_usage
+from pydantic_filters.plugins.fastapi import (
+    FilterBodyDepends,
+    FilterDepends,
+    ListDepends,
+    QueryCache,
+    SortDepends,
+)
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+    name__ilike: str
+
+
+class UserFilter(BaseFilter):
+    id: List[int]
+    age__ge: int
+    q: str = SearchField(target=["login", "email"])
+    tags: List[str] = SearchField(target=["tags"])
+    department: DepartmentFilter
+
+
+class UserSort(BaseSort):
+    sort_by: Optional[Literal["id", "age"]] = None
+
+
+@pytest.fixture
+def collector() -> Iterator[MetricsCollector]:
+    collector = MetricsCollector(sequence_length_buckets=(1, 5), search_term_length_buckets=(4,))
+    set_collector(collector)
+    yield collector
+    set_collector(None)
+
+
+def _samples(collector: MetricsCollector) -> List[str]:
+    return [line for line in collector.to_prometheus().splitlines() if not line.startswith("#")]
+
+
+def test_disabled() -> None:
+    assert get_collector() is None
+    record_usage(UserFilter(id=[1]), UserSort(sort_by="id"))
+
+
+def test_record_filter(collector: MetricsCollector) -> None:
+    assert get_collector() is collector
+    collector.record(UserFilter(id=[1, 2, 3], q="alice", department=DepartmentFilter(name__ilike="%a%")))
+    collector.record(UserFilter(id=[1], tags=["a", "abcdef"]))
+
+    assert _samples(collector) == [
+        'pydantic_filters_filters_total{filter="UserFilter"} 2',
+        'pydantic_filters_fields_total{filter="UserFilter",path="age__ge",kind="filter",target="age",operator="ge"} 0',
+        'pydantic_filters_fields_total{filter="UserFilter",path="department__id"'
+        ',kind="filter",target="id",operator="eq"} 0',
+        'pydantic_filters_fields_total{filter="UserFilter",path="department__name__ilike"'
+        ',kind="filter",target="name",operator="ilike"} 1',
+        'pydantic_filters_fields_total{filter="UserFilter",path="id",kind="filter",target="id",operator="eq"} 2',
+        'pydantic_filters_fields_total{filter="UserFilter",path="q"'
+        ',kind="search",target="login,email",operator="case_insensitive"} 1',
+        'pydantic_filters_fields_total{filter="UserFilter",path="tags"'
+        ',kind="search",target="tags",operator="case_insensitive"} 1',
+        'pydantic_filters_nested_total{filter="UserFilter",path="department"} 1',
+        'pydantic_filters_sequence_length_bucket{filter="UserFilter",path="id",le="1.0"} 1',
+        'pydantic_filters_sequence_length_bucket{filter="UserFilter",path="id",le="5.0"} 2',
+        'pydantic_filters_sequence_length_bucket{filter="UserFilter",path="id",le="+Inf"} 2',
+        'pydantic_filters_sequence_length_sum{filter="UserFilter",path="id"} 4',
+        'pydantic_filters_sequence_length_count{filter="UserFilter",path="id"} 2',
+        'pydantic_filters_sequence_length_bucket{filter="UserFilter",path="tags",le="1.0"} 0',
+        'pydantic_filters_sequence_length_bucket{filter="UserFilter",path="tags",le="5.0"} 1',
+        'pydantic_filters_sequence_length_bucket{filter="UserFilter",path="tags",le="+Inf"} 1',
+        'pydantic_filters_sequence_length_sum{filter="UserFilter",path="tags"} 2',
+        'pydantic_filters_sequence_length_count{filter="UserFilter",path="tags"} 1',
+        'pydantic_filters_search_term_length_bucket{filter="UserFilter",path="q",le="4.0"} 0',
+        'pydantic_filters_search_term_length_bucket{filter="UserFilter",path="q",le="+Inf"} 1',
+        'pydantic_filters_search_term_length_sum{filter="UserFilter",path="q"} 5',
+        'pydantic_filters_search_term_length_count{filter="UserFilter",path="q"} 1',
+        'pydantic_filters_search_term_length_bucket{filter="UserFilter",path="tags",le="4.0"} 1',
+        'pydantic_filters_search_term_length_bucket{filter="UserFilter",path="tags",le="+Inf"} 2',
+        'pydantic_filters_search_term_length_sum{filter="UserFilter",path="tags"} 7',
+        'pydantic_filters_search_term_length_count{filter="UserFilter",path="tags"} 2',
+    ]
+
+
+def test_prometheus_format(collector: MetricsCollector) -> None:
+    text = collector.to_prometheus()
+    assert text.endswith("\n")
+    assert text.splitlines()[:2] == [
+        "# HELP pydantic_filters_filters_total Recorded filters by the filter class.",
+        "# TYPE pydantic_filters_filters_total counter",
+    ]
+    assert "# TYPE pydantic_filters_sequence_length histogram" in text
+    assert _samples(collector) == []
+
+    custom = MetricsCollector(namespace="app")
+    custom.record(sort=UserSort(sort_by="id"))
+    assert _samples(custom) == ['app_sorts_total{sort="UserSort",by="id",order="asc"} 1']
+
+
+@pytest.mark.parametrize(
+    ("sort", "expected"),
+    [
+        (UserSort(), []),
+        (UserSort(sort_by="age"), ['pydantic_filters_sorts_total{sort="UserSort",by="age",order="asc"} 1']),
+        (
+            UserSort(sort_by="age", sort_by_order=SortByOrder.desc),
+            ['pydantic_filters_sorts_total{sort="UserSort",by="age",order="desc"} 1'],
+        ),
+    ],
+)
+def test_record_sort(collector: MetricsCollector, sort: UserSort, expected: List[str]) -> None:
+    collector.record(sort=sort)
+    assert _samples(collector) == expected
+
+
+def test_escape(collector: MetricsCollector) -> None:
+    sort = BaseSort.model_construct(sort_by='a"b\\c\nd')
+    collector.record(sort=sort)
+    assert _samples(collector) == ['pydantic_filters_sorts_total{sort="BaseSort",by="a\\"b\\\\c\\nd",order="asc"} 1']
+
+
+def test_reset(collector: MetricsCollector) -> None:
+    collector.record(UserFilter(id=[1]), UserSort(sort_by="id"))
+    collector.reset()
+    assert _samples(collector) == []
+
+
+def _create_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/users")
+    def get_users(
+            filter_: UserFilter = FilterDepends(UserFilter),
+            sort: UserSort = SortDepends(UserSort),
+    ) -> None:
+        pass
+
+    @app.get("/users/cached")
+    def get_users_cached(filter_: UserFilter = FilterDepends(UserFilter, cache=QueryCache())) -> None:
+        pass
+
+    @app.get("/users/list")
+    def list_users(params=ListDepends(UserFilter, UserSort, OffsetPagination)) -> None:  # noqa: ANN001
+        pass
+
+    @app.post("/users/search")
+    def search_users(filter_: UserFilter = FilterBodyDepends(UserFilter)) -> None:
+        pass
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "body"),
+    [
+        ("GET", "/users?id=1&id=2&department__name__ilike=a&sort_by=age", None),
+        ("GET", "/users/list?id=1&id=2&department__name__ilike=a&sort_by=age&limit=10", None),
+        ("POST", "/users/search", {"id": [1, 2], "department": {"name__ilike": "a"}}),
+    ],
+)
+def test_fastapi(collector: MetricsCollector, method: str, url: str, body: Optional[dict]) -> None:
+    response = _create_client().request(method, url, json=body)
+    assert response.status_code == 200
+
+    samples = _samples(collector)
+    assert 'pydantic_filters_filters_total{filter="UserFilter"} 1' in samples
+    assert 'pydantic_filters_nested_total{filter="UserFilter",path="department"} 1' in samples
+    assert 'pydantic_filters_sequence_length_sum{filter="UserFilter",path="id"} 2' in samples
+    sorts = [s for s in samples if s.startswith("pydantic_filters_sorts_total")]
+    expected = [] if method == "POST" else ['pydantic_filters_sorts_total{sort="UserSort",by="age",order="asc"} 1']
+    assert sorts == expected
+
+
+def test_fastapi_cache(collector: MetricsCollector) -> None:
+    client = _create_client()
+    for _ in range(3):
+        assert client.get("/users/cached?age__ge=18").status_code == 200
+
+    samples = _samples(collector)
+    assert 'pydantic_filters_filters_total{filter="UserFilter"} 3' in samples
+    assert (
+        'pydantic_filters_fields_total{filter="UserFilter",path="age__ge",kind="filter",target="age",operator="ge"} 3'
+    ) in samples
@@ -0,0 +1,326 @@
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pydantic_filters import (
+    BaseFilter,
+    BaseSort,
+    NoopTracer,
+    OffsetPagination,
+    SearchField,
+    SortByOrder,
+    get_filter_attributes,
+    get_tracer,
+    set_tracer,
+)
+from pydantic_filters._tracing import start_span
+from pydantic_filters.drivers.sql import SqlTable, compile_count, compile_select
+from pydantic_filters.drivers.sqlalchemy import (
+    TableJoin,
+    append_to_statement,
+    append_to_table_statement,
+    get_count_statement,
+    instrument_engine,
+)
+from pydantic_filters.plugins.fastapi import FilterBodyDepends, FilterDepends
+
+
+class RecordingSpan:
+
+    def __init__(self, tracer: "RecordingTracer", name: str, attributes: Optional[Dict[str, Any]]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "RecordingSpan":
+        self.parent = self.tracer.stack[-1].name if self.tracer.stack else None
+        self.tracer.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        assert self.tracer.stack.pop() is self
+        self.error = exc
+
+
+class RecordingTracer:
+
+    def __init__(self) -> None:
+        self.spans: List[RecordingSpan] = []
+        self.stack: List[RecordingSpan] = []
+
+    def start_as_current_span(self, name: str, *, attributes: Optional[Dict[str, Any]] = None) -> RecordingSpan:
+        span = RecordingSpan(self, name, attributes)
+        self.spans.append(span)
+        return span
+
+    @property
+    def names(self) -> List[str]:
+        return [s.name for s in self.spans]
+
+
+@pytest.fixture
+def tracer() -> Iterator[RecordingTracer]:
+    tracer = RecordingTracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class Department(Base):
+    __tablename__ = "departments"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    name: so.Mapped[str]
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    login: so.Mapped[str]
+    email: so.Mapped[str]
+    department_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey(Department.id))
+
+    department: so.Mapped[Department] = so.relationship()
+
+
+class DepartmentFilter(BaseFilter):
+    id: List[int]
+    name: str
+
+
+class UserFilter(BaseFilter):
+    id: List[int]
+    login: str
+    q: List[str] = SearchField(target=["login", "email"])
+    department: DepartmentFilter
+
+
+FILTER = UserFilter(id=[1, 2, 3], q=["a"], department=DepartmentFilter(id=[1, 2, 3, 4, 5]))
+FILTER_ATTRIBUTES = {
+    "pydantic_filters.filter": "UserFilter",
+    "pydantic_filters.filter.active_fields": 3,
+    "pydantic_filters.filter.max_sequence_length": 5,
+    "pydantic_filters.filter.joins": 1,
+}
+
+
+def test_noop_tracer() -> None:
+    assert isinstance(get_tracer(), NoopTracer)
+    with start_span("name", lambda: pytest.fail("Attributes are computed")) as span:
+        span.set_attribute("key", "value")
+
+    set_tracer(NoopTracer())
+    assert isinstance(get_tracer(), NoopTracer)
+
+
+def test_set_tracer(tracer: RecordingTracer) -> None:
+    assert get_tracer() is tracer
+    with start_span("name", lambda: {"key": 1}):
+        pass
+    assert tracer.names == ["name"]
+    assert tracer.spans[0].attributes == {"key": 1}
+
+
+@pytest.mark.parametrize(
+    ("filter_", "expected"),
+    [
+        (
+            UserFilter(),
+            {
+                "pydantic_filters.filter": "UserFilter",
+                "pydantic_filters.filter.active_fields": 0,
+                "pydantic_filters.filter.max_sequence_length": 0,
+                "pydantic_filters.filter.joins": 0,
+            },
+        ),
+        (
+            UserFilter(login="alice", id=[1, 2]),
+            {
+                "pydantic_filters.filter": "UserFilter",
+                "pydantic_filters.filter.active_fields": 2,
+                "pydantic_filters.filter.max_sequence_length": 2,
+                "pydantic_filters.filter.joins": 0,
+            },
+        ),
+        (FILTER, FILTER_ATTRIBUTES),
+    ],
+)
+def test_get_filter_attributes(filter_: UserFilter, expected: Dict[str, Any]) -> None:
+    assert get_filter_attributes(filter_) == expected
+
+
+def test_append_to_statement(tracer: RecordingTracer) -> None:
+    append_to_statement(
+        sa.select(User),
+        User,
+        filter_=FILTER,
+        sort=BaseSort(sort_by="login", sort_by_order=SortByOrder.desc),
+        pagination=OffsetPagination(limit=10, offset=20),
+    )
+
+    assert tracer.names == [
+        "pydantic_filters.filter_to_join_targets",
+        "pydantic_filters.filter_to_column_clauses",
+        "pydantic_filters.append_sort",
+        "pydantic_filters.append_pagination",
+    ]
+    assert tracer.spans[0].attributes == FILTER_ATTRIBUTES
+    assert tracer.spans[1].attributes == FILTER_ATTRIBUTES
+    assert tracer.spans[2].attributes == {
+        "pydantic_filters.sort": "BaseSort",
+        "pydantic_filters.sort.by": "login",
+        "pydantic_filters.sort.order": "desc",
+    }
+    assert tracer.spans[3].attributes == {
+        "pydantic_filters.pagination": "OffsetPagination",
+        "pydantic_filters.pagination.limit": 10,
+        "pydantic_filters.pagination.offset": 20,
+    }
+
+
+def test_get_count_statement(tracer: RecordingTracer) -> None:
+    get_count_statement(User, FILTER)
+    assert tracer.names == [
+        "pydantic_filters.filter_to_join_targets",
+        "pydantic_filters.filter_to_column_clauses",
+    ]
+
+
+def test_append_to_table_statement(tracer: RecordingTracer) -> None:
+    users = User.__table__
+    append_to_table_statement(
+        sa.select(users),
+        users,
+        filter_=FILTER,
+        sort=BaseSort(sort_by="login"),
+        joins={"department": TableJoin(Department.__table__)},
+    )
+
+    assert tracer.names == [
+        "pydantic_filters.filter_to_join_targets",
+        "pydantic_filters.filter_to_column_clauses",
+        "pydantic_filters.append_sort",
+    ]
+    assert tracer.spans[0].attributes == FILTER_ATTRIBUTES
+
+
+@pytest.mark.parametrize("count", [False, True])
+def test_sql_compile(tracer: RecordingTracer, count: bool) -> None:
+    table = SqlTable("users", columns=["id", "login", "email"])
+    filter_ = UserFilter(id=[1, 2], login="alice")
+    if count:
+        compile_count(table, filter_, paramstyle="qmark")
+    else:
+        compile_select(table, filter_=filter_, paramstyle="qmark")
+
+    assert tracer.names == ["pydantic_filters.compile"]
+    assert tracer.spans[0].attributes == {
+        "pydantic_filters.paramstyle": "qmark",
+        **get_filter_attributes(filter_),
+    }
+
+
+@pytest.fixture
+def engine() -> Iterator[sa.Engine]:
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    instrument_engine(engine)
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_instrument_engine(tracer: RecordingTracer, engine: sa.Engine) -> None:
+    with so.Session(engine) as session:
+        session.execute(append_to_statement(sa.select(User), User, filter_=FILTER)).all()
+
+    assert tracer.names[-2:] == ["pydantic_filters.compile", "pydantic_filters.execute"]
+    compile_span, execute_span = tracer.spans[-2:]
+    assert compile_span.attributes == {"db.system": "sqlite"}
+    assert execute_span.attributes["db.system"] == "sqlite"
+    assert execute_span.attributes["db.statement"].startswith("SELECT users.id")
+    assert compile_span.parent is None
+    assert execute_span.parent is None
+    assert tracer.stack == []
+
+
+def test_instrument_engine_error(tracer: RecordingTracer, engine: sa.Engine) -> None:
+    with engine.connect() as connection:
+        with pytest.raises(sa.exc.OperationalError):
+            connection.execute(sa.text("SELECT * FROM missing"))
+        connection.execute(sa.text("SELECT 1"))
+
+    assert tracer.names == [
+        "pydantic_filters.compile",
+        "pydantic_filters.execute",
+        "pydantic_filters.compile",
+        "pydantic_filters.execute",
+    ]
+    assert isinstance(tracer.spans[1].error, sqlite3.OperationalError)
+    assert tracer.spans[3].error is None
+    assert tracer.stack == []
+
+
+def test_instrument_engine_disabled(engine: sa.Engine) -> None:
+    with engine.connect() as connection:
+        assert connection.execute(sa.text("SELECT 1")).scalar() == 1
+
+
+def _create_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/users")
+    def get_users(filter_: UserFilter = FilterDepends(UserFilter, query_string=True)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    @app.post("/users/search")
+    def search_users(filter_: UserFilter = FilterBodyDepends(UserFilter)) -> dict:
+        return filter_.model_dump(exclude_unset=True)
+
+    return TestClient(app)
+
+
+def test_fastapi_query_string(tracer: RecordingTracer) -> None:
+    response = _create_client().get("/users?id=1&id=2&q=a&department__id=1&department__id=2&department__id=3")
+    assert response.status_code == 200
+
+    assert tracer.names == ["pydantic_filters.validate", "pydantic_filters.inflate_filter"]
+    validate, inflate = tracer.spans
+    assert inflate.parent == "pydantic_filters.validate"
+    expected = {
+        "pydantic_filters.filter": "UserFilter",
+        "pydantic_filters.filter.active_fields": 3,
+        "pydantic_filters.filter.max_sequence_length": 3,
+        "pydantic_filters.filter.joins": 1,
+    }
+    assert validate.attributes == expected
+    assert inflate.attributes == expected
+
+
+def test_fastapi_validation_error(tracer: RecordingTracer) -> None:
+    response = _create_client().get("/users?id=a")
+    assert response.status_code == 422
+    assert tracer.names == ["pydantic_filters.validate"]
+    assert tracer.spans[0].error is not None
+
+
+def test_fastapi_body(tracer: RecordingTracer) -> None:
+    response = _create_client().post("/users/search", json={"login": "alice"})
+    assert response.status_code == 200
+    assert tracer.names == ["pydantic_filters.validate"]
+    assert tracer.spans[0].attributes["pydantic_filters.filter.active_fields"] == 1